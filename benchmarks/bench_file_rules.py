@@ -0,0 +1,55 @@
+"""
+Micro-benchmark da classificação de arquivos por nome.
+
+Compara o custo por arquivo do antigo str.endswith(tupla) com o FileRules
+compilado, sobre 1 milhão de nomes sintéticos.
+
+Uso:
+    python -m benchmarks.bench_file_rules [quantidade]
+"""
+import random
+import sys
+import time
+
+from src.config.settings import SUPPORTED_EXTENSIONS
+from src.core.file_rules import FileRules
+
+_SAMPLE_EXTENSIONS = ('.java', '.py', '.js', '.md', '.png', '.class', '.txt', '.yml', '.lock', '')
+
+
+def _synthetic_names(count, seed=42):
+    """Gera nomes de arquivo sintéticos com extensões variadas"""
+    generator = random.Random(seed)
+    return [
+        f"file_{generator.randrange(10 ** 6)}{generator.choice(_SAMPLE_EXTENSIONS)}"
+        for _ in range(count)
+    ]
+
+
+def _measure(label, classify, names):
+    """Executa a classificação e imprime o custo por nome"""
+    start = time.perf_counter()
+    accepted = sum(1 for name in names if classify(name))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed:7.3f} s  {elapsed / len(names) * 1e9:7.1f} ns/arquivo  ({accepted} aceitos)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    names = _synthetic_names(count)
+
+    print(f"Classificando {count} nomes ({len(SUPPORTED_EXTENSIONS)} extensões)")
+    rules = FileRules()
+    _measure("str.endswith(tupla)", lambda name: name.endswith(SUPPORTED_EXTENSIONS), names)
+    _measure("FileRules", rules.is_supported_file, names)
+
+    # O custo do endswith cresce com a tabela; a busca no conjunto não
+    extended = SUPPORTED_EXTENSIONS + tuple(f'.ext{i}' for i in range(100))
+    print(f"Classificando {count} nomes ({len(extended)} extensões)")
+    rules = FileRules(extensions=extended)
+    _measure("str.endswith(tupla)", lambda name: name.endswith(extended), names)
+    _measure("FileRules", rules.is_supported_file, names)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark dos modos com destaque de sintaxe.
+
+Mede, sobre o mesmo corpus sintético, o motor nativo de canvas
+(generate_highlighted_pdf), o caminho HTML + wkhtmltopdf
+(generate_indented_pdf, sem cache) e, como referência, o texto simples.
+A etapa 'html' mede só a montagem do HTML destacado, que o caminho do
+wkhtmltopdf paga antes mesmo de iniciar a conversão.
+
+Uso:
+    python -m benchmarks.bench_highlighted_pdf [arquivos] [linhas_por_arquivo]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_simple_pdf import create_corpus
+from src.pdf.generator import PDFGenerator
+
+
+def _write_html(files, directory, output_path):
+    """Monta o HTML do modo indentado sem convertê-lo"""
+    with open(output_path, 'w', encoding='utf-8') as stream:
+        PDFGenerator.write_indented_html(stream, files, directory, jobs=1)
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    lines_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = create_corpus(directory, file_count, lines_per_file)
+        print(f"Corpus: {file_count} arquivos, {file_count * lines_per_file} linhas")
+
+        generator = PDFGenerator()
+        modes = {
+            'destacado': lambda output: generator.generate_highlighted_pdf(files, directory, output, jobs=1),
+            'wkhtmltopdf': lambda output: generator.generate_indented_pdf(files, directory, output, cache=False),
+            'html': lambda output: _write_html(files, directory, output),
+            'simples': lambda output: generator.generate_simple_pdf(files, directory, output, jobs=1),
+        }
+
+        timings = {}
+        for name, generate in modes.items():
+            output_path = os.path.join(directory, f"saida_{name}.pdf")
+            start = time.perf_counter()
+            try:
+                generate(output_path)
+            except OSError as e:
+                print(f"{name:<12} indisponível ({str(e).splitlines()[0]})")
+                continue
+            timings[name] = time.perf_counter() - start
+            size = os.path.getsize(output_path) / (1024 * 1024)
+            print(f"{name:<12} {timings[name]:8.2f} s  {size:6.1f} MB")
+
+        if 'wkhtmltopdf' in timings:
+            print(f"Aceleração sobre o wkhtmltopdf: {timings['wkhtmltopdf'] / timings['destacado']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
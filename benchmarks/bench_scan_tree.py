@@ -0,0 +1,104 @@
+"""
+Varredura mais organização da árvore: o caminho antigo (lista de tuplas e
+reconstrução da hierarquia na janela, com os.path.relpath e os.path.isfile
+por arquivo) contra a FileTree montada na própria varredura.
+
+Cria uma árvore sintética de arquivos vazios em uma pasta temporária.
+
+Uso:
+    python -m benchmarks.bench_scan_tree [arquivos]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from src.core.file_manager import FileManager
+from src.core.file_rules import FileRules
+
+_FILES_PER_FOLDER = 250
+_FOLDERS_PER_LEVEL = 12
+
+
+def create_tree(directory, count):
+    """Cria count arquivos vazios distribuídos em pastas aninhadas"""
+    created = 0
+    folder_index = 0
+    while created < count:
+        parts = []
+        index = folder_index
+        while True:
+            parts.append(f"pkg{index % _FOLDERS_PER_LEVEL}")
+            index //= _FOLDERS_PER_LEVEL
+            if not index:
+                break
+        folder = os.path.join(directory, *parts)
+        os.makedirs(folder, exist_ok=True)
+        for file_index in range(min(_FILES_PER_FOLDER, count - created)):
+            extension = '.py' if file_index % 5 else '.png'
+            open(os.path.join(folder, f"mod{file_index}{extension}"), 'w').close()
+        created += _FILES_PER_FOLDER
+        folder_index += 1
+
+
+def organize_files_old(files_with_states, project_path):
+    """Cópia do antigo MainWindow._organize_files, para comparação"""
+    folder_contents = {}
+    rules = FileRules.default()
+
+    for file_path, is_selected in files_with_states:
+        rel_path = os.path.relpath(file_path, project_path)
+        parts = rel_path.split(os.sep)
+
+        current_path = ""
+        for part in parts[:-1]:
+            parent_path = current_path
+            current_path = os.path.join(current_path, part) if current_path else part
+            if current_path not in folder_contents:
+                folder_contents[current_path] = {
+                    'parent': parent_path,
+                    'files': [],
+                    'subfolders': set(),
+                    'ignored': rules.is_in_ignored_folder(current_path)
+                }
+            if parent_path in folder_contents:
+                folder_contents[parent_path]['subfolders'].add(current_path)
+
+        if os.path.isfile(file_path):
+            folder = os.path.dirname(rel_path)
+            if folder not in folder_contents:
+                folder_contents[folder] = {
+                    'parent': os.path.dirname(folder),
+                    'files': [],
+                    'subfolders': set(),
+                    'ignored': rules.is_in_ignored_folder(folder)
+                }
+            folder_contents[folder]['files'].append((file_path, parts[-1], is_selected))
+    return folder_contents
+
+
+def _best_of(label, action, repeat=3):
+    """Executa a ação algumas vezes e imprime o melhor tempo"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best:8.3f} s")
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    with tempfile.TemporaryDirectory() as directory:
+        create_tree(directory, count)
+        print(f"Árvore com {count} arquivos")
+
+        old = _best_of("lista + _organize_files (antigo)", lambda: organize_files_old(
+            FileManager.list_files_in_directory_with_ignored(directory), directory))
+        new = _best_of("FileManager.scan_tree", lambda: FileManager.scan_tree(directory))
+        print(f"Razão: {old / new:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
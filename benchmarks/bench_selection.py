@@ -0,0 +1,73 @@
+"""
+Micro-benchmark do FileSelectionManager.
+
+Monta uma árvore sintética (pastas de 1000 arquivos sob uma raiz) e mede o
+registro (com a memória ocupada pelo gerenciador), a alternância da raiz,
+alternâncias de arquivos isolados, um lote com update_many e a listagem
+dos arquivos selecionados.
+
+Uso:
+    python -m benchmarks.bench_selection [quantidade]
+"""
+import sys
+import time
+import tracemalloc
+
+from src.core.selection_manager import FileSelectionManager
+
+_FILES_PER_FOLDER = 1000
+
+
+def _build(count):
+    """Registra count arquivos em pastas de _FILES_PER_FOLDER sob 'root'"""
+    manager = FileSelectionManager()
+    files = []
+    for folder in range(max(count // _FILES_PER_FOLDER, 1)):
+        folder_path = f"root/d{folder}"
+        manager.register_item(folder_path, "root")
+        for index in range(_FILES_PER_FOLDER):
+            path = f"{folder_path}/f{index}.py"
+            manager.register_item(path, folder_path, is_selected=True)
+            files.append(path)
+    manager.recompute_folder_states()
+    return manager, files
+
+
+def _measure(label, action, repeat=1):
+    """Executa a ação e imprime o tempo total e por repetição"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:9.2f} ms  ({elapsed / repeat * 1e6:8.1f} µs cada)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    start = time.perf_counter()
+    manager, files = _build(count)
+    print(f"Registro de {len(files)} arquivos: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # Segunda árvore idêntica, medida do zero (os caminhos entram na conta)
+    tracemalloc.start()
+    measured, _ = _build(count)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del measured
+    print(f"Memória do gerenciador: {memory / 2 ** 20:.1f} MB ({memory / len(files):.0f} bytes/arquivo, "
+          f"incluindo os caminhos)")
+
+    _measure("alternar a raiz", lambda: manager.update_selection("root", False))
+    _measure("alternar a raiz de volta", lambda: manager.update_selection("root", True))
+
+    sample = files[::max(len(files) // 1000, 1)]
+    iterator = iter(sample)
+    _measure("alternar um arquivo", lambda: manager.update_selection(next(iterator), False), repeat=len(sample))
+    _measure(f"update_many ({len(files)} arquivos)", lambda: manager.update_many((path, True) for path in files))
+    _measure("selected_items", lambda: manager.selected_items(files))
+    _measure("selected_files", manager.selected_files)
+
+
+if __name__ == '__main__':
+    main()
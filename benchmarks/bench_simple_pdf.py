@@ -0,0 +1,70 @@
+"""
+Benchmark dos motores do PDF de texto simples.
+
+Gera um corpus sintético de código-fonte e mede o tempo de
+generate_simple_pdf com o motor 'canvas' e com o motor 'platypus'.
+
+Uso:
+    python -m benchmarks.bench_simple_pdf [arquivos] [linhas_por_arquivo]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from src.pdf.generator import PDFGenerator
+
+_SAMPLE_LINES = (
+    "public class Exemplo {",
+    "    private final Map<String, List<Integer>> valores = new HashMap<>();",
+    "    // Comentário com <tags> & caracteres especiais",
+    "",
+    "    public int calcular(int a, int b) { return a * b + valores.size(); }",
+    "}",
+)
+
+
+def create_corpus(directory, file_count, lines_per_file):
+    """
+    Cria arquivos sintéticos de código-fonte.
+
+    Args:
+        directory: Pasta onde os arquivos serão criados
+        file_count: Quantidade de arquivos
+        lines_per_file: Linhas por arquivo
+
+    Returns:
+        list: Caminhos dos arquivos criados
+    """
+    files = []
+    body = "\n".join(_SAMPLE_LINES[i % len(_SAMPLE_LINES)] for i in range(lines_per_file)) + "\n"
+    for i in range(file_count):
+        file = os.path.join(directory, f"Exemplo{i}.java")
+        with open(file, 'w', encoding='utf-8') as f:
+            f.write(body)
+        files.append(file)
+    return files
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    lines_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = create_corpus(directory, file_count, lines_per_file)
+        print(f"Corpus: {file_count} arquivos, {file_count * lines_per_file} linhas")
+
+        timings = {}
+        for engine in ('canvas', 'platypus'):
+            output_path = os.path.join(directory, f"saida_{engine}.pdf")
+            start = time.perf_counter()
+            PDFGenerator().generate_simple_pdf(files, directory, output_path, engine=engine)
+            timings[engine] = time.perf_counter() - start
+            size = os.path.getsize(output_path) / (1024 * 1024)
+            print(f"{engine:<10} {timings[engine]:8.2f} s  {size:6.1f} MB")
+
+        print(f"Aceleração: {timings['platypus'] / timings['canvas']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
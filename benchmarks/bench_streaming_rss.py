@@ -0,0 +1,61 @@
+"""
+Pico de memória (RSS) do motor 'platypus' com e sem o modo streaming.
+
+Cada modo roda em um processo separado para que o pico medido seja só dele.
+Requer o módulo resource (Linux/macOS). O modo 'lista' guarda o documento
+inteiro em memória (cerca de 75 MB de RSS por MB de código); em máquinas com
+pouca memória, rode só o streaming nos corpora grandes.
+
+Uso:
+    python -m benchmarks.bench_streaming_rss [megabytes] [lista,streaming]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_simple_pdf import create_corpus
+
+_LINES_PER_FILE = 2000
+
+
+def _peak_rss_mb():
+    """Pico de RSS do processo atual em MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _child(streaming, directory):
+    """Gera o PDF em um único modo e imprime tempo e pico de memória"""
+    from src.pdf.generator import PDFGenerator
+
+    files = sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.java'))
+    output_path = os.path.join(directory, f"saida_{streaming}.pdf")
+    start = time.perf_counter()
+    PDFGenerator().generate_simple_pdf(files, directory, output_path, engine='platypus',
+                                       streaming=streaming == 'streaming')
+    print(f"{streaming:<10} {time.perf_counter() - start:8.1f} s  pico RSS {_peak_rss_mb():8.1f} MB")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        _child(sys.argv[2], sys.argv[3])
+        return
+
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    modes = sys.argv[2].split(',') if len(sys.argv) > 2 else ['lista', 'streaming']
+    with tempfile.TemporaryDirectory() as directory:
+        file_size = os.path.getsize(create_corpus(directory, 1, _LINES_PER_FILE)[0])
+        file_count = max(1, int(megabytes * 1024 * 1024 / file_size))
+        create_corpus(directory, file_count, _LINES_PER_FILE)
+        print(f"Corpus: {file_count} arquivos, {file_count * file_size / (1024 * 1024):.1f} MB")
+
+        for mode in modes:
+            subprocess.run([sys.executable, '-m', 'benchmarks.bench_streaming_rss', '--child', mode, directory],
+                           check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+Ponto de entrada de linha de comando, sem interface gráfica.
+
+Uso:
+    python -m src.cli PASTA -o saida.pdf [--modo simples|indentado|destacado]
+                      [--incluir GLOB] [--excluir GLOB] [--jobs N] [--json]
+
+Não importa tkinter nem ttkbootstrap, e só carrega os motores de PDF depois
+da varredura, para que a inicialização continue rápida em servidores de CI.
+"""
+import argparse
+import dataclasses
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import List, Optional, Sequence
+
+from src.config.settings import INCLUDE_PATTERNS, EXCLUDE_PATTERNS
+from src.core.file_manager import FileManager
+from src.core.file_rules import FileRules
+from src.core.file_tree import file_sizes
+from src.core.progress import STAGE_DONE, ProgressSnapshot, ProgressTracker
+
+MODES = ('simples', 'indentado', 'destacado')
+
+
+class ProgressReporter:
+    """
+    Emite os eventos da geração: linhas JSON (uma por evento) para consumo
+    por outros programas, ou mensagens curtas legíveis em stderr.
+    """
+
+    def __init__(self, as_json: bool = False, stream=None):
+        """
+        Inicializa o emissor.
+
+        Args:
+            as_json: Emite uma linha JSON por evento em vez de texto
+            stream: Saída dos eventos (padrão: stdout para JSON, stderr para texto)
+        """
+        self.as_json = as_json
+        self.stream = stream or (sys.stdout if as_json else sys.stderr)
+        self.started = time.perf_counter()
+
+    def emit(self, event: str, **fields) -> None:
+        """
+        Emite um evento.
+
+        Args:
+            event: Nome do evento (scan, progress, done, error)
+            fields: Dados do evento
+        """
+        if self.as_json:
+            record = {'event': event, 'elapsed': round(time.perf_counter() - self.started, 3), **fields}
+            self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        elif event == 'progress':
+            running = fields['eta'] is not None and fields['files_done'] < fields['files_total']
+            eta = f", restam ~{fields['eta']:.0f}s" if running else ''
+            self.stream.write(f"\r{fields['percent']:5.1f}% {fields['stage']} {fields['files_done']}/"
+                              f"{fields['files_total']} arquivos, {fields['mb_per_second']:.1f} MB/s{eta}   ")
+            if fields['stage'] == STAGE_DONE:
+                self.stream.write('\n')
+        else:
+            self.stream.write(f"{event}: {', '.join(f'{k}={v}' for k, v in fields.items())}\n")
+        self.stream.flush()
+
+    def progress(self, snapshot: ProgressSnapshot) -> None:
+        """Ouvinte do ProgressTracker: emite o estado como evento 'progress'"""
+        fields = dataclasses.asdict(snapshot)
+        for name in ('elapsed', 'lines_per_second', 'mb_per_second', 'eta'):
+            if fields[name] is not None:
+                fields[name] = round(fields[name], 3)
+        self.emit('progress', percent=round(snapshot.fraction * 100, 1), **fields)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o analisador de argumentos"""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description='Converte os arquivos de código de uma pasta em um PDF, sem interface gráfica.'
+    )
+    parser.add_argument('pasta', help='Pasta raiz do projeto')
+    parser.add_argument('-o', '--saida', required=True, help='Caminho do PDF gerado')
+    parser.add_argument('-m', '--modo', choices=MODES, default='simples', help='Formato do PDF (padrão: simples)')
+    parser.add_argument('--incluir', action='append', default=[], metavar='GLOB',
+                        help='Nomes de arquivo aceitos além das extensões suportadas (repetível)')
+    parser.add_argument('--excluir', action='append', default=[], metavar='GLOB',
+                        help='Nomes de arquivos ou pastas ignorados (repetível)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Número de processos de renderização')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reaproveita as páginas em cache dos arquivos inalterados')
+    parser.add_argument('--sem-indice', action='store_true', help='Não usa o índice persistente da varredura')
+    parser.add_argument('--json', action='store_true', help='Emite progresso e métricas como linhas JSON em stdout')
+    return parser
+
+
+def select_files(folder: str, rules: FileRules, use_index: bool = True):
+    """
+    Seleciona os arquivos como a janela principal faz por padrão: os aceitos
+    pelas regras e pelo filtro de conteúdo.
+
+    Args:
+        folder: Pasta raiz do projeto
+        rules: Regras de filtragem
+        use_index: Reaproveita o índice persistente da varredura
+
+    Returns:
+        tuple: (SizedFileList dos arquivos selecionados, dicionário path -> motivo do descarte)
+    """
+    tree = FileManager.scan_tree(folder, use_index=use_index, rules=rules)
+    skip_reasons = FileManager.filter_tree(tree)
+    return tree.selected_files(), skip_reasons
+
+
+def generate(mode: str, files: List[str], folder: str, output: str, reporter: ProgressReporter,
+             jobs: Optional[int] = None, incremental: bool = False) -> list:
+    """
+    Gera o PDF no modo pedido.
+
+    Args:
+        mode: Um de MODES
+        files: Arquivos selecionados
+        folder: Pasta raiz do projeto
+        output: Caminho do PDF gerado
+        reporter: Emissor dos eventos de progresso
+        jobs: Número de processos de renderização
+        incremental: Reaproveita as páginas em cache dos arquivos inalterados
+
+    Returns:
+        list: Partes que falharam no modo indentado (vazia nos demais)
+    """
+    from src.pdf.generator import PDFGenerator  # Carregado só quando há algo a gerar
+
+    generator = PDFGenerator()
+    tracker = ProgressTracker(files, reporter.progress)
+    failures = []
+    if mode == 'simples':
+        generator.generate_simple_pdf(files, folder, output, tracker, jobs=jobs, incremental=incremental)
+    elif mode == 'destacado':
+        generator.generate_highlighted_pdf(files, folder, output, tracker, jobs=jobs, incremental=incremental)
+    else:
+        failures = generator.generate_indented_pdf(files, folder, output, tracker, jobs=jobs,
+                                                   incremental=incremental) or []
+    tracker.finish()
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Executa a conversão.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        int: Código de saída (0 sucesso, 1 erro)
+    """
+    args = build_parser().parse_args(argv)
+    reporter = ProgressReporter(args.json)
+    folder = os.path.abspath(args.pasta)
+    if not os.path.isdir(folder):
+        reporter.emit('error', message=f"Pasta não encontrada: {folder}")
+        return 1
+
+    rules = FileRules(include_patterns=tuple(INCLUDE_PATTERNS) + tuple(args.incluir),
+                      exclude_patterns=tuple(EXCLUDE_PATTERNS) + tuple(args.excluir))
+    files, skip_reasons = select_files(folder, rules, use_index=not args.sem_indice)
+    reporter.emit('scan', files=len(files), skipped=len(skip_reasons),
+                  bytes=sum(file_sizes(files)))
+    if not files:
+        reporter.emit('error', message="Nenhum arquivo encontrado na pasta selecionada.")
+        return 1
+
+    try:
+        failures = generate(args.modo, files, folder, args.saida, reporter, args.jobs, args.incremental)
+    except OSError as e:
+        reporter.emit('error', message=str(e))
+        return 1
+
+    reporter.emit('done', output=os.path.abspath(args.saida), files=len(files),
+                  failed_files=sum(len(failed) for failed, _ in failures),
+                  seconds=round(time.perf_counter() - reporter.started, 3))
+    return 0
+
+
+if __name__ == '__main__':
+    # Necessário para o pool de processos da geração de PDF em executáveis congelados
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,10 +1,60 @@
 # config/settings.py
 
+import os
+
 from reportlab.lib.pagesizes import letter
 
 SUPPORTED_EXTENSIONS = ('.java', '.py', '.js', '.html', '.css',
-                        '.xml', 'fxml', '.json', '.txt', 'yaml', 'yml', 'sh', '.bat', '.cmd')
+                        '.xml', '.fxml', '.json', '.txt', '.yaml', '.yml', '.sh', '.bat', '.cmd')
 PAGE_SIZE = letter
 DEFAULT_FONT_SIZE = 8
+SIMPLE_PDF_ENGINE = 'canvas'  # 'canvas' (diagramação direta) ou 'platypus' (Paragraph por linha)
+SIMPLE_PDF_STREAMING_THRESHOLD = 8 * 1024 * 1024  # Acima disso o motor 'platypus' diagrama sob demanda
+PDF_JOBS = os.cpu_count() or 1  # Processos usados na renderização paralela
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024  # Abaixo disso o custo de iniciar o pool não compensa
+SHARDS_PER_JOB = 4  # Partes por processo, para equilibrar a carga entre eles
+HIGHLIGHT_STYLE = 'colorful'
+HIGHLIGHT_CSS_CLASS = 'custom-code-style'
+# Lexer do Pygments (alias) de cada extensão suportada, sem adivinhação pelo conteúdo
+EXTENSION_LEXERS = {
+    'java': 'java', 'py': 'python', 'js': 'javascript', 'html': 'html', 'css': 'css',
+    'xml': 'xml', 'fxml': 'xml', 'json': 'json', 'txt': 'text', 'yaml': 'yaml', 'yml': 'yaml',
+    'sh': 'bash', 'bat': 'batch', 'cmd': 'batch',
+}
+LEXER_GUESS_BYTES = 4096  # Prefixo analisado quando o lexer precisa ser adivinhado
+INDENTED_CHUNK_BYTES = 8 * 1024 * 1024  # HTML por processo wkhtmltopdf; as partes são unidas depois
+WKHTMLTOPDF_JOBS = PDF_JOBS  # Processos wkhtmltopdf simultâneos
+WKHTMLTOPDF_RETRIES = 1  # Tentativas extras por parte antes de recorrer ao texto simples
+HIGHLIGHT_CHUNK_BYTES = 256 * 1024  # Tamanho alvo de cada unidade de trabalho enviada ao pool
+HIGHLIGHT_SPLIT_BYTES = 1024 * 1024  # Arquivos maiores são divididos em segmentos deste tamanho
+PROGRESS_MIN_INTERVAL = 0.1  # Intervalo mínimo, em segundos, entre duas atualizações de progresso
+PROGRESS_POLL_MS = 50  # Intervalo com que a janela consulta o progresso da geração em segundo plano
+TREE_INSERT_BATCH = 2000  # Linhas inseridas por vez ao expandir uma pasta na árvore de seleção
+PREWARM_PDF_ENGINES = True  # Carrega reportlab, pygments e pdfkit em segundo plano após abrir a janela
 IGNORED_FOLDERS = ('properties', 'target', 'META-INF', '.venv', '.config', '.pytest_cache',
                    '__pycache__', '.mvn', '.git', '.idea', '.vscode', 'node_modules')
+INCLUDE_PATTERNS = ()  # Globs de nomes de arquivo aceitos além das extensões (ex.: 'Dockerfile')
+EXCLUDE_PATTERNS = ()  # Globs de nomes de arquivos/pastas sempre ignorados (ex.: '*.min.js')
+
+# Varredura de diretórios
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+SCAN_DETERMINISTIC = True  # Ordem estável para que PDFs gerados sejam idênticos entre execuções
+IGNORE_FILE_NAMES = ('.gitignore', '.ignore')  # Regras respeitadas na varredura (.ignore tem prioridade)
+
+# Cache em disco (índices de varredura, destaques, fragmentos)
+CACHE_DIR = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache'),
+                         'SourceCodeToPDF')
+SCAN_INDEX_DIR = os.path.join(CACHE_DIR, 'scan_index')
+SCAN_INDEX_MAX_BYTES = 256 * 1024 * 1024  # Limite total dos índices; os menos usados são removidos
+HIGHLIGHT_CACHE_ENABLED = True
+HIGHLIGHT_CACHE_DIR = os.path.join(CACHE_DIR, 'highlight')
+HIGHLIGHT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Limite do cache de trechos destacados (LRU)
+FRAGMENT_CACHE_DIR = os.path.join(CACHE_DIR, 'fragments')
+FRAGMENT_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # Limite do cache de páginas por arquivo (geração incremental)
+
+# Pré-filtro de conteúdo (arquivos binários, enormes ou minificados)
+SNIFF_BYTES = 8192  # Bytes lidos do início de cada arquivo para a análise
+MAX_FILE_BYTES = 5 * 1024 * 1024
+MAX_LINE_LENGTH = 5000
+MAX_NON_TEXT_RATIO = 0.30  # Fração de bytes de controle a partir da qual o arquivo é binário
+MINIFIED_AVG_LINE_LENGTH = 300  # Comprimento médio de linha típico de arquivos minificados
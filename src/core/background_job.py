@@ -0,0 +1,123 @@
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tipos de evento publicados na fila
+PROGRESS = 'progress'
+DONE = 'done'
+ERROR = 'error'
+CANCELLED = 'cancelled'
+
+
+class JobCancelled(Exception):
+    """Levantada pelo callback de progresso quando o cancelamento foi pedido"""
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """Evento publicado pela tarefa: progresso, resultado, erro ou cancelamento"""
+    kind: str
+    data: Any = None
+
+
+class BackgroundJob:
+    """
+    Executa uma tarefa longa em uma thread de trabalho.
+
+    A tarefa recebe um callback de progresso, no formato dos geradores de PDF
+    (atual, total) ou com um ProgressSnapshot; cada chamada vira um evento em
+    uma fila thread-safe que a interface consome periodicamente (ex.: com
+    after() do Tk), sem tocar nos widgets fora da thread principal. O mesmo
+    callback, e check_cancelled, verificam o pedido de cancelamento e levantam
+    JobCancelled, o que interrompe a geração no arquivo seguinte. Erros nunca
+    escapam da thread: viram um evento ERROR.
+    """
+
+    def __init__(self, target: Callable[[Callable[[int, int], None]], Any], name: str = 'background-job'):
+        """
+        Inicializa a tarefa (sem iniciá-la).
+
+        Args:
+            target: Função que recebe o callback de progresso e retorna o resultado
+            name: Nome da thread, útil em logs
+        """
+        self._target = target
+        self._events: 'queue.Queue[JobEvent]' = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> 'BackgroundJob':
+        """Inicia a thread de trabalho e retorna a própria tarefa"""
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Pede o cancelamento; a tarefa para na próxima chamada de progresso"""
+        self._cancel.set()
+
+    @property
+    def cancel_requested(self) -> bool:
+        """True se o cancelamento foi pedido"""
+        return self._cancel.is_set()
+
+    def is_running(self) -> bool:
+        """True enquanto a thread de trabalho não terminou"""
+        return self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o fim da tarefa.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None: sem limite)
+
+        Returns:
+            bool: True se a tarefa terminou
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def poll(self) -> List[JobEvent]:
+        """
+        Retorna os eventos publicados desde a última consulta, sem bloquear.
+
+        Returns:
+            list: Eventos na ordem em que foram publicados
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def check_cancelled(self) -> None:
+        """
+        Levanta JobCancelled se o cancelamento foi pedido (para uso na thread de trabalho).
+
+        Raises:
+            JobCancelled: Se cancel() foi chamado
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def _progress(self, *data) -> None:
+        """Callback entregue à tarefa; os argumentos viram os dados do evento"""
+        self.check_cancelled()
+        self._events.put(JobEvent(PROGRESS, data))
+
+    def _run(self) -> None:
+        """Corpo da thread de trabalho"""
+        try:
+            result = self._target(self._progress)
+        except JobCancelled:
+            self._events.put(JobEvent(CANCELLED))
+        except Exception as e:
+            logger.exception("Falha na tarefa %s", self._thread.name)
+            self._events.put(JobEvent(ERROR, e))
+        else:
+            self._events.put(JobEvent(DONE, result))
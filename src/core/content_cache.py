@@ -0,0 +1,212 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from typing import Iterable, Optional, Union
+
+_TEMP_PREFIX = '.tmp-'
+_STALE_TEMP_SECONDS = 3600  # Temporários mais antigos que isso são restos de processos interrompidos
+
+
+def content_key(*parts: Union[str, bytes]) -> str:
+    """
+    Calcula a chave de cache a partir do conteúdo e das opções que o afetam.
+
+    Args:
+        parts: Partes que identificam o resultado (conteúdo, lexer, estilo, ...)
+
+    Returns:
+        str: Resumo SHA-256 em hexadecimal
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8', 'surrogatepass')
+        digest.update(len(part).to_bytes(8, 'little'))  # Evita ambiguidade entre partes
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class ContentCache:
+    """
+    Cache em disco endereçado por conteúdo.
+
+    Cada entrada é um arquivo cujo nome é a chave, gravado de forma atômica
+    (arquivo temporário + os.replace), para que vários processos possam
+    compartilhar a mesma pasta sem travas: um leitor vê a entrada completa
+    ou não a vê. A data de modificação marca o último uso, o que permite
+    remover as entradas menos usadas quando o limite de tamanho é excedido.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Inicializa o cache.
+
+        Args:
+            directory: Pasta das entradas (criada sob demanda)
+            max_bytes: Tamanho máximo somado das entradas
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        """Caminho da entrada, distribuído em subpastas pelo prefixo da chave"""
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Lê uma entrada e marca seu uso.
+
+        Args:
+            key: Chave calculada por content_key
+
+        Returns:
+            str com o valor armazenado, ou None se a entrada não existe
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Removida por outro processo logo após a leitura
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Grava uma entrada de forma atômica. Falhas de escrita são ignoradas,
+        pois o cache é apenas uma otimização.
+
+        Args:
+            key: Chave calculada por content_key
+            value: Valor a armazenar
+        """
+        folder = os.path.dirname(self._path(key))
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=folder, prefix=_TEMP_PREFIX)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(value)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def get_file(self, key: str) -> Optional[str]:
+        """
+        Retorna o caminho de uma entrada binária (ex.: um PDF) e marca seu uso.
+
+        Args:
+            key: Chave calculada por content_key
+
+        Returns:
+            str com o caminho da entrada, ou None se ela não existe
+        """
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put_file(self, key: str, source_path: str) -> None:
+        """
+        Copia um arquivo para o cache de forma atômica. Falhas são ignoradas.
+
+        Args:
+            key: Chave calculada por content_key
+            source_path: Arquivo a armazenar
+        """
+        folder = os.path.dirname(self._path(key))
+        try:
+            os.makedirs(folder, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=folder, prefix=_TEMP_PREFIX)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f, open(source_path, 'rb') as source:
+                shutil.copyfileobj(source, f)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def record(self, hit: bool) -> None:
+        """
+        Contabiliza uma consulta. Separado de get() porque as consultas podem
+        ocorrer em processos trabalhadores, que só devolvem o resultado.
+
+        Args:
+            hit: True se a entrada foi encontrada
+        """
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def _entries(self) -> Iterable[os.DirEntry]:
+        """Percorre os arquivos de todas as subpastas"""
+        try:
+            folders = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+        for folder in folders:
+            if not folder.is_dir(follow_symlinks=False):
+                continue
+            try:
+                yield from os.scandir(folder.path)
+            except OSError:
+                continue
+
+    def evict(self, max_bytes: Optional[int] = None) -> None:
+        """
+        Remove as entradas usadas há mais tempo até o total caber no limite.
+
+        Args:
+            max_bytes: Limite a aplicar (padrão: o do cache)
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        now = time.time()
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if entry.name.startswith(_TEMP_PREFIX):
+                if now - stat.st_mtime > _STALE_TEMP_SECONDS:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                total -= size  # Outro processo já removeu
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove todas as entradas"""
+        self.evict(max_bytes=0)
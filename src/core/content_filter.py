@@ -0,0 +1,154 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings import (SNIFF_BYTES, MAX_FILE_BYTES, MAX_LINE_LENGTH, MAX_NON_TEXT_RATIO,
+                                 MINIFIED_AVG_LINE_LENGTH, SCAN_MAX_WORKERS)
+
+# Bytes considerados texto: imprimíveis, bytes altos (UTF-8/Latin-1) e controles comuns
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
+
+class ContentFilter:
+    """
+    Pré-filtro aplicado entre a varredura e a geração do PDF.
+    Lê apenas o início de cada arquivo para descartar binários, arquivos
+    grandes demais e arquivos minificados antes que sejam renderizados.
+    """
+
+    def __init__(
+            self,
+            max_file_bytes: int = MAX_FILE_BYTES,
+            max_line_length: int = MAX_LINE_LENGTH,
+            max_non_text_ratio: float = MAX_NON_TEXT_RATIO,
+            minified_avg_line_length: int = MINIFIED_AVG_LINE_LENGTH,
+            sniff_bytes: int = SNIFF_BYTES
+    ):
+        """
+        Inicializa o filtro.
+
+        Args:
+            max_file_bytes: Tamanho máximo aceito
+            max_line_length: Comprimento máximo de linha na amostra lida
+            max_non_text_ratio: Fração de bytes não textuais que caracteriza binário
+            minified_avg_line_length: Comprimento médio de linha que caracteriza minificação
+            sniff_bytes: Quantidade de bytes lidos do início do arquivo
+        """
+        self.max_file_bytes = max_file_bytes
+        self.max_line_length = max_line_length
+        self.max_non_text_ratio = max_non_text_ratio
+        self.minified_avg_line_length = minified_avg_line_length
+        self.sniff_bytes = sniff_bytes
+
+    def check(self, path: str, size: Optional[int] = None) -> Optional[str]:
+        """
+        Verifica se um arquivo deve ser renderizado.
+
+        Args:
+            path: Caminho do arquivo
+            size: Tamanho já conhecido (evita um stat extra)
+
+        Returns:
+            str com o motivo do descarte, ou None se o arquivo é aceito
+        """
+        return self.inspect(path, size)[1]
+
+    def inspect(self, path: str, size: Optional[int] = None) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Verifica um arquivo e informa também o tamanho lido no caminho.
+
+        Args:
+            path: Caminho do arquivo
+            size: Tamanho já conhecido (evita um stat extra)
+
+        Returns:
+            tuple: (tamanho em bytes ou None se ilegível, motivo do descarte ou None)
+        """
+        try:
+            if size is None:
+                size = os.stat(path).st_size
+            if size > self.max_file_bytes:
+                return size, f"muito grande ({size / (1024 * 1024):.1f} MB)"
+
+            with open(path, 'rb') as f:
+                sample = f.read(self.sniff_bytes)
+        except OSError as e:
+            return size, f"não pôde ser lido ({e.strerror or e})"
+
+        if not sample:
+            return size, None
+        if b'\0' in sample:
+            return size, "binário"
+        if len(sample.translate(None, _TEXT_BYTES)) / len(sample) > self.max_non_text_ratio:
+            return size, "binário"
+
+        lines = sample.split(b'\n')
+        # A última linha da amostra pode estar truncada, mas continua valendo
+        # como limite inferior do comprimento real
+        if max(len(line) for line in lines) > self.max_line_length:
+            return size, f"linha com mais de {self.max_line_length} caracteres"
+        if len(sample) == self.sniff_bytes and len(sample) / len(lines) > self.minified_avg_line_length:
+            return size, "minificado"
+        return size, None
+
+    def filter_records(
+            self,
+            records: List[Tuple[str, bool]],
+            max_workers: int = SCAN_MAX_WORKERS
+    ) -> Tuple[List[Tuple[str, bool]], Dict[str, str]]:
+        """
+        Aplica o filtro aos arquivos selecionados por padrão.
+
+        Os arquivos descartados continuam na lista, mas desmarcados, para
+        que o usuário veja o motivo e possa incluí-los manualmente.
+
+        Args:
+            records: Lista de tuplas (path, selecionado_por_padrão)
+            max_workers: Número de threads de leitura
+
+        Returns:
+            tuple: (registros atualizados, dicionário path -> motivo do descarte)
+        """
+        candidates = [path for path, selected in records if selected]
+        if not candidates:
+            return list(records), {}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            reasons = {
+                path: reason
+                for path, reason in zip(candidates, executor.map(self.check, candidates))
+                if reason is not None
+            }
+
+        filtered = [
+            (path, False) if selected and path in reasons else (path, selected)
+            for path, selected in records
+        ]
+        return filtered, reasons
+
+    def filter_files(self, nodes, max_workers: int = SCAN_MAX_WORKERS) -> Dict[str, str]:
+        """
+        Aplica o filtro aos nós de arquivo selecionados de uma FileTree,
+        desmarcando os descartados e guardando o tamanho lido de cada um.
+
+        Args:
+            nodes: FileNode da árvore (os não selecionados são ignorados)
+            max_workers: Número de threads de leitura
+
+        Returns:
+            dict: path -> motivo do descarte
+        """
+        candidates = [node for node in nodes if node.selected]
+        if not candidates:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(lambda node: self.inspect(node.path, node.size), candidates))
+
+        reasons = {}
+        for node, (size, reason) in zip(candidates, results):
+            node.size = size
+            if reason is not None:
+                node.selected = False
+                reasons[node.path] = reason
+        return reasons
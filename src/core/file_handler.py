@@ -1,5 +1,7 @@
 import os
-from src.config.settings import SUPPORTED_EXTENSIONS, IGNORED_FOLDERS
+from src.config.settings import SCAN_DETERMINISTIC
+from src.core.file_rules import FileRules
+from src.core.scanner import DirectoryScanner
 
 
 class FileHandler:
@@ -11,44 +13,70 @@ class FileHandler:
     @staticmethod
     def is_supported_file(filename):
         """Verifica se o arquivo é suportado baseado na extensão"""
-        return filename.endswith(SUPPORTED_EXTENSIONS)
+        return FileRules.default().is_supported_file(filename)
 
     @staticmethod
     def is_ignored_folder(folder_name):
         """Verifica se a pasta deve ser ignorada"""
-        return folder_name in IGNORED_FOLDERS
+        return FileRules.default().is_ignored_folder(folder_name)
 
     @staticmethod
-    def process_directory(directory):
+    def create_scanner(deterministic=SCAN_DETERMINISTIC, max_workers=None, index=None, rules=None):
+        """
+        Cria o scanner de diretórios com as regras de filtragem do FileHandler.
+
+        Args:
+            deterministic: Mantém a ordem da saída estável entre execuções
+            max_workers: Número de threads de listagem (padrão das configurações)
+            index: ScanIndex opcional para reaproveitar pastas não modificadas
+            rules: FileRules a aplicar (padrão: regras das configurações)
+
+        Returns:
+            DirectoryScanner configurado
+        """
+        rules = rules or FileRules.default()
+        return DirectoryScanner(
+            is_supported_file=rules.is_supported_file,
+            is_ignored_folder=rules.is_ignored_folder,
+            max_workers=max_workers,
+            deterministic=deterministic,
+            index=index
+        )
+
+    @staticmethod
+    def process_directory(directory, deterministic=SCAN_DETERMINISTIC, max_workers=None, rules=None):
         """
         Processa um diretório separando arquivos e pastas ignorados.
 
         Args:
             directory: Caminho do diretório a ser processado
+            deterministic: Mantém a ordem da saída estável entre execuções
+            max_workers: Número de threads de listagem (padrão das configurações)
+            rules: FileRules a aplicar (padrão: regras das configurações)
 
         Returns:
             tuple: (arquivos regulares, arquivos ignorados)
         """
-        regular_files = []
-        ignored_items = []
-
-        for root, dirs, files in os.walk(directory):
-            # Processar pastas ignoradas
-            for d in dirs[:]:  # Copia da lista para permitir modificação
-                if FileHandler.is_ignored_folder(d):
-                    full_path = os.path.join(root, d)
-                    ignored_items.append((full_path, False))
-                    dirs.remove(d)
-
-            # Processar arquivos
-            for file in files:
-                full_path = os.path.join(root, file)
-                if FileHandler.is_supported_file(file):
-                    regular_files.append((full_path, True))
-                else:
-                    ignored_items.append((full_path, False))
-
-        return regular_files, ignored_items
+        scanner = FileHandler.create_scanner(deterministic, max_workers, rules=rules)
+        return scanner.scan(directory)
+
+    @staticmethod
+    def iter_directory(directory, deterministic=SCAN_DETERMINISTIC, max_workers=None, index=None, rules=None):
+        """
+        Processa um diretório entregando a listagem de cada pasta assim que pronta.
+
+        Args:
+            directory: Caminho do diretório a ser processado
+            deterministic: Mantém a ordem da saída estável entre execuções
+            max_workers: Número de threads de listagem (padrão das configurações)
+            index: ScanIndex opcional para reaproveitar pastas não modificadas
+            rules: FileRules a aplicar (padrão: regras das configurações)
+
+        Yields:
+            DirectoryListing de cada pasta visitada
+        """
+        scanner = FileHandler.create_scanner(deterministic, max_workers, index, rules)
+        yield from scanner.iter_listings(directory)
 
     @staticmethod
     def get_relative_path(file_path, base_path):
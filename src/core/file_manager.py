@@ -1,4 +1,7 @@
+from src.core.content_filter import ContentFilter
 from src.core.file_handler import FileHandler
+from src.core.file_tree import FileTree
+from src.core.scan_index import ScanIndex
 
 
 class FileManager:
@@ -8,26 +11,139 @@ class FileManager:
     """
 
     @staticmethod
-    def list_files_in_directory_with_ignored(directory):
+    def _iter_listings(directory, use_index=False, rebuild_index=False, rules=None):
+        """
+        Produz a listagem de cada pasta, usando o índice persistente se pedido.
+
+        Args:
+            directory: Diretório base a ser processado
+            use_index: Reaproveita o índice persistente do projeto (só relista
+                pastas cujo mtime mudou)
+            rebuild_index: Descarta o índice existente antes da varredura
+            rules: FileRules com filtros próprios (padrão: regras das configurações)
+
+        Yields:
+            DirectoryListing de cada pasta visitada
+        """
+        index = ScanIndex(directory) if use_index else None
+        if index is not None and rebuild_index:
+            index.invalidate()
+
+        yield from FileHandler.iter_directory(directory, index=index, rules=rules)
+
+        # Só grava o índice após uma varredura completa
+        if index is not None:
+            index.save()
+
+    @staticmethod
+    def iter_directory_batches(directory, use_index=False, rebuild_index=False, rules=None):
+        """
+        Produz os arquivos do diretório em lotes, um lote por pasta visitada.
+
+        Os lotes são entregues enquanto a varredura ainda está em andamento,
+        permitindo que as etapas seguintes comecem pelos primeiros arquivos.
+
+        Args:
+            directory: Diretório base a ser processado
+            use_index: Reaproveita o índice persistente do projeto
+            rebuild_index: Descarta o índice existente antes da varredura
+            rules: FileRules com filtros próprios (padrão: regras das configurações)
+
+        Yields:
+            tuple: (pasta, lista de tuplas (path, selecionado_por_padrão))
+        """
+        for listing in FileManager._iter_listings(directory, use_index, rebuild_index, rules):
+            records = listing.ignored + listing.files
+            if records:
+                yield listing.path, records
+
+    @staticmethod
+    def iter_files_in_directory_with_ignored(directory, use_index=False, rebuild_index=False, rules=None):
+        """
+        Produz todos os arquivos e pastas do diretório, incluindo ignorados,
+        à medida que são encontrados.
+
+        Args:
+            directory: Diretório base a ser processado
+            use_index: Reaproveita o índice persistente do projeto
+            rebuild_index: Descarta o índice existente antes da varredura
+            rules: FileRules com filtros próprios (padrão: regras das configurações)
+
+        Yields:
+            tuple: (path, selecionado_por_padrão)
+        """
+        batches = FileManager.iter_directory_batches(directory, use_index, rebuild_index, rules)
+        for _, records in batches:
+            yield from records
+
+    @staticmethod
+    def scan_tree(directory, use_index=False, rebuild_index=False, rules=None):
+        """
+        Varre o diretório montando a árvore de pastas e arquivos na mesma passada.
+
+        Args:
+            directory: Diretório base a ser processado
+            use_index: Reaproveita o índice persistente do projeto
+            rebuild_index: Descarta o índice existente antes da varredura
+            rules: FileRules com filtros próprios (padrão: regras das configurações)
+
+        Returns:
+            FileTree com os arquivos selecionados por padrão marcados
+        """
+        listings = FileManager._iter_listings(directory, use_index, rebuild_index, rules)
+        return FileTree.from_listings(directory, listings)
+
+    @staticmethod
+    def filter_tree(tree, content_filter=None):
+        """
+        Desmarca na árvore os arquivos binários, grandes demais ou minificados,
+        guardando o tamanho de cada arquivo verificado.
+
+        Args:
+            tree: FileTree produzida por scan_tree
+            content_filter: ContentFilter a aplicar (padrão: limites das configurações)
+
+        Returns:
+            dict: path -> motivo do descarte
+        """
+        content_filter = content_filter or ContentFilter()
+        return content_filter.filter_files(tree.iter_files())
+
+    @staticmethod
+    def list_files_in_directory_with_ignored(directory, use_index=False, rebuild_index=False, rules=None):
         """
         Retorna todos os arquivos e pastas no diretório, incluindo ignorados.
 
         Args:
             directory: Diretório base a ser processado
+            use_index: Reaproveita o índice persistente do projeto
+            rebuild_index: Descarta o índice existente antes da varredura
+            rules: FileRules com filtros próprios (padrão: regras das configurações)
 
         Returns:
             list: Lista de tuplas (path, selecionado_por_padrão)
         """
-        # Obtém arquivos regulares e ignorados
-        regular_files, ignored_items = FileHandler.process_directory(directory)
+        ignored_items = []
+        regular_files = []
+        for listing in FileManager._iter_listings(directory, use_index, rebuild_index, rules):
+            ignored_items.extend(listing.ignored)
+            regular_files.extend(listing.files)
 
-        # Combina as listas mantendo a ordem
-        all_files = []
+        # Mantém a ordem: itens ignorados primeiro, depois arquivos regulares
+        ignored_items.extend(regular_files)
+        return ignored_items
 
-        # Adiciona arquivos ignorados
-        all_files.extend(ignored_items)
+    @staticmethod
+    def apply_content_filter(files, content_filter=None):
+        """
+        Desmarca arquivos binários, grandes demais ou minificados.
 
-        # Adiciona arquivos regulares
-        all_files.extend(regular_files)
+        Args:
+            files: Lista de tuplas (path, selecionado_por_padrão)
+            content_filter: ContentFilter a aplicar (padrão: limites das configurações)
 
-        return all_files
\ No newline at end of file
+        Returns:
+            tuple: (lista atualizada, dicionário path -> motivo do descarte)
+        """
+        content_filter = content_filter or ContentFilter()
+        return content_filter.filter_records(files)
@@ -0,0 +1,113 @@
+import fnmatch
+import os
+import re
+import threading
+from typing import Iterable, Optional
+
+from src.config.settings import SUPPORTED_EXTENSIONS, IGNORED_FOLDERS, INCLUDE_PATTERNS, EXCLUDE_PATTERNS
+
+_default_rules = None
+_default_rules_lock = threading.Lock()
+
+
+def _normalize_extension(extension: str) -> str:
+    """Normaliza a extensão para a chave de busca: sem ponto e em minúsculas"""
+    return extension.strip().lower().lstrip('.')
+
+
+def _compile_globs(patterns: Iterable[str]) -> Optional['re.Pattern']:
+    """Une vários padrões glob em uma única expressão regular (ou None se vazio)"""
+    patterns = [pattern for pattern in patterns if pattern]
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns))
+
+
+class FileRules:
+    """
+    Regras de filtragem de arquivos e pastas pré-compiladas.
+    Construídas uma única vez e compartilhadas pelo scanner, pela janela
+    principal e pelos componentes de interface.
+    """
+
+    def __init__(
+            self,
+            extensions: Iterable[str] = SUPPORTED_EXTENSIONS,
+            ignored_folders: Iterable[str] = IGNORED_FOLDERS,
+            include_patterns: Iterable[str] = INCLUDE_PATTERNS,
+            exclude_patterns: Iterable[str] = EXCLUDE_PATTERNS
+    ):
+        """
+        Compila as regras.
+
+        Args:
+            extensions: Extensões suportadas (com ou sem ponto, sem diferenciar maiúsculas)
+            ignored_folders: Nomes de pastas ignoradas
+            include_patterns: Globs de nomes de arquivo aceitos além das extensões
+            exclude_patterns: Globs de nomes de arquivos e pastas sempre ignorados
+        """
+        self.extensions = frozenset(_normalize_extension(ext) for ext in extensions)
+        self.ignored_folders = frozenset(ignored_folders)
+        self._include = _compile_globs(include_patterns)
+        self._exclude = _compile_globs(exclude_patterns)
+
+    @staticmethod
+    def default() -> 'FileRules':
+        """
+        Retorna a instância compartilhada construída a partir das configurações.
+
+        Returns:
+            FileRules padrão
+        """
+        global _default_rules
+        if _default_rules is None:
+            with _default_rules_lock:
+                if _default_rules is None:
+                    _default_rules = FileRules()
+        return _default_rules
+
+    def is_supported_file(self, filename: str) -> bool:
+        """
+        Verifica se o arquivo é suportado (consulta O(1) pela extensão).
+
+        Args:
+            filename: Nome do arquivo
+
+        Returns:
+            bool: True se o arquivo deve ser incluído
+        """
+        head, _, extension = filename.rpartition('.')
+        if head and extension.lower() in self.extensions:
+            return self._exclude is None or self._exclude.match(filename) is None
+        if self._include is None or self._include.match(filename) is None:
+            return False
+        return self._exclude is None or self._exclude.match(filename) is None
+
+    def is_ignored_folder(self, folder_name: str) -> bool:
+        """
+        Verifica se a pasta deve ser ignorada.
+
+        Args:
+            folder_name: Nome da pasta
+
+        Returns:
+            bool: True se a pasta é ignorada
+        """
+        if folder_name in self.ignored_folders:
+            return True
+        return self._exclude is not None and self._exclude.match(folder_name) is not None
+
+    def is_in_ignored_folder(self, relative_path: str) -> bool:
+        """
+        Verifica se algum componente do caminho é uma pasta ignorada.
+
+        Args:
+            relative_path: Caminho relativo à raiz do projeto
+
+        Returns:
+            bool: True se o caminho está dentro de uma pasta ignorada
+        """
+        parts = relative_path.split(os.sep)
+        if not self.ignored_folders.isdisjoint(parts):
+            return True
+        return self._exclude is not None and any(self._exclude.match(part) for part in parts)
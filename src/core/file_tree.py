@@ -0,0 +1,181 @@
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class FileNode:
+    """Arquivo encontrado na varredura"""
+    __slots__ = ('path', 'name', 'selected', 'size')
+
+    def __init__(self, path: str, name: str, selected: bool, size: Optional[int] = None):
+        """
+        Inicializa o nó.
+
+        Args:
+            path: Caminho completo do arquivo
+            name: Nome do arquivo
+            selected: Selecionado por padrão (suportado e não ignorado)
+            size: Tamanho em bytes, quando já conhecido
+        """
+        self.path = path
+        self.name = name
+        self.selected = selected
+        self.size = size
+
+
+class FolderNode:
+    """Pasta encontrada na varredura, com seus arquivos e subpastas na ordem da listagem"""
+    __slots__ = ('path', 'name', 'files', 'subfolders')
+
+    def __init__(self, path: str, name: str):
+        """
+        Inicializa o nó.
+
+        Args:
+            path: Caminho completo da pasta
+            name: Nome da pasta
+        """
+        self.path = path
+        self.name = name
+        self.files: List[FileNode] = []
+        self.subfolders: List['FolderNode'] = []
+
+
+class SizedFileList(list):
+    """
+    Lista de caminhos que carrega o tamanho de cada arquivo já conhecido,
+    para que as etapas seguintes não precisem consultar o disco de novo.
+    Os tamanhos desconhecidos ficam como None.
+    """
+    __slots__ = ('sizes',)
+
+    def __init__(self, paths: Iterable[str] = (), sizes: Iterable[Optional[int]] = ()):
+        super().__init__(paths)
+        self.sizes: List[Optional[int]] = list(sizes)
+
+
+def file_sizes(files: List[str]) -> List[int]:
+    """
+    Retorna o tamanho de cada arquivo (0 se não puder ser lido).
+
+    Usa os tamanhos carregados por uma SizedFileList e só consulta o disco
+    para os que faltam.
+
+    Args:
+        files: Caminhos dos arquivos
+
+    Returns:
+        list: Tamanhos em bytes, na mesma ordem
+    """
+    known = getattr(files, 'sizes', None)
+    if known is None or len(known) != len(files):
+        known = [None] * len(files)
+    sizes = []
+    for file, size in zip(files, known):
+        if size is None:
+            try:
+                size = os.path.getsize(file)
+            except OSError:
+                size = 0
+        sizes.append(size)
+    return sizes
+
+
+class FileTree:
+    """
+    Árvore de pastas e arquivos montada durante a varredura.
+
+    Cada DirectoryListing vira um FolderNode com os arquivos e subpastas já
+    classificados pelo scanner (tipo vindo do DirEntry), então a interface e
+    o gerador consomem a hierarquia sem recalcular caminhos relativos nem
+    consultar o disco de novo. O tamanho de cada arquivo é preenchido pela
+    única leitura que o precisa (o filtro de conteúdo) e viaja com a lista
+    de arquivos selecionados.
+    """
+
+    def __init__(self, root_path: str):
+        """
+        Inicializa a árvore vazia.
+
+        Args:
+            root_path: Pasta raiz da varredura
+        """
+        self.root = FolderNode(root_path, os.path.basename(root_path))
+        self._folders: Dict[str, FolderNode] = {root_path: self.root}
+
+    @classmethod
+    def from_listings(cls, root_path: str, listings: Iterable) -> 'FileTree':
+        """
+        Monta a árvore a partir das listagens do scanner, em qualquer ordem
+        em que a pasta pai chegue antes das filhas.
+
+        Args:
+            root_path: Pasta raiz da varredura
+            listings: DirectoryListing de cada pasta visitada
+
+        Returns:
+            FileTree sem as pastas que não contêm arquivos
+        """
+        tree = cls(root_path)
+        for listing in listings:
+            tree.add_listing(listing)
+        tree.prune()
+        return tree
+
+    def add_listing(self, listing) -> None:
+        """
+        Acrescenta a listagem de uma pasta.
+
+        Args:
+            listing: DirectoryListing produzido pelo scanner
+        """
+        folder = self._folders.get(listing.path)
+        if folder is None:
+            folder = self._folders[listing.path] = FolderNode(listing.path, os.path.basename(listing.path))
+        offset = len(os.path.join(listing.path, ''))  # Nome = caminho sem o prefixo da pasta
+        ignored_dirs = set(listing.ignored_dirs) if listing.ignored_dirs else ()
+        files = folder.files
+        # Ignorados primeiro, como nos lotes da varredura
+        for path, _ in listing.ignored:
+            if path not in ignored_dirs:
+                files.append(FileNode(path, path[offset:], False))
+        for path, _ in listing.files:
+            files.append(FileNode(path, path[offset:], True))
+        for path in listing.subdirs:
+            subfolder = self._folders[path] = FolderNode(path, path[offset:])
+            folder.subfolders.append(subfolder)
+
+    def prune(self) -> None:
+        """Remove as pastas sem nenhum arquivo na subárvore"""
+        order = [self.root]
+        for folder in order:
+            order.extend(folder.subfolders)
+        has_files = set()
+        for folder in reversed(order):
+            folder.subfolders = [child for child in folder.subfolders if id(child) in has_files]
+            if folder.files or folder.subfolders:
+                has_files.add(id(folder))
+        self._folders = {folder.path: folder for folder in order if id(folder) in has_files}
+        self._folders[self.root.path] = self.root
+
+    def iter_folders(self) -> Iterator[FolderNode]:
+        """Percorre as pastas em pré-ordem, começando pela raiz"""
+        stack = [self.root]
+        while stack:
+            folder = stack.pop()
+            yield folder
+            stack.extend(reversed(folder.subfolders))
+
+    def iter_files(self) -> Iterator[FileNode]:
+        """Percorre os arquivos em pré-ordem (os de cada pasta antes das subpastas)"""
+        for folder in self.iter_folders():
+            yield from folder.files
+
+    def selected_files(self) -> SizedFileList:
+        """
+        Arquivos selecionados por padrão, com os tamanhos conhecidos.
+
+        Returns:
+            SizedFileList na ordem da árvore
+        """
+        selected = [node for node in self.iter_files() if node.selected]
+        return SizedFileList((node.path for node in selected), (node.size for node in selected))
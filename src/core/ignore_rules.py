@@ -0,0 +1,238 @@
+import os
+import re
+import threading
+from typing import List, Optional, Tuple
+
+# Cache de arquivos de regras já compilados: caminho -> ((mtime_ns, tamanho), regras)
+_compiled_cache = {}
+_compiled_cache_lock = threading.Lock()
+_COMPILED_CACHE_MAX = 4096
+
+
+def _translate_segment(segment: str) -> str:
+    """
+    Traduz um segmento de padrão glob (sem '/') para expressão regular.
+
+    Args:
+        segment: Segmento do padrão
+
+    Returns:
+        str: Expressão regular equivalente
+    """
+    i, n = 0, len(segment)
+    result = []
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == '*':
+            result.append('[^/]*')
+        elif c == '?':
+            result.append('[^/]')
+        elif c == '\\' and i < n:
+            result.append(re.escape(segment[i]))
+            i += 1
+        elif c == '[':
+            end = i
+            if end < n and segment[end] in '!^':
+                end += 1
+            if end < n and segment[end] == ']':
+                end += 1
+            end = segment.find(']', end)
+            if end < 0:
+                result.append('\\[')
+            else:
+                body = segment[i:end].replace('\\', '\\\\')
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                result.append(f'[{body}]')
+                i = end + 1
+        else:
+            result.append(re.escape(c))
+    return ''.join(result)
+
+
+def _translate(pattern: str) -> str:
+    """
+    Traduz um padrão do .gitignore (já sem '!' e '/' final) para expressão regular
+    aplicada ao caminho relativo à pasta do arquivo de regras.
+
+    Args:
+        pattern: Padrão normalizado
+
+    Returns:
+        str: Expressão regular equivalente
+    """
+    anchored = '/' in pattern
+    parts = pattern.lstrip('/').split('/')
+
+    result = []
+    for position, part in enumerate(parts):
+        last = position == len(parts) - 1
+        if part == '**':
+            result.append('.*' if last else '(?:[^/]*/)*')
+        else:
+            result.append(_translate_segment(part) + ('' if last else '/'))
+
+    prefix = '' if anchored else '(?:.*/)?'
+    return prefix + ''.join(result)
+
+
+def parse_ignore_lines(lines) -> List[Tuple[str, bool, bool]]:
+    """
+    Converte as linhas de um arquivo de regras em (regex, negação, apenas_pastas).
+
+    Args:
+        lines: Linhas do .gitignore/.ignore
+
+    Returns:
+        list: Regras na ordem do arquivo
+    """
+    rules = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        # Espaços finais são ignorados, exceto quando escapados
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        line = stripped
+
+        if not line or line.startswith('#'):
+            continue
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith('\\!') or line.startswith('\\#'):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+
+        rules.append((_translate(line), negate, dir_only))
+    return rules
+
+
+class IgnoreRules:
+    """
+    Regras de .gitignore/.ignore de uma pasta, encadeadas às da pasta pai.
+    As regras consecutivas do mesmo tipo são unidas em uma única expressão
+    regular, e a última regra que casar decide, como no git.
+    """
+
+    def __init__(self, base: str, rules: List[Tuple[str, bool, bool]],
+                 parent: Optional['IgnoreRules'] = None):
+        """
+        Inicializa as regras de uma pasta.
+
+        Args:
+            base: Pasta que contém os arquivos de regras
+            rules: Regras no formato de parse_ignore_lines
+            parent: Regras herdadas da pasta pai
+        """
+        self.base = base
+        self.parent = parent
+        self._prefix_length = len(os.path.join(base, ''))
+
+        # Agrupa regras consecutivas com mesmo (negação, apenas_pastas),
+        # em ordem reversa para que a primeira ocorrência encontrada vença
+        groups = []
+        for regex, negate, dir_only in reversed(rules):
+            if groups and groups[-1][1] == negate and groups[-1][2] == dir_only:
+                groups[-1][0].append(regex)
+            else:
+                groups.append(([regex], negate, dir_only))
+        self._groups = [
+            (re.compile('(?:' + '|'.join(regexes) + r')\Z'), negate, dir_only)
+            for regexes, negate, dir_only in groups
+        ]
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Verifica se um caminho é ignorado pelas regras desta pasta ou das pastas pai.
+
+        Args:
+            path: Caminho completo do item (dentro da pasta base)
+            is_dir: Se o item é uma pasta
+
+        Returns:
+            True se ignorado, False se reincluído por negação, None se nenhuma regra casou
+        """
+        rules = self
+        while rules is not None:
+            relative = path[rules._prefix_length:]
+            if os.sep != '/':
+                relative = relative.replace(os.sep, '/')
+            for regex, negate, dir_only in rules._groups:
+                if dir_only and not is_dir:
+                    continue
+                if regex.match(relative):
+                    return not negate
+            rules = rules.parent
+        return None
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """
+        Verifica se um caminho deve ser ignorado.
+
+        Args:
+            path: Caminho completo do item
+            is_dir: Se o item é uma pasta
+
+        Returns:
+            bool: True se alguma regra ignora o item
+        """
+        return bool(self.match(path, is_dir))
+
+    @staticmethod
+    def _load_file(path: str) -> List[Tuple[str, bool, bool]]:
+        """Lê e compila um arquivo de regras, reaproveitando o cache se não mudou"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return []
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with _compiled_cache_lock:
+            cached = _compiled_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                rules = parse_ignore_lines(f)
+        except OSError:
+            return []
+
+        with _compiled_cache_lock:
+            if len(_compiled_cache) >= _COMPILED_CACHE_MAX:
+                _compiled_cache.clear()
+            _compiled_cache[path] = (key, rules)
+        return rules
+
+    @staticmethod
+    def for_directory(directory: str, names, ignore_files,
+                      parent: Optional['IgnoreRules'] = None) -> Optional['IgnoreRules']:
+        """
+        Retorna as regras válidas dentro de uma pasta.
+
+        Pastas sem arquivos de regras reaproveitam o objeto da pasta pai,
+        então as regras de cada nível são compiladas uma única vez.
+
+        Args:
+            directory: Caminho da pasta
+            names: Nomes dos arquivos presentes na pasta
+            ignore_files: Nomes dos arquivos de regras, em ordem crescente de prioridade
+            parent: Regras herdadas da pasta pai
+
+        Returns:
+            IgnoreRules ou o próprio parent quando não há arquivos de regras
+        """
+        rules = []
+        for ignore_file in ignore_files:
+            if ignore_file in names:
+                rules.extend(IgnoreRules._load_file(os.path.join(directory, ignore_file)))
+        if not rules:
+            return parent
+        return IgnoreRules(directory, rules, parent)
@@ -0,0 +1,245 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from src.config.settings import PROGRESS_MIN_INTERVAL
+from src.core.file_tree import file_sizes
+
+# Etapas informadas pelos geradores
+STAGE_RENDERING = 'renderizando'
+STAGE_HIGHLIGHTING = 'destacando'
+STAGE_CONVERTING = 'convertendo'
+STAGE_MERGING = 'unindo'
+STAGE_DONE = 'concluído'
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ProgressSnapshot:
+    """Estado da geração em um instante"""
+    stage: str
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+    lines: int
+    pages: int
+    elapsed: float
+    lines_per_second: float
+    mb_per_second: float
+    eta: Optional[float]  # Segundos restantes estimados pelos bytes, ou None antes da primeira medida
+
+    @property
+    def fraction(self) -> float:
+        """Fração concluída, ponderada pelo tamanho dos arquivos"""
+        if self.bytes_total:
+            return self.bytes_done / self.bytes_total
+        return self.files_done / self.files_total if self.files_total else 1.0
+
+
+class ProgressTracker:
+    """
+    Acompanha a geração ponderando o progresso pelo tamanho dos arquivos,
+    conhecido logo após a varredura, em vez de contar arquivos.
+
+    Pode ser passado como progress_callback a qualquer gerador: chamado
+    com (atual, total), marca os arquivos em ordem. Os motores que sabem
+    mais informam cada arquivo por file_done (índice, linhas, páginas), as
+    páginas convertidas em bloco por add_pages e a etapa atual por
+    set_stage; veja report_file, report_pages e report_stage. Etapas que só
+    aguardam (ex.: as conversões do wkhtmltopdf) chamam o checkpoint por
+    report_checkpoint.
+
+    O ouvinte recebe um ProgressSnapshot no máximo a cada min_interval
+    segundos, além das trocas de etapa e do fim, para que o relato nunca
+    custe tempo perceptível mesmo com milhares de arquivos pequenos.
+    """
+
+    def __init__(
+            self,
+            files: List[str],
+            listener: Callable[[ProgressSnapshot], None],
+            sizes: Optional[List[int]] = None,
+            min_interval: float = PROGRESS_MIN_INTERVAL,
+            checkpoint: Optional[Callable[[], None]] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa o acompanhamento.
+
+        Args:
+            files: Arquivos da geração, na ordem do documento
+            listener: Função que recebe cada ProgressSnapshot emitido
+            sizes: Tamanho de cada arquivo (padrão: os carregados por uma
+                SizedFileList, ou lidos do disco)
+            min_interval: Intervalo mínimo, em segundos, entre duas emissões
+            checkpoint: Função chamada a cada arquivo, mesmo sem emissão
+                (ex.: BackgroundJob.check_cancelled, para cancelar a tempo)
+            clock: Relógio monotônico em segundos
+        """
+        if sizes is None:
+            sizes = file_sizes(files)
+        self.listener = listener
+        self.sizes = sizes
+        self.min_interval = min_interval
+        self.checkpoint = checkpoint
+        self.clock = clock
+        self.stage = STAGE_RENDERING
+        self.bytes_total = sum(sizes)
+        self.bytes_done = 0
+        self.files_done = 0
+        self.lines = 0
+        self.pages = 0
+        self._done = bytearray(len(sizes))
+        self._next_in_order = 0
+        self._started = clock()
+        self._last_emit = None
+
+    def __call__(self, current: int, total: int) -> None:
+        """
+        Contrato antigo (atual, total): marca os arquivos em ordem até somar current.
+
+        Args:
+            current: Arquivos concluídos
+            total: Total de arquivos (ignorado; o total vem da lista)
+        """
+        done = self._done
+        while self.files_done < current and self._next_in_order < len(done):
+            index = self._next_in_order
+            self._next_in_order += 1
+            if not done[index]:
+                done[index] = 1
+                self.files_done += 1
+                self.bytes_done += self.sizes[index]
+        self._update()
+
+    def file_done(self, index: int, lines: int = 0, pages: int = 0) -> None:
+        """
+        Marca um arquivo específico como concluído.
+
+        Args:
+            index: Posição do arquivo na lista da geração
+            lines: Linhas diagramadas do arquivo
+            pages: Páginas concluídas durante o arquivo
+        """
+        if 0 <= index < len(self._done) and not self._done[index]:
+            self._done[index] = 1
+            self.files_done += 1
+            self.bytes_done += self.sizes[index]
+        self.lines += lines
+        self.pages += pages
+        self._update()
+
+    def add_pages(self, count: int) -> None:
+        """Soma páginas emitidas fora do relato por arquivo (ex.: pelo wkhtmltopdf); veja report_pages"""
+        self.pages += count
+
+    def set_stage(self, stage: str) -> None:
+        """Muda a etapa atual e emite imediatamente"""
+        self.stage = stage
+        self._emit()
+
+    def finish(self) -> None:
+        """Marca o fim da geração e emite o estado final"""
+        self.stage = STAGE_DONE
+        self._emit()
+
+    def snapshot(self) -> ProgressSnapshot:
+        """
+        Calcula o estado atual.
+
+        Returns:
+            ProgressSnapshot: Contadores, vazão e ETA
+        """
+        elapsed = max(self.clock() - self._started, 1e-9)
+        byte_rate = self.bytes_done / elapsed
+        eta = (self.bytes_total - self.bytes_done) / byte_rate if byte_rate > 0 else None
+        return ProgressSnapshot(
+            stage=self.stage,
+            files_done=self.files_done,
+            files_total=len(self.sizes),
+            bytes_done=self.bytes_done,
+            bytes_total=self.bytes_total,
+            lines=self.lines,
+            pages=self.pages,
+            elapsed=elapsed,
+            lines_per_second=self.lines / elapsed,
+            mb_per_second=byte_rate / _MB,
+            eta=eta,
+        )
+
+    def _update(self) -> None:
+        """Emite se o intervalo mínimo passou ou se todos os arquivos terminaram"""
+        if self.checkpoint is not None:
+            self.checkpoint()
+        if (self._last_emit is None or self.clock() - self._last_emit >= self.min_interval
+                or self.files_done == len(self.sizes)):
+            self._emit()
+
+    def _emit(self) -> None:
+        """Entrega o estado atual ao ouvinte"""
+        self._last_emit = self.clock()
+        self.listener(self.snapshot())
+
+
+def report_file(progress_callback, index: int, done: int, total: int, lines: int = 0, pages: int = 0) -> None:
+    """
+    Informa a conclusão de um arquivo ao callback de progresso: com detalhes
+    se ele os aceita (ProgressTracker), ou no contrato (atual, total).
+
+    Args:
+        progress_callback: Callback recebido pelo gerador (ou None)
+        index: Posição do arquivo na lista da geração
+        done: Arquivos concluídos até agora
+        total: Total de arquivos
+        lines: Linhas diagramadas do arquivo
+        pages: Páginas concluídas durante o arquivo
+    """
+    if progress_callback is None:
+        return
+    file_done = getattr(progress_callback, 'file_done', None)
+    if file_done is not None:
+        file_done(index, lines, pages)
+    else:
+        progress_callback(done, total)
+
+
+def report_pages(progress_callback, count: int) -> None:
+    """
+    Informa páginas prontas fora do relato por arquivo (ex.: uma parte
+    convertida pelo wkhtmltopdf), se o callback de progresso as aceita.
+
+    Args:
+        progress_callback: Callback recebido pelo gerador (ou None)
+        count: Número de páginas
+    """
+    add_pages = getattr(progress_callback, 'add_pages', None)
+    if add_pages is not None:
+        add_pages(count)
+
+
+def report_checkpoint(progress_callback) -> None:
+    """
+    Executa o checkpoint do callback de progresso (ex.: o cancelamento da
+    tarefa), se houver, em etapas que aguardam trabalho sem concluir arquivos.
+
+    Args:
+        progress_callback: Callback recebido pelo gerador (ou None)
+    """
+    checkpoint = getattr(progress_callback, 'checkpoint', None)
+    if checkpoint is not None:
+        checkpoint()
+
+
+def report_stage(progress_callback, stage: str) -> None:
+    """
+    Informa a etapa atual, se o callback de progresso a aceita.
+
+    Args:
+        progress_callback: Callback recebido pelo gerador (ou None)
+        stage: Uma das constantes STAGE_*
+    """
+    set_stage = getattr(progress_callback, 'set_stage', None)
+    if set_stage is not None:
+        set_stage(stage)
@@ -0,0 +1,221 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config.settings import SCAN_INDEX_DIR, SCAN_INDEX_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Tipos de entrada armazenados no índice
+ENTRY_FILE = 'f'
+ENTRY_DIR = 'd'
+ENTRY_LINK_DIR = 'l'  # Link simbólico para pasta (listado, mas não percorrido)
+
+# Diretórios modificados há menos que isso podem mudar de novo sem alterar o mtime
+_RACY_MTIME_NS = 2 * 1_000_000_000
+_INDEX_SUFFIX = '.sqlite'
+
+Entries = List[Tuple[str, str]]
+
+
+def _encode_entries(entries: Entries) -> str:
+    """Serializa as entradas como 'tipo+nome' separados por NUL"""
+    return '\0'.join(kind + name for name, kind in entries)
+
+
+def _decode_entries(data: str) -> Entries:
+    """Desfaz a serialização de _encode_entries"""
+    if not data:
+        return []
+    return [(item[1:], item[0]) for item in data.split('\0')]
+
+
+class ScanIndex:
+    """
+    Índice persistente da varredura de um projeto, armazenado em SQLite.
+    Guarda o mtime e as entradas de cada diretório, de modo que uma nova
+    varredura só precise listar novamente as pastas que mudaram.
+    """
+
+    def __init__(self, root: str, index_dir: str = SCAN_INDEX_DIR,
+                 max_bytes: int = SCAN_INDEX_MAX_BYTES):
+        """
+        Inicializa o índice do projeto.
+
+        Args:
+            root: Pasta raiz do projeto
+            index_dir: Pasta onde os índices de todos os projetos são mantidos
+            max_bytes: Tamanho máximo somado dos índices antes da remoção LRU
+        """
+        self.root = os.path.abspath(root)
+        self.index_dir = index_dir
+        self.max_bytes = max_bytes
+        self.path = ScanIndex.index_path_for(self.root, index_dir)
+        self._lock = threading.Lock()
+        self._cached: Optional[Dict[str, Tuple[int, str]]] = None
+        self._updated: Dict[str, Tuple[int, str]] = {}
+        self._visited = set()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def index_path_for(root: str, index_dir: str = SCAN_INDEX_DIR) -> str:
+        """
+        Retorna o caminho do arquivo de índice de um projeto.
+
+        Args:
+            root: Pasta raiz do projeto
+            index_dir: Pasta dos índices
+
+        Returns:
+            str: Caminho do arquivo SQLite
+        """
+        key = os.path.normcase(os.path.abspath(root)).encode('utf-8', 'surrogatepass')
+        return os.path.join(index_dir, hashlib.sha1(key).hexdigest() + _INDEX_SUFFIX)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre a conexão garantindo a existência do esquema"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, entries TEXT NOT NULL)"
+        )
+        return connection
+
+    def _load(self) -> Dict[str, Tuple[int, str]]:
+        """Carrega todas as pastas do índice em memória (uma única consulta)"""
+        if self._cached is None:
+            self._cached = {}
+            if os.path.exists(self.path):
+                try:
+                    connection = self._connect()
+                    try:
+                        for path, mtime_ns, entries in connection.execute(
+                                "SELECT path, mtime_ns, entries FROM dirs"):
+                            self._cached[path] = (mtime_ns, entries)
+                    finally:
+                        connection.close()
+                except sqlite3.DatabaseError as e:
+                    logger.warning(f"Índice de varredura corrompido, reconstruindo: {e}")
+                    self._cached = {}
+                    self.invalidate()
+        return self._cached
+
+    def read_directory(self, path: str, scan: Callable[[str], Entries]) -> Entries:
+        """
+        Retorna as entradas de uma pasta, reaproveitando o índice se o mtime não mudou.
+
+        Args:
+            path: Caminho da pasta
+            scan: Função que lista a pasta no disco quando o índice está desatualizado
+
+        Returns:
+            list: Tuplas (nome, tipo)
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            cached = self._load().get(path)
+            self._visited.add(path)
+            if cached is not None and cached[0] == mtime_ns:
+                self.hits += 1
+                return _decode_entries(cached[1])
+            self.misses += 1
+
+        entries = scan(path)
+        if time.time_ns() - mtime_ns < _RACY_MTIME_NS:
+            mtime_ns = -1  # Alterado agora: não confiar no mtime na próxima varredura
+        with self._lock:
+            self._updated[path] = (mtime_ns, _encode_entries(entries))
+        return entries
+
+    def save(self) -> None:
+        """
+        Grava as pastas listadas novamente e remove as que não existem mais.
+        Deve ser chamado apenas após uma varredura completa.
+        """
+        cached = self._load()
+        stale = [path for path in cached if path not in self._visited]
+        if not self._updated and not stale:
+            if os.path.exists(self.path):
+                os.utime(self.path)  # Marca o uso para a remoção LRU
+            return
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "DELETE FROM dirs WHERE path = ?", ((path,) for path in stale))
+                connection.executemany(
+                    "INSERT OR REPLACE INTO dirs (path, mtime_ns, entries) VALUES (?, ?, ?)",
+                    ((path, mtime_ns, entries) for path, (mtime_ns, entries) in self._updated.items())
+                )
+        finally:
+            connection.close()
+
+        for path in stale:
+            del cached[path]
+        cached.update(self._updated)
+        self._updated = {}
+        self._visited = set()
+        ScanIndex.evict(self.index_dir, self.max_bytes, keep=self.path)
+
+    def invalidate(self) -> None:
+        """Descarta o índice deste projeto, forçando uma varredura completa"""
+        self._cached = {}
+        self._updated = {}
+        self._visited = set()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def evict(index_dir: str = SCAN_INDEX_DIR, max_bytes: int = SCAN_INDEX_MAX_BYTES,
+              keep: Optional[str] = None) -> None:
+        """
+        Remove os índices usados há mais tempo até o total caber no limite.
+
+        Args:
+            index_dir: Pasta dos índices
+            max_bytes: Tamanho máximo somado dos índices
+            keep: Índice que nunca deve ser removido (o projeto atual)
+        """
+        try:
+            names = [name for name in os.listdir(index_dir) if name.endswith(_INDEX_SUFFIX)]
+        except FileNotFoundError:
+            return
+
+        indexes = []
+        for name in names:
+            path = os.path.join(index_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            indexes.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in indexes)
+        for _, size, path in sorted(indexes):
+            if total <= max_bytes:
+                break
+            if keep is not None and os.path.abspath(path) == os.path.abspath(keep):
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    @staticmethod
+    def clear_all(index_dir: str = SCAN_INDEX_DIR) -> None:
+        """Remove os índices de todos os projetos"""
+        ScanIndex.evict(index_dir, max_bytes=0)
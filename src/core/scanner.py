@@ -0,0 +1,241 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from src.config.settings import SCAN_MAX_WORKERS, SCAN_DETERMINISTIC, IGNORE_FILE_NAMES
+from src.core.ignore_rules import IgnoreRules
+from src.core.scan_index import ScanIndex, ENTRY_FILE, ENTRY_DIR, ENTRY_LINK_DIR
+
+
+@dataclass
+class DirectoryListing:
+    """Resultado da listagem de um único diretório"""
+    path: str
+    files: List[Tuple[str, bool]] = field(default_factory=list)  # (caminho, True)
+    ignored: List[Tuple[str, bool]] = field(default_factory=list)  # (caminho, False)
+    ignored_dirs: List[str] = field(default_factory=list)  # pastas entre os itens ignorados
+    subdirs: List[str] = field(default_factory=list)  # pastas a percorrer
+    rules: Optional[IgnoreRules] = None  # Regras de .gitignore válidas na pasta
+
+
+class DirectoryScanner:
+    """
+    Varredura de diretórios baseada em os.scandir.
+    Reaproveita o tipo informado pelo DirEntry (sem chamadas extras de stat)
+    e distribui as subpastas entre um pool de threads limitado.
+    """
+
+    def __init__(
+            self,
+            is_supported_file: Callable[[str], bool],
+            is_ignored_folder: Callable[[str], bool],
+            max_workers: Optional[int] = None,
+            deterministic: bool = SCAN_DETERMINISTIC,
+            index: Optional[ScanIndex] = None,
+            ignore_files: Tuple[str, ...] = IGNORE_FILE_NAMES
+    ):
+        """
+        Inicializa o scanner.
+
+        Args:
+            is_supported_file: Função que decide se um nome de arquivo é suportado
+            is_ignored_folder: Função que decide se um nome de pasta é ignorado
+            max_workers: Número máximo de threads de listagem (1 = serial,
+                None = valor das configurações)
+            deterministic: Se True, a saída segue a ordem alfabética em pré-ordem,
+                independente da ordem do sistema de arquivos e das threads
+            index: Índice persistente para reaproveitar pastas não modificadas
+            ignore_files: Arquivos de regras no estilo .gitignore a respeitar,
+                em ordem crescente de prioridade (vazio desativa)
+        """
+        self._is_supported_file = is_supported_file
+        self._is_ignored_folder = is_ignored_folder
+        self.max_workers = max(1, SCAN_MAX_WORKERS if max_workers is None else int(max_workers))
+        self.deterministic = deterministic
+        self.index = index
+        self.ignore_files = tuple(ignore_files)
+
+    def scan(self, directory: str) -> Tuple[List[Tuple[str, bool]], List[Tuple[str, bool]]]:
+        """
+        Percorre o diretório inteiro.
+
+        Args:
+            directory: Diretório base
+
+        Returns:
+            tuple: (arquivos regulares, itens ignorados)
+        """
+        regular_files = []
+        ignored_items = []
+        for listing in self.iter_listings(directory):
+            regular_files.extend(listing.files)
+            ignored_items.extend(listing.ignored)
+        return regular_files, ignored_items
+
+    def iter_listings(self, directory: str) -> Iterator[DirectoryListing]:
+        """
+        Produz a listagem de cada diretório à medida que é concluída.
+
+        No modo determinístico as listagens saem em pré-ordem alfabética;
+        caso contrário, na ordem em que as threads terminam.
+
+        Args:
+            directory: Diretório base
+
+        Yields:
+            DirectoryListing de cada diretório visitado
+        """
+        if self.max_workers == 1:
+            yield from self._iter_serial(directory)
+        elif self.deterministic:
+            yield from self._iter_parallel_ordered(directory)
+        else:
+            yield from self._iter_parallel_unordered(directory)
+
+    def _read_entries(self, path: str) -> List[Tuple[str, str]]:
+        """
+        Lista uma pasta no disco sem chamadas extras de stat.
+
+        Args:
+            path: Caminho do diretório
+
+        Returns:
+            list: Tuplas (nome, tipo) com os tipos definidos em scan_index
+        """
+        entries = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if not is_dir:
+                        entries.append((entry.name, ENTRY_FILE))
+                    elif entry.is_symlink():  # Não segue links, como o os.walk
+                        entries.append((entry.name, ENTRY_LINK_DIR))
+                    else:
+                        entries.append((entry.name, ENTRY_DIR))
+        except OSError:
+            return []  # Mesmo comportamento do os.walk: erros são ignorados
+
+        if self.deterministic:
+            entries.sort()
+        return entries
+
+    def _list_directory(self, path: str, parent_rules: Optional[IgnoreRules] = None) -> DirectoryListing:
+        """
+        Lista um único diretório classificando suas entradas.
+
+        Pastas ignoradas (por IGNORED_FOLDERS ou .gitignore) são podadas antes
+        da descida, custando uma única consulta em vez de uma varredura.
+
+        Args:
+            path: Caminho do diretório
+            parent_rules: Regras de .gitignore herdadas da pasta pai
+
+        Returns:
+            DirectoryListing com arquivos, itens ignorados e subpastas
+        """
+        if self.index is None:
+            entries = self._read_entries(path)
+        else:
+            entries = self.index.read_directory(path, self._read_entries)
+            if self.deterministic:
+                entries.sort()  # Índices gravados sem ordenação continuam estáveis
+
+        rules = parent_rules
+        if self.ignore_files:
+            present = [name for name, kind in entries
+                       if kind == ENTRY_FILE and name in self.ignore_files]
+            if present:
+                rules = IgnoreRules.for_directory(path, present, self.ignore_files, parent_rules)
+
+        listing = DirectoryListing(path, rules=rules)
+        prefix = os.path.join(path, '')  # Concatenação direta evita um os.path.join por entrada
+        for name, kind in entries:
+            entry_path = prefix + name
+            if kind == ENTRY_FILE:
+                if self._is_supported_file(name) and not (rules and rules.is_ignored(entry_path, False)):
+                    listing.files.append((entry_path, True))
+                else:
+                    listing.ignored.append((entry_path, False))
+            elif self._is_ignored_folder(name) or (rules and rules.is_ignored(entry_path, True)):
+                listing.ignored.append((entry_path, False))
+                listing.ignored_dirs.append(entry_path)
+            elif kind == ENTRY_DIR:
+                listing.subdirs.append(entry_path)
+
+        return listing
+
+    def _iter_serial(self, directory: str) -> Iterator[DirectoryListing]:
+        """Percorre a árvore em pré-ordem na thread atual"""
+        stack = [(directory, None)]
+        while stack:
+            listing = self._list_directory(*stack.pop())
+            stack.extend((subdir, listing.rules) for subdir in reversed(listing.subdirs))
+            yield listing
+
+    def _iter_parallel_ordered(self, directory: str) -> Iterator[DirectoryListing]:
+        """Lista em paralelo e entrega as listagens em pré-ordem"""
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scanner')
+        futures = {}
+        lock = threading.Lock()
+
+        def submit(path, rules):
+            future = executor.submit(list_and_fan_out, path, rules)
+            with lock:
+                futures[path] = future
+
+        def list_and_fan_out(path, rules):
+            listing = self._list_directory(path, rules)
+            # As subpastas são agendadas antes de a listagem ser entregue,
+            # então o futuro de cada filho já existe quando o pai é consumido
+            for subdir in listing.subdirs:
+                submit(subdir, listing.rules)
+            return listing
+
+        try:
+            submit(directory, None)
+            stack = [directory]
+            while stack:
+                path = stack.pop()
+                with lock:
+                    future = futures.pop(path)
+                listing = future.result()
+                stack.extend(reversed(listing.subdirs))
+                yield listing
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_parallel_unordered(self, directory: str) -> Iterator[DirectoryListing]:
+        """Lista em paralelo e entrega as listagens na ordem de conclusão"""
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scanner')
+        done = queue.Queue()
+
+        def list_and_fan_out(path, rules):
+            try:
+                listing = self._list_directory(path, rules)
+                # A listagem do pai entra na fila antes dos filhos serem agendados,
+                # assim o contador de pendências nunca chega a zero antes da hora
+                done.put(listing)
+                for subdir in listing.subdirs:
+                    executor.submit(list_and_fan_out, subdir, listing.rules)
+            except BaseException as e:
+                done.put(e)
+
+        try:
+            executor.submit(list_and_fan_out, directory, None)
+            pending = 1
+            while pending:
+                listing = done.get()
+                if isinstance(listing, BaseException):
+                    raise listing
+                pending += len(listing.subdirs) - 1
+                yield listing
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -1,12 +1,15 @@
 import logging
 import threading
 import time
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Set, Optional
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Tuple
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+_INVERT_BITS = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
 
 @dataclass
 class SelectionState:
@@ -20,31 +23,46 @@ class FileSelectionManager:
     """
     Gerenciador central de seleção de arquivos e pastas.
     Responsável por manter a consistência do estado de seleção.
+
+    Os itens registrados são compilados em arrays compactos: cada caminho
+    recebe um id inteiro em pré-ordem, de modo que a subárvore de uma pasta
+    é o intervalo contíguo [id, fim). A seleção dos itens sem filhos fica em
+    um array('b') e cada item guarda quantos desses itens há no seu
+    intervalo e quantos estão selecionados; o estado de uma pasta é derivado
+    desses dois contadores.
+
+    Assim, marcar ou desmarcar uma pasta é uma atribuição de fatia mais
+    O(profundidade) nos ancestrais, alternar um arquivo é O(profundidade) e
+    listar os arquivos selecionados é uma varredura em C do array.
     """
 
     def __init__(self):
         self._lock = threading.Lock()
-        self._states: Dict[str, SelectionState] = {}
-        self._folder_hierarchy: Dict[str, Set[str]] = {}  # pasta -> conjunto de itens
-        self._parent_folders: Dict[str, str] = {}  # item -> pasta pai
+        self._staged: List[Tuple[str, Optional[str], bool]] = []  # Registros ainda não compilados
+        self._updated: Dict[str, float] = {}  # item -> timestamp da última alteração direta
+        self._paths: List[str] = []  # id -> caminho
+        self._by_path = array('i')  # ids em ordem alfabética de caminho, para busca binária
+        self._parent = array('i')  # id -> id da pasta pai (-1 na raiz)
+        self._end = array('i')  # id -> fim (exclusivo) do intervalo da subárvore
+        self._leaves = array('b')  # id -> 1 se o item não tem filhos
+        self._bits = array('b')  # id -> 1 se o item sem filhos está selecionado
+        self._leaf_count = array('i')  # id -> itens sem filhos na subárvore
+        self._selected_count = array('i')  # id -> itens sem filhos selecionados na subárvore
 
-    def register_item(self, path: str, parent_folder: Optional[str] = None) -> None:
+    def register_item(self, path: str, parent_folder: Optional[str] = None, is_selected: bool = False) -> None:
         """
         Registra um novo item (arquivo ou pasta) no gerenciador.
 
+        O registro só é anotado; a árvore é compilada uma única vez, em
+        recompute_folder_states ou na próxima consulta.
+
         Args:
             path: Caminho do item
             parent_folder: Pasta pai do item (opcional)
+            is_selected: Estado inicial de seleção
         """
         with self._lock:
-            if path not in self._states:
-                self._states[path] = SelectionState(is_selected=False)
-
-            if parent_folder:
-                self._parent_folders[path] = parent_folder
-                if parent_folder not in self._folder_hierarchy:
-                    self._folder_hierarchy[parent_folder] = set()
-                self._folder_hierarchy[parent_folder].add(path)
+            self._staged.append((path, parent_folder, is_selected))
 
     def update_selection(self, path: str, is_selected: bool) -> None:
         """
@@ -54,69 +72,267 @@ class FileSelectionManager:
             path: Caminho do item
             is_selected: Novo estado de seleção
         """
+        logger.debug("Atualizando seleção de %s para %s", path, is_selected)
+        with self._lock:
+            self._compile()
+            node = self._find(path)
+            if node >= 0:
+                self._update_node(node, is_selected)
+
+    def update_node(self, node: int, is_selected: bool) -> None:
+        """
+        Atualiza a seleção de um item pelo id, sem busca pelo caminho.
+
+        Args:
+            node: Id do item, obtido com node_ids
+            is_selected: Novo estado de seleção
+        """
         with self._lock:
-            try:
-                logger.debug(f"Atualizando seleção de {path} para {is_selected}")
+            self._compile()
+            self._update_node(node, is_selected)
 
-                # Atualiza o estado do item
-                self._states[path] = SelectionState(
-                    is_selected=is_selected,
-                    last_updated=time.time()
-                )
+    def _update_node(self, node: int, is_selected: bool) -> None:
+        """Grava a seleção do item e ajusta os contadores dos ancestrais"""
+        old = self._selected_count[node]
+        self._write(node, is_selected)
+        delta = self._selected_count[node] - old
+        if delta:
+            selected_count = self._selected_count
+            parent = self._parent[node]
+            while parent >= 0:
+                selected_count[parent] += delta
+                parent = self._parent[parent]
+        self._updated[self._paths[node]] = time.time()
+
+    def update_many(self, changes: Iterable[Tuple[str, bool]]) -> None:
+        """
+        Aplica várias alterações de seleção, na ordem recebida, e recalcula
+        os ancestrais uma única vez ao final.
 
-                # Se for uma pasta, propaga para os filhos
-                if path in self._folder_hierarchy:
-                    self._propagate_to_children(path, is_selected)
+        Uma pasta no lote sobrescreve as alterações anteriores dentro dela;
+        as posteriores prevalecem sobre a dela.
 
-                # Atualiza o estado das pastas pai
-                self._update_parent_states(path)
+        Args:
+            changes: Pares (caminho, novo estado de seleção)
+        """
+        with self._lock:
+            self._compile()
+            now = time.time()
+            parents = self._parent
+            ancestors = set()
+            for path, is_selected in changes:
+                node = self._find(path)
+                if node < 0:
+                    continue
+                self._write(node, is_selected)
+                self._updated[path] = now
+                parent = parents[node]
+                while parent >= 0 and parent not in ancestors:
+                    ancestors.add(parent)
+                    parent = parents[parent]
 
-            except Exception as e:
-                logger.error(f"Erro ao atualizar seleção: {str(e)}")
-                raise
+            # Cada ancestral é recontado direto dos bits do seu intervalo
+            bits = memoryview(self._bits)
+            for node in ancestors:
+                self._selected_count[node] = bits[node:self._end[node]].tobytes().count(1)
 
-    def _propagate_to_children(self, folder_path: str, is_selected: bool) -> None:
+    def _write(self, node: int, is_selected: bool) -> None:
         """
-        Propaga o estado de seleção para todos os itens dentro de uma pasta.
+        Grava a seleção de um item e da sua subárvore, sem tocar nos ancestrais.
 
         Args:
-            folder_path: Caminho da pasta
-            is_selected: Estado de seleção a ser propagado
+            node: Id do item
+            is_selected: Novo estado de seleção
         """
-        for item in self._folder_hierarchy[folder_path]:
-            self._states[item] = SelectionState(
-                is_selected=is_selected,
-                last_updated=time.time()
-            )
-            if item in self._folder_hierarchy:  # Se o item é uma pasta
-                self._propagate_to_children(item, is_selected)
+        end = self._end[node]
+        if self._leaves[node]:
+            self._bits[node] = self._selected_count[node] = int(is_selected)
+        elif is_selected:
+            self._bits[node:end] = self._leaves[node:end]
+            self._selected_count[node:end] = self._leaf_count[node:end]
+        else:
+            size = end - node
+            self._bits[node:end] = array('b', bytes(size))
+            self._selected_count[node:end] = array('i', bytes(size * self._selected_count.itemsize))
+
+    def _compile(self) -> None:
+        """
+        Incorpora os registros pendentes: reconstrói os ids em pré-ordem e os
+        arrays, preservando a seleção dos itens já compilados.
+        """
+        if not self._staged:
+            return
+        paths = self._paths
+        records = [
+            (path, paths[parent] if parent >= 0 else None, bool(self._bits[node]))
+            for node, (path, parent) in enumerate(zip(paths, self._parent))
+        ]
+        records.extend(self._staged)
+        self._staged = []
+
+        flags: Dict[str, bool] = {}
+        parent_of: Dict[str, str] = {}
+        for path, parent_folder, is_selected in records:
+            flags.setdefault(path, is_selected)
+            if parent_folder:
+                parent_of[path] = parent_folder
+        children: Dict[str, List[str]] = {}
+        for path, parent_folder in parent_of.items():
+            flags.setdefault(parent_folder, False)
+            children.setdefault(parent_folder, []).append(path)
+        del records
+
+        paths = []
+        parents = array('i')
+        leaves = array('b')
+        bits = array('b')
+        stack = [(root, -1) for root in reversed([path for path in flags if path not in parent_of])]
+        while stack:
+            path, parent = stack.pop()
+            node = len(paths)
+            paths.append(path)
+            parents.append(parent)
+            kids = children.get(path)
+            if kids:
+                stack.extend((kid, node) for kid in reversed(kids))
+                leaves.append(0)
+                bits.append(0)
+            else:
+                leaves.append(1)
+                bits.append(1 if flags[path] else 0)
+
+        # Fim dos intervalos e contadores, acumulados das folhas para a raiz
+        size = len(paths)
+        end = array('i', range(1, size + 1))
+        leaf_count = array('i', leaves)
+        selected_count = array('i', bits)
+        for node in range(size - 1, -1, -1):
+            parent = parents[node]
+            if parent >= 0:
+                if end[node] > end[parent]:
+                    end[parent] = end[node]
+                leaf_count[parent] += leaf_count[node]
+                selected_count[parent] += selected_count[node]
 
-    def _update_parent_states(self, path: str) -> None:
+        self._paths = paths
+        self._by_path = array('i', sorted(range(size), key=paths.__getitem__))
+        self._parent = parents
+        self._end = end
+        self._leaves = leaves
+        self._bits = bits
+        self._leaf_count = leaf_count
+        self._selected_count = selected_count
+
+    def node_ids(self, paths: Iterable[str]) -> List[int]:
         """
-        Atualiza o estado das pastas pai baseado nos estados dos filhos.
+        Converte caminhos nos ids compactos, de uma só vez.
+
+        Os ids seguem a pré-ordem do registro e valem até o próximo
+        register_item, que recompila a árvore.
 
         Args:
-            path: Caminho do item que teve seu estado alterado
-        """
-        current = path
-        while current in self._parent_folders:
-            parent = self._parent_folders[current]
-            children_states = [
-                self._states[child].is_selected
-                for child in self._folder_hierarchy[parent]
-            ]
-
-            # Calcula o novo estado da pasta
-            all_selected = all(children_states)
-            any_selected = any(children_states)
-
-            self._states[parent] = SelectionState(
-                is_selected=all_selected,
-                is_partial=any_selected and not all_selected,
-                last_updated=time.time()
-            )
+            paths: Caminhos registrados
+
+        Returns:
+            list: Id de cada caminho (-1 se não registrado)
+        """
+        with self._lock:
+            self._compile()
+            ids = {path: node for node, path in enumerate(self._paths)}
+            return [ids.get(path, -1) for path in paths]
 
-            current = parent
+    def _find(self, path: str) -> int:
+        """
+        Busca binária do id de um caminho.
+
+        Args:
+            path: Caminho do item
+
+        Returns:
+            int: Id do item, ou -1 se não registrado
+        """
+        paths = self._paths
+        by_path = self._by_path
+        low, high = 0, len(by_path)
+        while low < high:
+            middle = (low + high) // 2
+            if paths[by_path[middle]] < path:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(by_path) and paths[by_path[low]] == path:
+            return by_path[low]
+        return -1
+
+    def _state_of(self, node: int) -> Tuple[bool, bool]:
+        """Estado (selecionado, parcial) de um item compilado"""
+        selected = self._selected_count[node]
+        total = self._leaf_count[node]
+        return selected == total, 0 < selected < total
+
+    def recompute_folder_states(self) -> None:
+        """
+        Recalcula o estado de todas as pastas a partir dos filhos, das mais
+        profundas para a raiz, em uma única passada.
+        """
+        with self._lock:
+            self._compile()
+
+    def selected_files(self) -> List[str]:
+        """
+        Lista os itens sem filhos selecionados, em pré-ordem.
+
+        Returns:
+            list: Caminhos selecionados
+        """
+        with self._lock:
+            self._compile()
+            return list(compress(self._paths, self._bits))
+
+    def selected_nodes(self) -> List[int]:
+        """
+        Lista os ids dos itens sem filhos selecionados, em pré-ordem.
+
+        Returns:
+            list: Ids selecionados
+        """
+        with self._lock:
+            self._compile()
+            return list(compress(range(len(self._paths)), self._bits))
+
+    def selected_items(self, paths: Iterable[str]) -> List[str]:
+        """
+        Filtra os caminhos selecionados, preservando a ordem recebida.
+
+        Args:
+            paths: Caminhos a consultar (ex.: os arquivos da árvore)
+
+        Returns:
+            list: Caminhos cujo estado é selecionado
+        """
+        with self._lock:
+            self._compile()
+            selected = set(compress(self._paths, self._bits))
+            folders = compress(range(len(self._paths)), self._leaves.tobytes().translate(_INVERT_BITS))
+            selected_count = self._selected_count
+            leaf_count = self._leaf_count
+            selected.update(self._paths[node] for node in folders
+                            if selected_count[node] == leaf_count[node])
+            return [path for path in paths if path in selected]
+
+    def node_state(self, node: int) -> Tuple[bool, bool]:
+        """
+        Estado de um item pelo id, sem busca pelo caminho.
+
+        Args:
+            node: Id do item, obtido com node_ids
+
+        Returns:
+            tuple: (selecionado, parcial)
+        """
+        with self._lock:
+            self._compile()
+            return self._state_of(node)
 
     def get_state(self, path: str) -> SelectionState:
         """
@@ -129,4 +345,13 @@ class FileSelectionManager:
             SelectionState atual do item
         """
         with self._lock:
-            return self._states.get(path, SelectionState(is_selected=False))
\ No newline at end of file
+            self._compile()
+            node = self._find(path)
+            if node < 0:
+                return SelectionState(is_selected=False)
+            is_selected, is_partial = self._state_of(node)
+            return SelectionState(
+                is_selected=is_selected,
+                is_partial=is_partial,
+                last_updated=self._updated.get(path, 0.0)
+            )
@@ -0,0 +1,142 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.core.file_tree import FileTree, SizedFileList
+from src.core.selection_manager import FileSelectionManager
+
+
+class SelectionRecord:
+    """Registro de um item da árvore de seleção (arquivo ou pasta)"""
+    __slots__ = ('index', 'path', 'name', 'parent', 'children', 'is_folder', 'reason', 'size', 'node')
+
+    def __init__(self, index: int, path: str, name: str, parent: int, is_folder: bool,
+                 reason: Optional[str] = None, size: Optional[int] = None):
+        """
+        Inicializa o registro.
+
+        Args:
+            index: Posição do registro no modelo (e identificador da linha na árvore)
+            path: Caminho completo do item
+            name: Nome exibido
+            parent: Índice do registro da pasta pai (-1 no primeiro nível)
+            is_folder: True para pastas
+            reason: Motivo do descarte pelo pré-filtro de conteúdo, se houver
+            size: Tamanho do arquivo em bytes, quando conhecido da varredura
+        """
+        self.index = index
+        self.path = path
+        self.name = name
+        self.parent = parent
+        self.children: List[int] = []
+        self.is_folder = is_folder
+        self.reason = reason
+        self.size = size
+        self.node = -1  # Id do item no FileSelectionManager
+
+
+class SelectionModel:
+    """
+    Modelo de seleção da árvore de arquivos, independente de widgets.
+
+    Cada arquivo e pasta vira um SelectionRecord, guardado em uma lista na
+    ordem de exibição (pré-ordem: os arquivos de uma pasta e depois suas
+    subpastas). A posição na lista identifica a linha correspondente no
+    Treeview, e o registro guarda o id compacto do item no
+    FileSelectionManager, então alternar uma linha não busca caminhos nem
+    percorre listas: O(profundidade) para um arquivo e uma atribuição de
+    fatia para uma pasta. Como o gerenciador numera os itens na mesma
+    pré-ordem, confirmar a seleção é uma varredura do array de seleção.
+    """
+
+    def __init__(self, skip_reasons: Optional[Dict[str, str]] = None):
+        """
+        Inicializa o modelo vazio.
+
+        Args:
+            skip_reasons: Dicionário path -> motivo dos arquivos desmarcados pelo pré-filtro
+        """
+        self.skip_reasons = skip_reasons or {}
+        self.manager = FileSelectionManager()
+        self.records: List[SelectionRecord] = []
+        self.roots: List[int] = []  # Registros do primeiro nível
+        self._record_of_node: List[int] = []
+
+    def load(self, tree: FileTree) -> None:
+        """
+        Monta os registros e o estado de seleção a partir da árvore da varredura.
+
+        Args:
+            tree: FileTree com a seleção padrão de cada arquivo
+        """
+        manager = self.manager
+        skip_reasons = self.skip_reasons
+        stack = [(folder, -1) for folder in reversed(tree.root.subfolders)]
+        for node in tree.root.files:
+            self._add(node.path, node.name, -1, False, skip_reasons.get(node.path), node.size)
+            manager.register_item(node.path, None, node.selected)
+        while stack:
+            folder, parent = stack.pop()
+            index = self._add(folder.path, folder.name, parent, True).index
+            manager.register_item(folder.path, self.records[parent].path if parent >= 0 else None)
+            for node in folder.files:
+                self._add(node.path, node.name, index, False, skip_reasons.get(node.path), node.size)
+                manager.register_item(node.path, folder.path, node.selected)
+            stack.extend((child, index) for child in reversed(folder.subfolders))
+
+        self._record_of_node = [-1] * len(self.records)
+        for record, node in zip(self.records, manager.node_ids(record.path for record in self.records)):
+            record.node = node
+            self._record_of_node[node] = record.index
+
+    def _add(self, path: str, name: str, parent: int, is_folder: bool,
+             reason: Optional[str] = None, size: Optional[int] = None) -> SelectionRecord:
+        """Cria o próximo registro e o liga à pasta pai"""
+        record = SelectionRecord(len(self.records), path, name, parent, is_folder, reason, size)
+        self.records.append(record)
+        (self.records[parent].children if parent >= 0 else self.roots).append(record.index)
+        return record
+
+    def state(self, index: int) -> Tuple[bool, bool]:
+        """
+        Estado de seleção de um registro.
+
+        Args:
+            index: Índice do registro
+
+        Returns:
+            tuple: (selecionado, parcial)
+        """
+        return self.manager.node_state(self.records[index].node)
+
+    def toggle(self, index: int) -> bool:
+        """
+        Inverte a seleção de um registro (e de toda a subárvore, se for pasta).
+
+        Args:
+            index: Índice do registro
+
+        Returns:
+            bool: Novo estado de seleção
+        """
+        is_selected = not self.state(index)[0]
+        self.manager.update_node(self.records[index].node, is_selected)
+        return is_selected
+
+    def ancestors(self, index: int) -> Iterator[int]:
+        """Índices das pastas acima do registro, da mais próxima para o primeiro nível"""
+        parent = self.records[index].parent
+        while parent >= 0:
+            yield parent
+            parent = self.records[parent].parent
+
+    def selected_files(self) -> SizedFileList:
+        """
+        Arquivos selecionados, na ordem da árvore, com os tamanhos conhecidos.
+
+        Returns:
+            SizedFileList com os caminhos selecionados
+        """
+        records = self.records
+        record_of_node = self._record_of_node
+        selected = [records[record_of_node[node]] for node in self.manager.selected_nodes()]
+        selected = [record for record in selected if not record.is_folder]  # Pastas vazias não têm arquivo
+        return SizedFileList((record.path for record in selected), (record.size for record in selected))
@@ -1,12 +1,17 @@
+import multiprocessing
+
 import ttkbootstrap as ttk
 
 from src.ui.main_window import MainWindow
 
 if __name__ == "__main__":
+    # Necessário para o pool de processos da geração de PDF em executáveis congelados
+    multiprocessing.freeze_support()
+
     app = ttk.Window(themename="cosmo")
 
     # Centralizar a janela
-    MainWindow.center_window(app, 400, 300)
+    MainWindow.center_window(app, 400, 340)
 
     MainWindow(app)
     app.mainloop()
@@ -0,0 +1,263 @@
+import os
+from typing import Callable, List, Optional, Tuple
+
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+from src.config.settings import PAGE_SIZE, DEFAULT_FONT_SIZE
+from src.core.progress import report_file
+
+# Margens efetivas equivalentes às do SimpleDocTemplate (margem + padding do frame)
+LEFT_MARGIN = 46
+RIGHT_MARGIN = 11
+TOP_MARGIN = 11
+BOTTOM_MARGIN = 11
+
+CODE_FONT = 'Courier'
+HEADING_FONT = 'Helvetica-BoldOblique'
+HEADING_FONT_SIZE = 12
+HEADING_LEADING = 14
+HEADING_SPACE_BEFORE = 12
+HEADING_SPACE_AFTER = 6 + 12  # spaceAfter do Heading3 + Spacer(1, 12)
+ERROR_FONT = 'Helvetica'
+ERROR_FONT_SIZE = 10
+ERROR_LEADING = 12
+TAB_SIZE = 4
+
+
+def display_path_for(file: str, path: str) -> str:
+    """
+    Retorna o caminho exibido no cabeçalho de cada arquivo.
+
+    Args:
+        file: Caminho completo do arquivo
+        path: Pasta base do projeto
+
+    Returns:
+        str: Nome da pasta base seguido do caminho relativo
+    """
+    try:
+        relative_path = os.path.relpath(file, start=path)
+        return os.path.join(str(os.path.basename(path)), str(relative_path))
+    except ValueError:
+        return os.path.basename(file)  # Caso haja erro, retorna o nome do arquivo
+
+
+def wrap_line(line: str, columns: int) -> List[str]:
+    """
+    Quebra uma linha em pedaços de largura fixa.
+
+    Args:
+        line: Linha sem o caractere de fim de linha
+        columns: Número de caracteres por linha
+
+    Returns:
+        list: Pedaços da linha (ao menos um, mesmo para linha vazia)
+    """
+    if len(line) <= columns:
+        return [line]
+    return [line[i:i + columns] for i in range(0, len(line), columns)]
+
+
+class CanvasTextRenderer:
+    """
+    Motor de renderização de texto simples direto no canvas.
+    Como a fonte é monoespaçada e o espaçamento é fixo, a diagramação é
+    feita por aritmética de caracteres, sem o custo do Paragraph/platypus.
+    """
+
+    def __init__(self, font_size: int = DEFAULT_FONT_SIZE, page_size=PAGE_SIZE):
+        """
+        Inicializa o motor.
+
+        Args:
+            font_size: Tamanho da fonte do código
+            page_size: Tamanho da página (largura, altura)
+        """
+        self.font_size = font_size
+        self.page_size = page_size
+        self.page_width, self.page_height = page_size
+        # Mesmo espaçamento do estilo CodeStyle: leading + spaceBefore/spaceAfter
+        self.leading = font_size * 1.2 + 2
+        self.text_width = self.page_width - LEFT_MARGIN - RIGHT_MARGIN
+        self.columns = max(1, int(self.text_width // stringWidth('M', CODE_FONT, font_size)))
+
+    def read_lines(self, file: str) -> List[str]:
+        """
+        Lê o arquivo e o diagrama em linhas de largura fixa.
+
+        Args:
+            file: Caminho do arquivo
+
+        Returns:
+            list: Linhas prontas para desenho
+        """
+        with open(file, 'r', encoding='utf-8') as f:
+            code = f.read()
+
+        columns = self.columns
+        lines = []
+        for line in code.splitlines():
+            if '\t' in line:
+                line = line.expandtabs(TAB_SIZE)
+            if len(line) <= columns:
+                lines.append(line)
+            else:
+                lines.extend(wrap_line(line, columns))
+        return lines
+
+    def render(
+            self,
+            files: List[str],
+            path: str,
+            output_path: str,
+            progress_callback: Optional[Callable[[int, int], None]] = None,
+            first_number: int = 1
+    ) -> List[Tuple[str, int]]:
+        """
+        Gera o PDF de texto simples.
+
+        Args:
+            files: Arquivos a incluir, na ordem desejada
+            path: Pasta base do projeto (para os cabeçalhos)
+            output_path: Caminho do PDF gerado
+            progress_callback: Função chamada com (atual, total) a cada arquivo, ou
+                ProgressTracker (recebe também as linhas e páginas de cada arquivo)
+            first_number: Número do primeiro arquivo, usado nas chaves dos marcadores
+                (partes geradas separadamente e depois unidas não repetem chaves)
+
+        Returns:
+            list: Tuplas (caminho exibido, índice da página inicial) de cada arquivo
+        """
+        pdf = canvas.Canvas(output_path, pagesize=self.page_size)
+        layout = self._new_layout(pdf)
+        file_pages = []
+
+        for i, file in enumerate(files, 1):
+            display_path = display_path_for(file, path)
+            first_page = layout.page_index
+            file_pages.append((display_path, layout.draw_heading(display_path, first_number + i - 1)))
+            lines = 0
+            try:
+                lines = self._draw_file(layout, file)
+            except Exception as e:
+                layout.draw_error(f"Erro ao processar {display_path}: {e}")
+
+            report_file(progress_callback, i - 1, i, len(files), lines, layout.page_index - first_page)
+
+        layout.finish()
+        pdf.save()
+        return file_pages
+
+    def _new_layout(self, pdf: canvas.Canvas) -> '_PageLayout':
+        """Cria o estado de diagramação do documento"""
+        return _PageLayout(self, pdf)
+
+    def _draw_file(self, layout: '_PageLayout', file: str) -> int:
+        """Desenha o conteúdo de um arquivo e retorna o número de linhas diagramadas"""
+        lines = self.read_lines(file)
+        layout.draw_code(lines)
+        return len(lines)
+
+
+class _PageLayout:
+    """Estado da diagramação (página e posição vertical atuais)"""
+
+    def __init__(self, renderer: CanvasTextRenderer, pdf: canvas.Canvas):
+        self.renderer = renderer
+        self.pdf = pdf
+        self.top = renderer.page_height - TOP_MARGIN
+        self.page_index = 0
+        self.y = self.top
+        self.page_has_content = False
+
+    def _new_page(self) -> None:
+        """Finaliza a página atual e começa outra"""
+        self.pdf.showPage()
+        self.page_index += 1
+        self.y = self.top
+        self.page_has_content = False
+
+    def _ensure_space(self, height: float) -> None:
+        """Quebra a página se não houver espaço para a altura pedida"""
+        if self.page_has_content and self.y - height < BOTTOM_MARGIN:
+            self._new_page()
+
+    def draw_heading(self, text: str, number: int) -> int:
+        """
+        Desenha o cabeçalho de um arquivo e registra a entrada no sumário do PDF.
+
+        Args:
+            text: Caminho exibido
+            number: Número sequencial do arquivo (chave do marcador)
+
+        Returns:
+            int: Índice da página onde o cabeçalho foi desenhado
+        """
+        renderer = self.renderer
+        lines = simpleSplit(f"Arquivo: {text}", HEADING_FONT, HEADING_FONT_SIZE, renderer.text_width)
+        space_before = HEADING_SPACE_BEFORE if self.page_has_content else 0
+        # Mantém o cabeçalho junto da primeira linha de código
+        self._ensure_space(space_before + len(lines) * HEADING_LEADING + HEADING_SPACE_AFTER + renderer.leading)
+        if self.page_has_content:
+            self.y -= HEADING_SPACE_BEFORE
+
+        text_object = self.pdf.beginText(LEFT_MARGIN, self.y - HEADING_FONT_SIZE)
+        text_object.setFont(HEADING_FONT, HEADING_FONT_SIZE, HEADING_LEADING)
+        text_object.textLines(lines)
+        self.pdf.drawText(text_object)
+
+        key = f"arquivo-{number}"
+        self.pdf.bookmarkPage(key, fit='XYZ', top=self.y, left=0, zoom=0)
+        self.pdf.addOutlineEntry(text, key, level=0)
+
+        self.y -= len(lines) * HEADING_LEADING + HEADING_SPACE_AFTER
+        self.page_has_content = True
+        return self.page_index
+
+    def draw_code(self, lines: List[str]) -> None:
+        """
+        Desenha as linhas de código, quebrando páginas quando necessário.
+
+        Args:
+            lines: Linhas já diagramadas na largura da página
+        """
+        renderer = self.renderer
+        leading = renderer.leading
+        start = 0
+        while start < len(lines):
+            capacity = int((self.y - BOTTOM_MARGIN) // leading)
+            if capacity <= 0:
+                self._new_page()
+                continue
+
+            chunk = lines[start:start + capacity]
+            text_object = self.pdf.beginText(LEFT_MARGIN, self.y - renderer.font_size)
+            text_object.setFont(CODE_FONT, renderer.font_size, leading)
+            text_object.textLines(chunk)
+            self.pdf.drawText(text_object)
+
+            self.y -= len(chunk) * leading
+            self.page_has_content = True
+            start += len(chunk)
+
+    def draw_error(self, message: str) -> None:
+        """
+        Desenha a mensagem de erro de um arquivo que não pôde ser lido.
+
+        Args:
+            message: Texto da mensagem
+        """
+        lines = simpleSplit(message, ERROR_FONT, ERROR_FONT_SIZE, self.renderer.text_width)
+        self._ensure_space(len(lines) * ERROR_LEADING)
+        text_object = self.pdf.beginText(LEFT_MARGIN, self.y - ERROR_FONT_SIZE)
+        text_object.setFont(ERROR_FONT, ERROR_FONT_SIZE, ERROR_LEADING)
+        text_object.textLines(lines)
+        self.pdf.drawText(text_object)
+        self.y -= len(lines) * ERROR_LEADING
+        self.page_has_content = True
+
+    def finish(self) -> None:
+        """Finaliza a última página"""
+        self.pdf.showPage()
@@ -1,24 +1,71 @@
 import html
-import os
+import tempfile
 
-import pdfkit
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import guess_lexer_for_filename
 from reportlab.lib.colors import black
 from reportlab.lib.enums import TA_LEFT
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Spacer, Paragraph
 
-from src.config.settings import PAGE_SIZE, DEFAULT_FONT_SIZE
+from src.config.settings import (PAGE_SIZE, DEFAULT_FONT_SIZE, SIMPLE_PDF_ENGINE, SIMPLE_PDF_STREAMING_THRESHOLD,
+                                 HIGHLIGHT_CACHE_ENABLED, HIGHLIGHT_CACHE_DIR, HIGHLIGHT_CACHE_MAX_BYTES,
+                                 INDENTED_CHUNK_BYTES, WKHTMLTOPDF_JOBS, FRAGMENT_CACHE_DIR, FRAGMENT_CACHE_MAX_BYTES)
+from src.core.content_cache import ContentCache
+from src.core.progress import STAGE_CONVERTING, STAGE_HIGHLIGHTING, report_file, report_stage
+from src.pdf.canvas_renderer import CanvasTextRenderer, display_path_for
+from src.pdf.highlighted_renderer import HighlightedCanvasRenderer
+from src.pdf.highlighter import iter_highlighted
+from src.pdf.incremental import CanvasFragments, IncrementalBuilder, IndentedFragments
+from src.pdf.parallel import can_merge_pdfs, file_sizes, render_simple_parallel
+from src.pdf.wkhtml import HTML_TAIL, ChunkedHtmlConverter, html_fragment, html_head
 
 
-def _caminho_relativo(file, path):
-    try:
-        relative_path = os.path.relpath(file, start=path)
-        return os.path.join(str(os.path.basename(path)), str(relative_path))
-    except ValueError:
-        return os.path.basename(file)  # Caso haja erro, retorna o nome do arquivo
+class _LazyFlowables:
+    """
+    Lista de flowables consumida sob demanda pelo build do platypus.
+
+    O build só acessa o início da lista (len, [i], [:i], del [0], insert(0, ...)
+    e [0:0] = ...), então basta manter em memória os itens já produzidos e
+    ainda não desenhados. O len informado nunca passa do número real de itens.
+    """
+
+    def __init__(self, flowables):
+        self._source = iter(flowables)
+        self._buffer = []
+
+    def _fill(self, count):
+        """Garante ao menos count itens no buffer, se a fonte tiver tantos"""
+        while len(self._buffer) < count:
+            try:
+                self._buffer.append(next(self._source))
+            except StopIteration:
+                break
+
+    def __len__(self):
+        self._fill(1)
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._buffer[index]
+        self._fill(index + 1)
+        return self._buffer[index]
+
+    def __setitem__(self, index, value):
+        self._buffer[index] = value
+
+    def __delitem__(self, index):
+        del self._buffer[index]
+
+    def insert(self, index, value):
+        self._buffer.insert(index, value)
+
+
+def _incremental_builder(fragments, fragment_cache=None):
+    """Cria o construtor incremental com o cache de páginas padrão se nenhum foi informado"""
+    if fragment_cache is None:
+        fragment_cache = ContentCache(FRAGMENT_CACHE_DIR, FRAGMENT_CACHE_MAX_BYTES)
+    return IncrementalBuilder(fragments, fragment_cache)
+
 
 class PDFGenerator:
     def __init__(self, font_size=DEFAULT_FONT_SIZE, page_size=PAGE_SIZE):
@@ -38,8 +85,65 @@ class PDFGenerator:
             spaceAfter=2
         )
 
-    def generate_simple_pdf(self, files, path, output_path, progress_callback=None):
-        """Gera o PDF com texto simples."""
+    def generate_simple_pdf(self, files, path, output_path, progress_callback=None, engine=None,
+                            streaming=None, jobs=None, incremental=False, fragment_cache=None):
+        """
+        Gera o PDF com texto simples.
+
+        Args:
+            files: Arquivos a incluir
+            path: Pasta base do projeto
+            output_path: Caminho do PDF gerado
+            progress_callback: Função chamada com (atual, total) a cada arquivo
+            engine: 'canvas' (diagramação direta, padrão) ou 'platypus' (Paragraph por linha)
+            streaming: Apenas no motor 'platypus': produz os flowables sob demanda
+                durante o build. None ativa automaticamente acima de
+                SIMPLE_PDF_STREAMING_THRESHOLD bytes de entrada
+            jobs: Apenas no motor 'canvas': número de processos de renderização
+                (padrão: PDF_JOBS). Entradas pequenas são sempre renderizadas
+                no próprio processo
+            incremental: Apenas no motor 'canvas': reaproveita as páginas em cache
+                dos arquivos inalterados (cada arquivo começa em uma nova página)
+            fragment_cache: ContentCache das páginas por arquivo (padrão: FRAGMENT_CACHE_DIR)
+        """
+        engine = engine or SIMPLE_PDF_ENGINE
+        if incremental and engine == 'canvas' and can_merge_pdfs():
+            fragments = CanvasFragments(CanvasTextRenderer, self.font_size, self.page_size, jobs)
+            _incremental_builder(fragments, fragment_cache).build(files, path, output_path, progress_callback)
+        elif engine == 'canvas':
+            render_simple_parallel(files, path, output_path, progress_callback, jobs,
+                                   font_size=self.font_size, page_size=self.page_size)
+        elif engine == 'platypus':
+            self._generate_simple_pdf_platypus(files, path, output_path, progress_callback, streaming)
+        else:
+            raise ValueError(f"Motor de texto simples desconhecido: {engine}")
+
+    def generate_highlighted_pdf(self, files, path, output_path, progress_callback=None, jobs=None,
+                                 incremental=False, fragment_cache=None):
+        """
+        Gera o PDF com destaque de sintaxe desenhado direto no canvas,
+        sem HTML nem wkhtmltopdf.
+
+        Args:
+            files: Arquivos a incluir
+            path: Pasta base do projeto
+            output_path: Caminho do PDF gerado
+            progress_callback: Função chamada com (atual, total) a cada arquivo
+            jobs: Número de processos de renderização (padrão: PDF_JOBS)
+            incremental: Reaproveita as páginas em cache dos arquivos inalterados
+                (cada arquivo começa em uma nova página)
+            fragment_cache: ContentCache das páginas por arquivo (padrão: FRAGMENT_CACHE_DIR)
+        """
+        if incremental and can_merge_pdfs():
+            fragments = CanvasFragments(HighlightedCanvasRenderer, self.font_size, self.page_size, jobs)
+            _incremental_builder(fragments, fragment_cache).build(files, path, output_path, progress_callback)
+            return
+        render_simple_parallel(files, path, output_path, progress_callback, jobs,
+                               font_size=self.font_size, page_size=self.page_size,
+                               renderer_class=HighlightedCanvasRenderer)
+
+    def _generate_simple_pdf_platypus(self, files, path, output_path, progress_callback=None, streaming=None):
+        """Gera o PDF com texto simples usando um Paragraph por linha."""
         pdf = SimpleDocTemplate(
             output_path,
             pagesize=self.page_size,
@@ -48,66 +152,110 @@ class PDFGenerator:
             rightMargin=5,
             bottomMargin=5
         )
-        content = []
+        if streaming is None:
+            streaming = sum(file_sizes(files)) > SIMPLE_PDF_STREAMING_THRESHOLD
+
+        content = self._iter_simple_flowables(files, path, progress_callback)
+        # No modo streaming a memória fica limitada a cerca de um arquivo diagramado
+        pdf.build(_LazyFlowables(content) if streaming else list(content))
+
+    def _iter_simple_flowables(self, files, path, progress_callback=None):
+        """
+        Produz os flowables do PDF de texto simples, um arquivo por vez.
 
+        Args:
+            files: Arquivos a incluir
+            path: Pasta base do projeto
+            progress_callback: Função chamada com (atual, total) a cada arquivo
+
+        Yields:
+            Flowables do reportlab na ordem do documento
+        """
         for i, file in enumerate(files, 1):
 
-            display_path = _caminho_relativo(file, path)
+            display_path = display_path_for(file, path)
 
-            content.append(Paragraph(f"Arquivo: {display_path}", self.styles['Heading3']))
-            content.append(Spacer(1, 12))
+            yield Paragraph(f"Arquivo: {display_path}", self.styles['Heading3'])
+            yield Spacer(1, 12)
+            lines = []
             try:
                 with open(file, 'r', encoding='utf-8') as f:
                     lines = f.readlines()
-                    for line in lines:
-                        escaped_line = html.escape(line)
-                        content.append(Paragraph(escaped_line, self.custom_style))
             except Exception as e:
                 error_msg = html.escape(str(e))
-                content.append(Paragraph(f"Erro ao processar {display_path}: {error_msg}", self.styles['Normal']))
-            if progress_callback:
-                progress_callback(i, len(files))
-        pdf.build(content)
+                yield Paragraph(f"Erro ao processar {display_path}: {error_msg}", self.styles['Normal'])
+            else:
+                for line in lines:
+                    escaped_line = html.escape(line)
+                    yield Paragraph(escaped_line, self.custom_style)
+            report_file(progress_callback, i - 1, i, len(files), len(lines))
 
-    @staticmethod
-    def generate_indented_pdf(files, path, output_path, progress_callback=None):
-        """Gera o PDF com texto indentado."""
-        combined_html = ""
-
-        # CSS personalizado para o estilo
-        custom_css = """
-        <style>
-        .custom-code-style pre {
-            font-family: Courier, monospace;
-            font-size: 17pt;
-            line-height: 1.5;
-            margin: 10px 0;
-            padding: 10px;
-            background-color: #f8f8f8;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-        }
-        </style>
+    def generate_indented_pdf(self, files, path, output_path, progress_callback=None, jobs=None, cache=None,
+                              chunk_bytes=INDENTED_CHUNK_BYTES, incremental=False, fragment_cache=None):
         """
+        Gera o PDF com texto indentado. As partes que o wkhtmltopdf não
+        converte saem em texto simples com a fonte e a página do gerador.
 
-        combined_html += custom_css
+        Args:
+            files: Arquivos a incluir
+            path: Pasta base do projeto
+            output_path: Caminho do PDF gerado
+            progress_callback: Função chamada com (concluídos, total) a cada arquivo destacado
+            jobs: Número de processos do destaque de sintaxe e do wkhtmltopdf
+                (padrão: PDF_JOBS e WKHTMLTOPDF_JOBS)
+            cache: ContentCache dos trechos destacados (padrão: o cache em
+                HIGHLIGHT_CACHE_DIR, se HIGHLIGHT_CACHE_ENABLED; False desativa). Os
+                contadores cache.hits/misses ficam disponíveis ao chamador após a geração
+            chunk_bytes: Tamanho alvo de HTML de cada parte convertida
+                separadamente (None: documento único)
+            incremental: Reaproveita as páginas em cache dos arquivos inalterados
+                (cada arquivo começa em uma nova página)
+            fragment_cache: ContentCache das páginas por arquivo (padrão: FRAGMENT_CACHE_DIR)
 
-        for i, file in enumerate(files, 1):
-            # Obtém o caminho relativo
-            display_path = _caminho_relativo(file, path)
+        Returns:
+            list: Tuplas (arquivos, erro) das partes que o wkhtmltopdf não conseguiu
+                converter e que foram incluídas em texto simples
+        """
+        if cache is None and HIGHLIGHT_CACHE_ENABLED:
+            cache = ContentCache(HIGHLIGHT_CACHE_DIR, HIGHLIGHT_CACHE_MAX_BYTES)
+        cache = cache or None
+        if incremental and can_merge_pdfs():
+            fragments = IndentedFragments(jobs, cache, chunk_bytes or INDENTED_CHUNK_BYTES, self.font_size,
+                                          self.page_size)
+            return _incremental_builder(fragments, fragment_cache).build(files, path, output_path, progress_callback)
+        if chunk_bytes is not None and not can_merge_pdfs():
+            chunk_bytes = None
 
-            combined_html += f"<h1>Arquivo: {display_path}</h1>\n"
+        # O HTML vai direto para arquivos temporários, sem montar o documento em memória
+        with tempfile.TemporaryDirectory(prefix='sctpdf-') as temp_dir:
+            converter = ChunkedHtmlConverter(temp_dir, path, chunk_bytes, jobs or WKHTMLTOPDF_JOBS,
+                                             progress_callback=progress_callback, font_size=self.font_size,
+                                             page_size=self.page_size)
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    code = f.read()
-                    lexer = guess_lexer_for_filename(file, code)
-                    formatter = HtmlFormatter(style='colorful', cssclass='custom-code-style')
-                    highlighted_code = highlight(code, lexer, formatter)
-                    combined_html += highlighted_code
-            except Exception as e:
-                combined_html += f"<p>Erro ao processar {display_path}: {html.escape(str(e))}</p>\n"
+                report_stage(progress_callback, STAGE_HIGHLIGHTING)
+                for file, highlighted_code, error in iter_highlighted(files, progress_callback, jobs, cache=cache):
+                    converter.add(file, highlighted_code, error)
+                report_stage(progress_callback, STAGE_CONVERTING)
+                return converter.finish(output_path)
+            finally:
+                converter.close()
 
-            if progress_callback:
-                progress_callback(i, len(files))
+    @staticmethod
+    def write_indented_html(stream, files, path, progress_callback=None, jobs=None, cache=None):
+        """
+        Escreve o documento HTML completo do modo indentado, um arquivo por vez.
 
-        pdfkit.from_string(combined_html, output_path)
\ No newline at end of file
+        Args:
+            stream: Arquivo de texto aberto para escrita
+            files: Arquivos a incluir
+            path: Pasta base do projeto
+            progress_callback: Função chamada com (concluídos, total) a cada arquivo destacado
+            jobs: Número de processos do estágio de destaque de sintaxe
+            cache: ContentCache dos trechos destacados (None desativa o cache)
+        """
+        stream.write(html_head())
+        for file, highlighted_code, error in iter_highlighted(files, progress_callback, jobs, cache=cache):
+            # Obtém o caminho relativo
+            display_path = display_path_for(file, path)
+            stream.write(html_fragment(display_path, highlighted_code, error))
+        stream.write(HTML_TAIL)
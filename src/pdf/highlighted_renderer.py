@@ -0,0 +1,273 @@
+from typing import Dict, List, Tuple
+
+from pygments.lexers import TextLexer
+from pygments.styles import get_style_by_name
+from pygments.token import Token
+from pygments.util import ClassNotFound
+from reportlab.lib.colors import HexColor, black
+from reportlab.lib.rl_accel import escapePDF, fp_str
+from reportlab.pdfbase import pdfmetrics
+
+from src.config.settings import PAGE_SIZE, DEFAULT_FONT_SIZE, HIGHLIGHT_STYLE
+from src.pdf.canvas_renderer import (BOTTOM_MARGIN, CODE_FONT, LEFT_MARGIN, TAB_SIZE, CanvasTextRenderer,
+                                     _PageLayout)
+from src.pdf.lexer_resolver import LexerResolver
+
+# Variantes da Courier: mesma largura de caractere, então a diagramação não muda
+_CODE_FONTS = {
+    (False, False): 'Courier',
+    (True, False): 'Courier-Bold',
+    (False, True): 'Courier-Oblique',
+    (True, True): 'Courier-BoldOblique',
+}
+
+Run = Tuple[Tuple[str, object], str]  # ((fonte, cor), texto)
+
+
+class HighlightedCanvasRenderer(CanvasTextRenderer):
+    """
+    Motor com destaque de sintaxe desenhado direto no canvas.
+    Os tokens do Pygments viram trechos coloridos na mesma grade monoespaçada
+    do texto simples, sem gerar HTML nem depender do wkhtmltopdf.
+    """
+
+    def __init__(self, font_size: int = DEFAULT_FONT_SIZE, page_size=PAGE_SIZE, style: str = HIGHLIGHT_STYLE):
+        """
+        Inicializa o motor.
+
+        Args:
+            font_size: Tamanho da fonte do código
+            page_size: Tamanho da página (largura, altura)
+            style: Nome do estilo de cores do Pygments
+        """
+        super().__init__(font_size, page_size)
+        self.style = get_style_by_name(style)
+        self.resolver = LexerResolver(stripnl=False, ensurenl=False)
+        self._text_lexer = TextLexer(stripnl=False, ensurenl=False)
+        self._token_styles: Dict[object, Tuple[str, object]] = {}
+
+    def _token_style(self, token_type) -> Tuple[str, object]:
+        """Fonte e cor de um tipo de token (calculadas uma vez por tipo)"""
+        token_style = self._token_styles.get(token_type)
+        if token_style is None:
+            definition = self.style.style_for_token(token_type)
+            color = HexColor('#' + definition['color']) if definition['color'] else black
+            token_style = (_CODE_FONTS[bool(definition['bold']), bool(definition['italic'])], color)
+            self._token_styles[token_type] = token_style
+        return token_style
+
+    def read_rows(self, file: str) -> List[List[Run]]:
+        """
+        Lê o arquivo, separa os tokens e os diagrama em linhas de largura fixa.
+
+        Args:
+            file: Caminho do arquivo
+
+        Returns:
+            list: Linhas, cada uma uma lista de trechos ((fonte, cor), texto)
+        """
+        with open(file, 'r', encoding='utf-8') as f:
+            code = f.read().expandtabs(TAB_SIZE)
+
+        try:
+            lexer = self.resolver.resolve(file, code)
+        except ClassNotFound:
+            lexer = self._text_lexer
+
+        # Une tokens vizinhos do mesmo estilo; espaços não têm cor visível e
+        # entram no trecho atual, o que reduz as trocas de fonte e cor
+        runs = []
+        current = self._token_style(Token.Text)  # Espaços no início do arquivo ficam no estilo do texto
+        pending = []
+        token_styles = self._token_styles
+        for token_type, value in lexer.get_tokens(code):
+            token_style = token_styles.get(token_type) or self._token_style(token_type)
+            if token_style is not current and not value.isspace():
+                if pending:
+                    runs.append((current, ''.join(pending)))
+                    pending = []
+                current = token_style
+            pending.append(value)
+        if pending:
+            runs.append((current, ''.join(pending)))
+
+        columns = self.columns
+        rows = []
+        row = []
+        width = 0
+        for token_style, value in runs:
+            for index, piece in enumerate(value.split('\n')):
+                if index:
+                    rows.append(row)
+                    row = []
+                    width = 0
+                while piece:
+                    if width == columns:
+                        rows.append(row)
+                        row = []
+                        width = 0
+                    take = piece[:columns - width]
+                    row.append((token_style, take))
+                    width += len(take)
+                    piece = piece[len(take):]
+        if row:
+            rows.append(row)
+        return rows
+
+    def _new_layout(self, pdf):
+        """Cria o estado de diagramação com suporte a trechos coloridos"""
+        return _HighlightedLayout(self, pdf)
+
+    def _draw_file(self, layout, file: str) -> int:
+        """Desenha o código destacado de um arquivo e retorna o número de linhas diagramadas"""
+        rows = self.read_rows(file)
+        layout.draw_rows(rows)
+        return len(rows)
+
+
+def _raw_text_access(pdf, text_object):
+    """
+    Acesso aos internos do reportlab usados para montar os operadores direto.
+
+    São a lista de operadores do bloco de texto (PDFTextObject._code) e o
+    registro de fontes do documento (PDFDocument.getInternalFontName),
+    estáveis nas versões 3.x e 4.x. Se uma versão futura os remover, a
+    diagramação segue pela API pública do TextObject.
+
+    Args:
+        pdf: Canvas em uso
+        text_object: Bloco de texto recém-criado
+
+    Returns:
+        tuple: (lista de operadores, função nome da fonte -> nome interno), ou None
+    """
+    code = getattr(text_object, '_code', None)
+    internal_font_name = getattr(getattr(pdf, '_doc', None), 'getInternalFontName', None)
+    if not isinstance(code, list) or internal_font_name is None:
+        return None
+    return code, internal_font_name
+
+
+class _HighlightedLayout(_PageLayout):
+    """
+    Diagramação com trechos coloridos por linha.
+
+    Os operadores PDF de cada linha são montados diretamente: com a fonte
+    monoespaçada não é preciso medir cada trecho, e a troca de fonte e cor é
+    pré-formatada uma vez por estilo. Trechos fora da codificação da Courier
+    são divididos entre as fontes de substituição, como o reportlab faz.
+    """
+
+    def __init__(self, renderer, pdf):
+        super().__init__(renderer, pdf)
+        self._fonts = {}
+        self._colors = {}
+
+    def _font_operator(self, font: str, internal_font_name) -> str:
+        """Operador de troca de fonte (registra a fonte no documento)"""
+        operator = self._fonts.get(font)
+        if operator is None:
+            renderer = self.renderer
+            operator = (f"{internal_font_name(font)} {fp_str(renderer.font_size)} Tf "
+                        f"{fp_str(renderer.leading)} TL ")
+            self._fonts[font] = operator
+        return operator
+
+    def _color_operator(self, color) -> str:
+        """Operador de cor de preenchimento"""
+        operator = self._colors.get(color)
+        if operator is None:
+            operator = f"{fp_str(color.red, color.green, color.blue)} rg "
+            self._colors[color] = operator
+        return operator
+
+    def _text_operators(self, font: str, text: str, internal_font_name) -> str:
+        """
+        Operadores que mostram um trecho na fonte atual.
+
+        Caracteres fora da cp1252 vão para as fontes de substituição da
+        Courier (Symbol, ZapfDingbats) e a fonte do trecho é restaurada ao final,
+        sem tocar no estado do bloco de texto.
+        """
+        try:
+            return f"({escapePDF(text.encode('cp1252'))}) Tj "
+        except UnicodeEncodeError:
+            pass
+        base = pdfmetrics.getFont(font)
+        current = base
+        operators = []
+        for used, encoded in pdfmetrics.unicode2T1(text, [base] + base.substitutionFonts):
+            if used is not current:
+                operators.append(self._font_operator(used.fontName, internal_font_name))
+                current = used
+            operators.append(f"({escapePDF(encoded)}) Tj ")
+        if current is not base:
+            operators.append(self._font_operator(font, internal_font_name))
+        return ''.join(operators)
+
+    def draw_rows(self, rows: List[List[Run]]) -> None:
+        """
+        Desenha as linhas destacadas, quebrando páginas quando necessário.
+
+        Args:
+            rows: Linhas já diagramadas na largura da página
+        """
+        renderer = self.renderer
+        leading = renderer.leading
+        font_size = renderer.font_size
+        start = 0
+        while start < len(rows):
+            capacity = int((self.y - BOTTOM_MARGIN) // leading)
+            if capacity <= 0:
+                self._new_page()
+                continue
+
+            chunk = rows[start:start + capacity]
+            text_object = self.pdf.beginText(LEFT_MARGIN, self.y - font_size)
+            text_object.setFont(CODE_FONT, font_size, leading)
+            raw = _raw_text_access(self.pdf, text_object)
+            if raw is None:
+                self._write_public(text_object, chunk)
+            else:
+                self._write_raw(chunk, *raw)
+            # A cor de preenchimento vale além do bloco de texto; o cabeçalho seguinte volta ao preto
+            self.pdf.saveState()
+            self.pdf.drawText(text_object)
+            self.pdf.restoreState()
+
+            self.y -= len(chunk) * leading
+            self.page_has_content = True
+            start += len(chunk)
+
+    def _write_raw(self, chunk: List[List[Run]], code: List[str], internal_font_name) -> None:
+        """Acrescenta os operadores das linhas direto ao bloco de texto"""
+        font = CODE_FONT
+        color = None
+        for row in chunk:
+            operators = []
+            for (run_font, run_color), text in row:
+                if run_font != font:
+                    operators.append(self._font_operator(run_font, internal_font_name))
+                    font = run_font
+                if run_color is not color:
+                    operators.append(self._color_operator(run_color))
+                    color = run_color
+                operators.append(self._text_operators(font, text, internal_font_name))
+            operators.append('T*')
+            code.append(''.join(operators))
+
+    def _write_public(self, text_object, chunk: List[List[Run]]) -> None:
+        """Escreve as linhas pela API pública do TextObject (mais lenta, mesmo resultado)"""
+        renderer = self.renderer
+        font = CODE_FONT
+        color = None
+        for row in chunk:
+            for (run_font, run_color), text in row:
+                if run_font != font:
+                    text_object.setFont(run_font, renderer.font_size, renderer.leading)
+                    font = run_font
+                if run_color is not color:
+                    text_object.setFillColor(run_color)
+                    color = run_color
+                text_object.textOut(text)
+            text_object.textLine()
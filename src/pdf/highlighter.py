@@ -0,0 +1,286 @@
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import pygments
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+
+from src.config.settings import (PDF_JOBS, PARALLEL_MIN_BYTES, HIGHLIGHT_STYLE, HIGHLIGHT_CSS_CLASS,
+                                 HIGHLIGHT_CHUNK_BYTES, HIGHLIGHT_SPLIT_BYTES)
+from src.core.content_cache import ContentCache, content_key
+from src.core.progress import report_file
+from src.pdf.lexer_resolver import LexerResolver
+from src.pdf.parallel import file_sizes
+
+_CACHE_FORMAT = 'highlight-v1'  # Alterar invalida as entradas gravadas por versões anteriores
+
+# Linha em branco seguida de uma linha sem indentação: provável início de
+# uma declaração de nível superior, onde o lexer não carrega estado
+_TOP_LEVEL_BOUNDARY = re.compile(r'\n\n(?=\S)')
+
+_formatter = None
+_resolver = None
+
+
+def _get_formatter() -> HtmlFormatter:
+    """Retorna o formatador do processo atual (criado uma única vez)"""
+    global _formatter
+    if _formatter is None:
+        _formatter = HtmlFormatter(style=HIGHLIGHT_STYLE, nowrap=True)
+    return _formatter
+
+
+def _get_resolver() -> LexerResolver:
+    """Retorna o resolvedor de lexers do processo atual (criado uma única vez)"""
+    global _resolver
+    if _resolver is None:
+        # As pontas do código já são removidas antes da divisão em segmentos
+        _resolver = LexerResolver(stripnl=False)
+    return _resolver
+
+
+def _lexer_identity(lexer_class) -> str:
+    """Nome estável da classe do lexer, usado na chave do cache"""
+    return f'{lexer_class.__module__}.{lexer_class.__qualname__}'
+
+
+def wrap_fragment(body: str) -> str:
+    """
+    Envolve o código destacado no bloco que o HtmlFormatter produziria.
+
+    Args:
+        body: Spans gerados pelo formatador (opção nowrap)
+
+    Returns:
+        str: Bloco <div><pre> completo
+    """
+    return f'<div class="{HIGHLIGHT_CSS_CLASS}"><pre><span></span>{body}</pre></div>\n'
+
+
+def stylesheet() -> str:
+    """
+    Retorna as regras CSS das classes de token geradas pelo formatador.
+
+    Returns:
+        str: Folha de estilos restrita aos blocos de código
+    """
+    return HtmlFormatter(style=HIGHLIGHT_STYLE).get_style_defs(f'.{HIGHLIGHT_CSS_CLASS}')
+
+
+def split_code(code: str, segment_size: int = HIGHLIGHT_SPLIT_BYTES) -> List[str]:
+    """
+    Divide um código grande em segmentos terminados em fim de linha.
+
+    Procura primeiro uma linha em branco seguida de código sem indentação,
+    onde cortar não muda o resultado do lexer na prática; sem isso, corta
+    na primeira quebra de linha após o tamanho alvo.
+
+    Args:
+        code: Conteúdo do arquivo
+        segment_size: Tamanho aproximado de cada segmento em caracteres
+
+    Returns:
+        list: Segmentos cuja concatenação é o código original
+    """
+    segments = []
+    start = 0
+    while len(code) - start > segment_size:
+        target = start + segment_size
+        limit = min(len(code), target + segment_size // 2)
+        match = _TOP_LEVEL_BOUNDARY.search(code, target, limit)
+        if match:
+            cut = match.end()
+        else:
+            newline = code.find('\n', target)
+            if newline == -1:
+                break
+            cut = newline + 1
+        segments.append(code[start:cut])
+        start = cut
+    if start < len(code) or not segments:
+        segments.append(code[start:])
+    return segments
+
+
+def _read_code(file: str) -> str:
+    """Lê o arquivo já removendo as quebras de linha das pontas, como o lexer faria"""
+    with open(file, 'r', encoding='utf-8') as f:
+        return f.read().strip('\n')
+
+
+def highlight_cache_key(lexer_identity: str, text: str) -> str:
+    """
+    Chave do trecho destacado: conteúdo mais tudo que altera o HTML gerado.
+
+    Args:
+        lexer_identity: Nome completo da classe do lexer
+        text: Código a destacar
+
+    Returns:
+        str: Chave do cache
+    """
+    return content_key(_CACHE_FORMAT, pygments.__version__, HIGHLIGHT_STYLE, 'nowrap', lexer_identity, text)
+
+
+def _highlight_chunk(units, cache: Optional[ContentCache] = None):
+    """
+    Destaca uma unidade de trabalho no processo trabalhador.
+
+    Cada item é (índice do arquivo, índice do segmento, arquivo, texto, classe do
+    lexer); texto None indica um arquivo pequeno, lido e resolvido aqui mesmo.
+    O último campo de cada resultado indica se veio do cache (None sem cache).
+    """
+    formatter = _get_formatter()
+    resolver = _get_resolver()
+    results = []
+    for file_index, segment_index, file, text, lexer_class in units:
+        try:
+            if text is None:
+                text = _read_code(file)
+                lexer = resolver.resolve(file, text)
+            else:
+                lexer = lexer_class(stripnl=False)
+
+            key = highlight_cache_key(_lexer_identity(type(lexer)), text) if cache is not None else None
+            body = cache.get(key) if cache is not None else None
+            if body is not None:
+                results.append((file_index, segment_index, body, None, True))
+                continue
+
+            body = highlight(text, lexer, formatter)
+            if cache is not None:
+                cache.put(key, body)
+            results.append((file_index, segment_index, body, None, False if cache is not None else None))
+        except Exception as e:
+            results.append((file_index, segment_index, None, str(e), None))
+    return results
+
+
+def _plan(files: List[str], sizes: List[int]):
+    """Monta as unidades de trabalho, dividindo os arquivos grandes"""
+    units = []
+    segment_counts = []
+    errors = {}
+    for file_index, (file, size) in enumerate(zip(files, sizes)):
+        if size <= HIGHLIGHT_SPLIT_BYTES:
+            units.append(((file_index, 0, file, None, None), size))
+            segment_counts.append(1)
+            continue
+        try:
+            segments = split_code(_read_code(file), HIGHLIGHT_SPLIT_BYTES)
+            # Resolve o lexer uma vez pelo primeiro segmento; todos usam o mesmo
+            lexer_class = type(_get_resolver().resolve(file, segments[0]))
+        except Exception as e:
+            errors[file_index] = str(e)
+            segment_counts.append(0)
+            continue
+        for segment_index, segment in enumerate(segments):
+            units.append(((file_index, segment_index, file, segment, lexer_class), len(segment)))
+        segment_counts.append(len(segments))
+    return units, segment_counts, errors
+
+
+def _chunk_units(units, chunk_bytes: int):
+    """Agrupa unidades consecutivas até o tamanho alvo"""
+    chunks = []
+    current = []
+    current_size = 0
+    for unit, size in units:
+        current.append(unit)
+        current_size += size
+        if current_size >= chunk_bytes:
+            chunks.append(current)
+            current = []
+            current_size = 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _run_in_pool(chunks, jobs: int, cache: Optional[ContentCache]):
+    """Executa os lotes no pool de processos, entregando-os conforme terminam"""
+    executor = ProcessPoolExecutor(max_workers=min(jobs, len(chunks)))
+    try:
+        futures = [executor.submit(_highlight_chunk, chunk, cache) for chunk in chunks]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_highlighted(
+        files: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        jobs: Optional[int] = None,
+        min_bytes: int = PARALLEL_MIN_BYTES,
+        cache: Optional[ContentCache] = None
+) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Destaca a sintaxe dos arquivos, em paralelo quando a entrada é grande.
+
+    Os resultados são entregues na ordem da seleção, à medida que ficam
+    prontos, para que o HTML possa ser montado sem esperar o fim do estágio.
+
+    Args:
+        files: Arquivos na ordem do documento
+        progress_callback: Função chamada com (concluídos, total) a cada arquivo concluído
+        jobs: Número de processos (padrão: PDF_JOBS)
+        min_bytes: Tamanho total mínimo para usar o pool
+        cache: Cache de trechos destacados; arquivos inalterados não passam
+            pelo Pygments. Os acertos e faltas são somados em cache.hits/misses
+
+    Yields:
+        tuple: (arquivo, bloco HTML destacado ou None, mensagem de erro ou None)
+    """
+    jobs = PDF_JOBS if jobs is None else max(1, jobs)
+    sizes = file_sizes(files)  # Erros de leitura são relatados pelo trabalhador
+    units, segment_counts, errors = _plan(files, sizes)
+    chunks = _chunk_units(units, HIGHLIGHT_CHUNK_BYTES)
+    if jobs > 1 and len(chunks) > 1 and sum(sizes) >= min_bytes:
+        results = _run_in_pool(chunks, jobs, cache)
+    else:
+        results = (_highlight_chunk(chunk, cache) for chunk in chunks)
+
+    total = len(files)
+    fragments = [[None] * count for count in segment_counts]
+    remaining = list(segment_counts)
+    finished = {index: (None, error) for index, error in errors.items()}
+    done = 0
+    next_index = 0
+    stored = False
+
+    def flush():
+        nonlocal next_index
+        while next_index < total and next_index in finished:
+            body, error = finished.pop(next_index)
+            yield files[next_index], body, error
+            next_index += 1
+
+    for index in errors:
+        done += 1
+        report_file(progress_callback, index, done, total)
+    yield from flush()
+
+    for chunk_results in results:
+        for file_index, segment_index, body, error, hit in chunk_results:
+            if hit is not None:
+                cache.record(hit)
+                stored = stored or not hit
+            if fragments[file_index] is None:
+                continue  # Outro segmento do mesmo arquivo já falhou
+            if error is not None:
+                finished[file_index] = (None, error)
+            else:
+                fragments[file_index][segment_index] = body
+                remaining[file_index] -= 1
+                if remaining[file_index]:
+                    continue
+                finished[file_index] = (wrap_fragment(''.join(fragments[file_index])), None)
+            fragments[file_index] = None
+            done += 1
+            report_file(progress_callback, file_index, done, total)
+        yield from flush()
+
+    if stored:
+        cache.evict()
@@ -0,0 +1,393 @@
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+import pygments
+
+from src.config.settings import (PAGE_SIZE, DEFAULT_FONT_SIZE, PDF_JOBS, PARALLEL_MIN_BYTES, SHARDS_PER_JOB,
+                                 HIGHLIGHT_STYLE, INDENTED_CHUNK_BYTES, WKHTMLTOPDF_JOBS, WKHTMLTOPDF_RETRIES)
+from src.core.content_cache import ContentCache, content_key
+from src.core.progress import (STAGE_MERGING, STAGE_RENDERING, report_checkpoint, report_file, report_pages,
+                               report_stage)
+from src.pdf.canvas_renderer import CanvasTextRenderer, display_path_for
+from src.pdf.highlighter import iter_highlighted
+from src.pdf.parallel import file_sizes, shard_by_size, should_render_in_parallel
+from src.pdf.wkhtml import HTML_TAIL, convert_html, html_fragment, html_head
+
+logger = logging.getLogger(__name__)
+
+_FRAGMENT_FORMAT = 'fragmento-v1'  # Alterar invalida os fragmentos gravados por versões anteriores
+
+# Arquivos da geração -> PDF de cada um, e as partes que falharam (arquivos, erro)
+FragmentResult = Tuple[Dict[str, str], List[Tuple[List[str], str]]]
+
+
+class _FragmentReport:
+    """Guarda as linhas e páginas informadas pelo motor ao renderizar um fragmento"""
+
+    def __init__(self):
+        self.lines = 0
+        self.pages = 0
+
+    def file_done(self, index, lines=0, pages=0):
+        self.lines = lines
+        self.pages = pages + 1  # O fragmento é um documento próprio: a última página também conta
+
+
+def _render_fragments(renderer_class, files, outputs, path, font_size, page_size, first_index=0):
+    """
+    Renderiza cada arquivo em um PDF próprio (executado no processo trabalhador).
+
+    Returns:
+        list: Tuplas (índice, linhas, páginas) de cada arquivo, com os índices a partir de first_index
+    """
+    renderer = renderer_class(font_size, page_size)
+    reports = []
+    for index, (file, output) in enumerate(zip(files, outputs), first_index):
+        report = _FragmentReport()
+        renderer.render([file], path, output, report)
+        reports.append((index, report.lines, report.pages))
+    return reports
+
+
+class CanvasFragments:
+    """Gera os fragmentos de um arquivo por PDF com um motor de canvas"""
+
+    def __init__(
+            self,
+            renderer_class: Type[CanvasTextRenderer] = CanvasTextRenderer,
+            font_size: int = DEFAULT_FONT_SIZE,
+            page_size=PAGE_SIZE,
+            jobs: Optional[int] = None
+    ):
+        """
+        Inicializa o gerador de fragmentos.
+
+        Args:
+            renderer_class: Motor de canvas (texto simples ou destacado)
+            font_size: Tamanho da fonte do código
+            page_size: Tamanho da página
+            jobs: Número de processos (padrão: PDF_JOBS)
+        """
+        self.renderer_class = renderer_class
+        self.font_size = font_size
+        self.page_size = page_size
+        self.jobs = PDF_JOBS if jobs is None else max(1, jobs)
+        self.mode = renderer_class.__name__
+        self.settings = f"{font_size}|{tuple(page_size)}|{pygments.__version__}|{HIGHLIGHT_STYLE}"
+
+    def render(self, files: List[str], path: str, temp_dir: str, progress_callback=None) -> FragmentResult:
+        """
+        Renderiza cada arquivo em um PDF próprio.
+
+        Args:
+            files: Arquivos a renderizar
+            path: Pasta base do projeto
+            temp_dir: Pasta onde os PDFs são criados
+            progress_callback: Objeto com file_done(índice em files, linhas, páginas),
+                chamado a cada arquivo concluído
+
+        Returns:
+            tuple: (arquivo -> PDF, partes que falharam)
+        """
+        outputs = {file: os.path.join(temp_dir, f"fragmento_{i:06d}.pdf") for i, file in enumerate(files)}
+        sizes = file_sizes(files)
+        if not should_render_in_parallel(sizes, self.jobs, PARALLEL_MIN_BYTES):
+            for index, file in enumerate(files):
+                reports = _render_fragments(self.renderer_class, [file], [outputs[file]], path,
+                                            self.font_size, self.page_size, index)
+                self._forward(progress_callback, reports)
+            return outputs, []
+
+        shards = shard_by_size(files, sizes, self.jobs * SHARDS_PER_JOB)
+        executor = ProcessPoolExecutor(max_workers=min(self.jobs, len(shards)))
+        try:
+            futures = []
+            first_index = 0
+            for shard in shards:
+                futures.append(executor.submit(_render_fragments, self.renderer_class, shard,
+                                               [outputs[f] for f in shard], path, self.font_size, self.page_size,
+                                               first_index))
+                first_index += len(shard)
+            for future in as_completed(futures):
+                self._forward(progress_callback, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)  # Não espera as partes pendentes se interrompido
+        return outputs, []
+
+    @staticmethod
+    def _forward(progress_callback, reports: List[Tuple[int, int, int]]) -> None:
+        """Repassa os arquivos concluídos de uma parte"""
+        if progress_callback is not None:
+            for index, lines, pages in reports:
+                progress_callback.file_done(index, lines, pages)
+
+
+class IndentedFragments:
+    """
+    Gera os fragmentos do modo indentado. Os arquivos alterados são
+    convertidos em partes, como na geração completa, com cada arquivo
+    começando em uma nova página; cada parte é depois dividida nos PDFs
+    de cada arquivo pelas entradas do sumário criadas pelo wkhtmltopdf.
+    """
+
+    def __init__(self, jobs: Optional[int] = None, highlight_cache: Optional[ContentCache] = None,
+                 chunk_bytes: int = INDENTED_CHUNK_BYTES, font_size: int = DEFAULT_FONT_SIZE, page_size=PAGE_SIZE):
+        """
+        Inicializa o gerador de fragmentos.
+
+        Args:
+            jobs: Número de processos do destaque e do wkhtmltopdf
+            highlight_cache: Cache dos trechos destacados
+            chunk_bytes: Tamanho alvo de HTML de cada parte
+            font_size: Tamanho da fonte das partes geradas em texto simples
+            page_size: Tamanho da página das partes geradas em texto simples
+        """
+        self.jobs = jobs
+        self.font_size = font_size
+        self.page_size = page_size
+        self.highlight_cache = highlight_cache
+        self.chunk_bytes = chunk_bytes
+        self.mode = 'wkhtmltopdf'
+        self.settings = f"{pygments.__version__}|{HIGHLIGHT_STYLE}"
+
+    def render(self, files: List[str], path: str, temp_dir: str, progress_callback=None) -> FragmentResult:
+        """
+        Converte cada arquivo em um PDF próprio.
+
+        Args:
+            files: Arquivos a converter
+            path: Pasta base do projeto
+            temp_dir: Pasta onde os PDFs são criados
+            progress_callback: Objeto com file_done(índice em files, linhas, páginas),
+                chamado a cada arquivo destacado, e add_pages(páginas) a cada parte dividida
+
+        Returns:
+            tuple: (arquivo -> PDF, partes que falharam e foram geradas em texto simples)
+        """
+        chunks = []
+        failures = []
+        outputs = {}
+        highlighted = iter_highlighted(files, progress_callback, self.jobs, cache=self.highlight_cache)
+        executor = ThreadPoolExecutor(max_workers=max(1, self.jobs or WKHTMLTOPDF_JOBS))
+        try:
+            stream = None
+            size = 0
+            for file, highlighted_code, error in highlighted:
+                if stream is None:
+                    html_path = os.path.join(temp_dir, f"parte_{len(chunks):05d}.html")
+                    stream = open(html_path, 'w', encoding='utf-8')
+                    stream.write(html_head(page_per_file=True))
+                    chunk_files = []
+                    size = 0
+                fragment = html_fragment(display_path_for(file, path), highlighted_code, error)
+                stream.write(fragment)
+                chunk_files.append(file)
+                size += len(fragment)
+                if size >= self.chunk_bytes:
+                    stream.write(HTML_TAIL)
+                    stream.close()
+                    stream = None
+                    chunks.append(self._submit(executor, html_path, chunk_files))
+            if stream is not None:
+                stream.write(HTML_TAIL)
+                stream.close()
+                chunks.append(self._submit(executor, html_path, chunk_files))
+
+            last_error = None
+            failed_chunks = []
+            for future, pdf_path, chunk_files in chunks:
+                report_checkpoint(progress_callback)
+                try:
+                    future.result()
+                    split, pages = self._split(pdf_path, chunk_files)
+                    outputs.update(split)
+                    report_pages(progress_callback, pages)
+                except (OSError, ValueError) as e:
+                    last_error = e
+                    failures.append((chunk_files, str(e)))
+                    logger.warning("Parte com %d arquivo(s) gerada em texto simples: %s", len(chunk_files), e)
+                    failed_chunks.append((pdf_path, chunk_files))
+
+            # Sem nenhuma parte convertida, falha antes de gerar o texto simples
+            if chunks and len(failures) == len(chunks):
+                raise last_error
+
+            renderer = CanvasTextRenderer(self.font_size, self.page_size)
+            for pdf_path, chunk_files in failed_chunks:
+                for index, file in enumerate(chunk_files):
+                    report_checkpoint(progress_callback)
+                    output = pdf_path[:-len('.pdf')] + f"_{index:06d}.pdf"
+                    report = _FragmentReport()
+                    renderer.render([file], path, output, report)
+                    report_pages(progress_callback, report.pages)
+                    outputs[file] = output
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)  # Não converte as partes na fila se interrompido
+
+        return outputs, failures
+
+    @staticmethod
+    def _submit(executor, html_path: str, files: List[str]):
+        """Agenda a conversão de uma parte"""
+        pdf_path = html_path[:-len('.html')] + '.pdf'
+        return executor.submit(convert_html, html_path, pdf_path, WKHTMLTOPDF_RETRIES), pdf_path, files
+
+    @staticmethod
+    def _split(pdf_path: str, files: List[str]) -> Tuple[Dict[str, str], int]:
+        """
+        Divide o PDF de uma parte em um PDF por arquivo, pelas entradas de nível 1 do sumário.
+
+        Returns:
+            tuple: (arquivo -> PDF, páginas da parte)
+        """
+        from pypdf import PdfReader, PdfWriter
+
+        reader = PdfReader(pdf_path)
+        starts = [reader.get_destination_page_number(item) for item in reader.outline if not isinstance(item, list)]
+        if len(starts) != len(files):
+            raise ValueError(f"sumário com {len(starts)} entradas para {len(files)} arquivos")
+
+        outputs = {}
+        ends = starts[1:] + [len(reader.pages)]
+        for index, (file, start, end) in enumerate(zip(files, starts, ends)):
+            writer = PdfWriter()
+            for page in reader.pages[start:max(end, start + 1)]:
+                writer.add_page(page)
+            output = pdf_path[:-len('.pdf')] + f"_{index:06d}.pdf"
+            with open(output, 'wb') as f:
+                writer.write(f)
+            outputs[file] = output
+        return outputs, len(reader.pages)
+
+
+class _FragmentReporter:
+    """
+    Repassa o progresso dos fragmentos ao callback da geração, traduzindo a
+    posição entre os arquivos renderizados para a posição na lista completa.
+    """
+
+    def __init__(self, progress_callback, indices: List[int], done: int, total: int):
+        """
+        Inicializa o repasse.
+
+        Args:
+            progress_callback: Callback recebido pela geração (ou None)
+            indices: Posição na lista completa de cada arquivo renderizado
+            done: Arquivos já concluídos (reaproveitados do cache)
+            total: Total de arquivos da geração
+        """
+        self.progress_callback = progress_callback
+        self.checkpoint = getattr(progress_callback, 'checkpoint', None)
+        self.indices = indices
+        self.done = done
+        self.total = total
+
+    def file_done(self, index, lines=0, pages=0):
+        self.done += 1
+        report_file(self.progress_callback, self.indices[index], self.done, self.total, lines, pages)
+
+    def add_pages(self, count):
+        report_pages(self.progress_callback, count)
+
+
+class IncrementalBuilder:
+    """
+    Geração incremental: as páginas de cada arquivo ficam em cache, com
+    chave formada pelo caminho exibido, pelo conteúdo e pelas configurações
+    de renderização. Só os arquivos novos ou alterados são renderizados; os
+    demais são reaproveitados e tudo é costurado no PDF final, com o sumário
+    refeito a partir das páginas iniciais de cada arquivo.
+    """
+
+    def __init__(self, fragments, cache: ContentCache):
+        """
+        Inicializa o construtor.
+
+        Args:
+            fragments: CanvasFragments ou IndentedFragments
+            cache: Cache dos PDFs de cada arquivo
+        """
+        self.fragments = fragments
+        self.cache = cache
+
+    def _key(self, file: str, path: str) -> Optional[str]:
+        """Chave do fragmento, ou None se o arquivo não pôde ser lido (sempre renderizado)"""
+        try:
+            with open(file, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        return content_key(_FRAGMENT_FORMAT, self.fragments.mode, self.fragments.settings,
+                           display_path_for(file, path), content)
+
+    def build(
+            self,
+            files: List[str],
+            path: str,
+            output_path: str,
+            progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Tuple[List[str], str]]:
+        """
+        Gera o PDF reaproveitando os fragmentos em cache.
+
+        Args:
+            files: Arquivos a incluir
+            path: Pasta base do projeto
+            output_path: Caminho do PDF gerado
+            progress_callback: Função chamada com (concluídos, total), ou ProgressTracker
+
+        Returns:
+            list: Partes que falharam na conversão, como em generate_indented_pdf
+        """
+        from pypdf import PdfWriter
+
+        total = len(files)
+        done = 0
+        missing_indices = []
+
+        report_stage(progress_callback, STAGE_RENDERING)
+        keys = [self._key(file, path) for file in files]
+        cached = {}
+        missing = []
+        for index, (file, key) in enumerate(zip(files, keys)):
+            cached_path = self.cache.get_file(key) if key is not None else None
+            self.cache.record(cached_path is not None)
+            if cached_path is None:
+                missing.append(file)
+                missing_indices.append(index)
+            else:
+                cached[file] = cached_path
+        for index, file in enumerate(files):
+            if file in cached:
+                done += 1
+                report_file(progress_callback, index, done, total)
+
+        with tempfile.TemporaryDirectory(prefix='sctpdf-') as temp_dir:
+            reporter = _FragmentReporter(progress_callback, missing_indices, done, total)
+            fresh, failures = self.fragments.render(missing, path, temp_dir, reporter) if missing else ({}, [])
+            failed = {file for failed_files, _ in failures for file in failed_files}
+            for file, key in zip(files, keys):
+                if file in fresh and key is not None and file not in failed:
+                    self.cache.put_file(key, fresh[file])
+
+            report_stage(progress_callback, STAGE_MERGING)
+            writer = PdfWriter()
+            for file in files:
+                start = len(writer.pages)
+                try:
+                    writer.append(fresh.get(file) or cached[file], import_outline=False)
+                except FileNotFoundError:
+                    # Removido do cache por outro processo entre a consulta e a costura
+                    extra, _ = self.fragments.render([file], path, tempfile.mkdtemp(dir=temp_dir))
+                    writer.append(extra[file], import_outline=False)
+                writer.add_outline_item(display_path_for(file, path), start)
+            with open(output_path, 'wb') as f:
+                writer.write(f)
+            writer.close()
+
+        if missing:
+            self.cache.evict()
+        return failures
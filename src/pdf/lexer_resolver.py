@@ -0,0 +1,64 @@
+import os
+from typing import Dict, Mapping
+
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name, guess_lexer_for_filename
+
+from src.config.settings import EXTENSION_LEXERS, LEXER_GUESS_BYTES
+
+
+class LexerResolver:
+    """
+    Resolve o lexer de cada arquivo pela extensão, com uma tabela montada
+    uma vez por execução. Só nomes fora da tabela caem na adivinhação do
+    Pygments, e mesmo assim analisando apenas o início do arquivo.
+    """
+
+    def __init__(
+            self,
+            extension_lexers: Mapping[str, str] = EXTENSION_LEXERS,
+            guess_bytes: int = LEXER_GUESS_BYTES,
+            **options
+    ):
+        """
+        Inicializa o resolvedor.
+
+        Args:
+            extension_lexers: Extensão (sem ponto) -> alias do lexer no Pygments
+            guess_bytes: Caracteres do início do arquivo usados na adivinhação
+            options: Opções repassadas a cada lexer criado (ex.: stripnl=False)
+        """
+        self.extension_lexers = {extension.lower().lstrip('.'): alias
+                                 for extension, alias in extension_lexers.items()}
+        self.guess_bytes = guess_bytes
+        self.options = options
+        self._lexers: Dict[str, Lexer] = {}
+
+    def resolve(self, filename: str, text: str) -> Lexer:
+        """
+        Retorna o lexer do arquivo.
+
+        Args:
+            filename: Nome ou caminho do arquivo
+            text: Conteúdo (só o início é usado, e só na adivinhação)
+
+        Returns:
+            Lexer: Instância memoizada por extensão, ou adivinhada para nomes desconhecidos
+
+        Raises:
+            pygments.util.ClassNotFound: Se nenhum lexer corresponde ao arquivo
+        """
+        head, _, extension = os.path.basename(filename).rpartition('.')
+        extension = extension.lower() if head else ''
+
+        lexer = self._lexers.get(extension)
+        if lexer is not None:
+            return lexer
+
+        alias = self.extension_lexers.get(extension)
+        if alias is None:
+            return guess_lexer_for_filename(filename, text[:self.guess_bytes], **self.options)
+
+        lexer = get_lexer_by_name(alias, **self.options)
+        self._lexers[extension] = lexer
+        return lexer
@@ -0,0 +1,228 @@
+import logging
+import os
+import queue
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from multiprocessing import Manager
+from typing import Callable, List, Optional, Tuple, Type
+
+from src.config.settings import PAGE_SIZE, DEFAULT_FONT_SIZE, PDF_JOBS, PARALLEL_MIN_BYTES, SHARDS_PER_JOB
+from src.core.file_tree import file_sizes
+from src.core.progress import STAGE_MERGING, STAGE_RENDERING, report_file, report_stage
+from src.pdf.canvas_renderer import CanvasTextRenderer
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 0.1
+
+
+def shard_by_size(files: List[str], sizes: List[int], shard_count: int) -> List[List[str]]:
+    """
+    Divide os arquivos em partes contíguas de tamanho equilibrado em bytes.
+
+    As partes preservam a ordem original, então basta concatená-las na
+    mesma ordem para reconstruir o documento.
+
+    Args:
+        files: Arquivos na ordem do documento
+        sizes: Tamanho de cada arquivo
+        shard_count: Número desejado de partes
+
+    Returns:
+        list: Listas de arquivos, uma por parte (sem partes vazias)
+    """
+    target = sum(sizes) / max(1, shard_count)
+    shards = []
+    current = []
+    current_size = 0
+    for file, size in zip(files, sizes):
+        current.append(file)
+        current_size += size
+        if current_size >= target and len(shards) < shard_count - 1:
+            shards.append(current)
+            current = []
+            current_size = 0
+    if current:
+        shards.append(current)
+    return shards
+
+
+def merge_pdfs(parts: List[str], output_path: str) -> None:
+    """
+    Une PDFs na ordem dada, preservando o sumário (marcadores) de cada parte.
+
+    Args:
+        parts: Caminhos dos PDFs parciais
+        output_path: Caminho do PDF final
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(part)
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+    writer.close()
+
+
+class _ShardCancelled(Exception):
+    """Interrompe a parte em andamento depois que a geração foi abandonada"""
+
+
+class _ShardReporter:
+    """Callback de progresso do processo trabalhador: envia (índice, linhas, páginas) de cada arquivo"""
+
+    def __init__(self, progress_queue, cancel_event, offset):
+        self.progress_queue = progress_queue
+        self.cancel_event = cancel_event
+        self.offset = offset
+
+    def __call__(self, current, total):
+        self.file_done(current - 1)
+
+    def file_done(self, index, lines=0, pages=0):
+        if self.cancel_event.is_set():
+            raise _ShardCancelled()
+        self.progress_queue.put((self.offset + index, lines, pages))
+
+
+def _render_shard(renderer_class, files, path, output_path, font_size, page_size, first_number, progress_queue,
+                  cancel_event):
+    """Renderiza uma parte no processo trabalhador, avisando cada arquivo concluído"""
+    renderer = renderer_class(font_size, page_size)
+    reporter = _ShardReporter(progress_queue, cancel_event, first_number - 1)
+    renderer.render(files, path, output_path, reporter, first_number)
+
+
+def _drain(progress_queue) -> List[Tuple[int, int, int]]:
+    """Consome os avisos de progresso (índice, linhas, páginas) disponíveis sem bloquear"""
+    reports = []
+    while True:
+        try:
+            reports.append(progress_queue.get_nowait())
+        except queue.Empty:
+            return reports
+
+
+def count_pages(pdf_path: str) -> int:
+    """
+    Conta as páginas de um PDF.
+
+    Args:
+        pdf_path: Caminho do PDF
+
+    Returns:
+        int: Número de páginas
+    """
+    from pypdf import PdfReader
+
+    return len(PdfReader(pdf_path).pages)
+
+
+def can_merge_pdfs() -> bool:
+    """
+    Verifica se a dependência usada na união das partes está instalada.
+
+    Returns:
+        bool: True se o pypdf pode ser importado
+    """
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        logger.warning("pypdf não instalado; geração em partes desativada")
+        return False
+    return True
+
+
+def should_render_in_parallel(sizes: List[int], jobs: int, min_bytes: int = PARALLEL_MIN_BYTES) -> bool:
+    """
+    Decide se vale a pena usar o pool de processos.
+
+    Args:
+        sizes: Tamanho de cada arquivo
+        jobs: Número de processos disponíveis
+        min_bytes: Tamanho total mínimo para usar o pool
+
+    Returns:
+        bool: True se a entrada é grande o bastante para compensar o pool
+    """
+    if jobs <= 1 or len(sizes) < 2 or sum(sizes) < min_bytes:
+        return False
+    return can_merge_pdfs()
+
+
+def render_simple_parallel(
+        files: List[str],
+        path: str,
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        jobs: Optional[int] = None,
+        min_bytes: int = PARALLEL_MIN_BYTES,
+        font_size: int = DEFAULT_FONT_SIZE,
+        page_size: Tuple[float, float] = PAGE_SIZE,
+        renderer_class: Type[CanvasTextRenderer] = CanvasTextRenderer
+) -> None:
+    """
+    Gera o PDF de um motor de canvas dividindo os arquivos entre processos.
+
+    Cada parte é renderizada em um PDF temporário por um processo do pool e
+    as partes são unidas na ordem original. Entradas pequenas são
+    renderizadas no próprio processo.
+
+    Args:
+        files: Arquivos a incluir
+        path: Pasta base do projeto
+        output_path: Caminho do PDF gerado
+        progress_callback: Função chamada com (atual, total) a cada arquivo concluído,
+            ou ProgressTracker
+        jobs: Número de processos (padrão: PDF_JOBS)
+        min_bytes: Tamanho total mínimo para usar o pool
+        font_size: Tamanho da fonte do código
+        page_size: Tamanho da página
+        renderer_class: Motor de canvas usado em cada parte
+    """
+    jobs = PDF_JOBS if jobs is None else max(1, jobs)
+    sizes = file_sizes(files)
+    report_stage(progress_callback, STAGE_RENDERING)
+    if not should_render_in_parallel(sizes, jobs, min_bytes):
+        renderer_class(font_size, page_size).render(files, path, output_path, progress_callback)
+        return
+
+    shards = shard_by_size(files, sizes, jobs * SHARDS_PER_JOB)
+    total = len(files)
+
+    with tempfile.TemporaryDirectory(prefix='sctpdf-') as temp_dir, Manager() as manager:
+        progress_queue = manager.Queue()
+        cancel_event = manager.Event()
+        parts = []
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(shards)))
+        try:
+            futures = []
+            first_number = 1
+            for i, shard in enumerate(shards):
+                part = os.path.join(temp_dir, f"parte_{i:05d}.pdf")
+                parts.append(part)
+                futures.append(executor.submit(
+                    _render_shard, renderer_class, shard, path, part, font_size, page_size, first_number,
+                    progress_queue, cancel_event
+                ))
+                first_number += len(shard)
+
+            done = 0
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_EXCEPTION)
+                for future in finished:
+                    future.result()  # Propaga erros dos processos trabalhadores
+                for index, lines, pages in _drain(progress_queue):
+                    done += 1
+                    report_file(progress_callback, index, done, total, lines, pages)
+        except BaseException:
+            # Erro ou cancelamento pelo callback: as partes em andamento param no arquivo seguinte
+            cancel_event.set()
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        report_stage(progress_callback, STAGE_MERGING)
+        merge_pdfs(parts, output_path)
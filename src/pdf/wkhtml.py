@@ -0,0 +1,238 @@
+import html
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import pdfkit
+
+from src.config.settings import PAGE_SIZE, DEFAULT_FONT_SIZE, WKHTMLTOPDF_RETRIES
+from src.core.progress import report_checkpoint, report_pages
+from src.pdf.canvas_renderer import CanvasTextRenderer, display_path_for
+from src.pdf.highlighter import stylesheet
+from src.pdf.parallel import can_merge_pdfs, count_pages, merge_pdfs
+
+logger = logging.getLogger(__name__)
+
+# CSS personalizado para o estilo
+CUSTOM_CSS = """
+        <style>
+        .custom-code-style pre {
+            font-family: Courier, monospace;
+            font-size: 17pt;
+            line-height: 1.5;
+            margin: 10px 0;
+            padding: 10px;
+            background-color: #f8f8f8;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+        }
+        </style>
+        """
+
+# Cada arquivo (a partir do segundo) começa em uma nova página
+PAGE_PER_FILE_CSS = '<style>\nh1 ~ h1 { page-break-before: always; }\n</style>\n'
+
+HTML_TAIL = '</body>\n</html>\n'
+
+
+def html_head(page_per_file: bool = False) -> str:
+    """
+    Retorna o início do documento, com a folha de estilos do Pygments
+    emitida uma única vez para todos os arquivos.
+
+    Args:
+        page_per_file: Inicia cada arquivo em uma nova página
+
+    Returns:
+        str: Cabeçalho HTML até a abertura do <body>
+    """
+    return (f'<html>\n<head>\n<meta charset="utf-8">\n<style>\n{stylesheet()}\n</style>\n'
+            f'{CUSTOM_CSS}{PAGE_PER_FILE_CSS if page_per_file else ""}</head>\n<body>\n')
+
+
+def html_fragment(display_path: str, highlighted_code: Optional[str], error: Optional[str]) -> str:
+    """
+    Monta o trecho de um arquivo: título (entrada do sumário) e código destacado.
+
+    Args:
+        display_path: Caminho exibido
+        highlighted_code: Bloco HTML destacado, ou None em caso de erro
+        error: Mensagem de erro, ou None
+
+    Returns:
+        str: Trecho HTML do arquivo
+    """
+    heading = f"<h1>Arquivo: {display_path}</h1>\n"
+    if error is None:
+        return heading + highlighted_code
+    return heading + f"<p>Erro ao processar {display_path}: {html.escape(error)}</p>\n"
+
+
+def convert_html(html_path: str, pdf_path: str, retries: int = WKHTMLTOPDF_RETRIES) -> None:
+    """
+    Converte um arquivo HTML com o wkhtmltopdf, tentando novamente em caso de falha.
+
+    Args:
+        html_path: Documento HTML
+        pdf_path: PDF gerado
+        retries: Tentativas extras após a primeira falha
+
+    Raises:
+        OSError: Se todas as tentativas falharem
+    """
+    for attempt in range(retries + 1):
+        try:
+            pdfkit.from_file(html_path, pdf_path, options={'encoding': 'UTF-8'})
+            return
+        except OSError as e:
+            if attempt == retries:
+                raise
+            logger.warning("wkhtmltopdf falhou em %s (tentativa %d): %s", html_path, attempt + 1, e)
+
+
+class ChunkedHtmlConverter:
+    """
+    Divide o documento do modo indentado em partes, sempre na fronteira entre
+    arquivos, e converte cada parte em um processo wkhtmltopdf próprio
+    enquanto as seguintes ainda estão sendo escritas. As partes são unidas
+    na ordem original; os títulos <h1> viram entradas do sumário de cada
+    parte e são preservados na união.
+
+    As páginas só são conhecidas depois da conversão: se o callback de
+    progresso aceita add_pages (ProgressTracker), cada parte pronta tem as
+    páginas contadas com o pypdf, quando instalado.
+    """
+
+    def __init__(self, temp_dir: str, path: str, chunk_bytes: Optional[int], jobs: int,
+                 retries: int = WKHTMLTOPDF_RETRIES, progress_callback=None,
+                 font_size: int = DEFAULT_FONT_SIZE, page_size=PAGE_SIZE):
+        """
+        Inicializa o conversor.
+
+        Args:
+            temp_dir: Pasta dos arquivos intermediários
+            path: Pasta base do projeto
+            chunk_bytes: Tamanho alvo de cada parte em bytes de HTML (None: parte única)
+            jobs: Número máximo de processos wkhtmltopdf simultâneos
+            retries: Tentativas extras por parte
+            progress_callback: Callback da geração, informado das páginas de cada parte
+                e consultado (checkpoint) antes de aguardar cada uma
+            font_size: Tamanho da fonte das partes geradas em texto simples
+            page_size: Tamanho da página das partes geradas em texto simples
+        """
+        self.temp_dir = temp_dir
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        self.retries = retries
+        self.font_size = font_size
+        self.page_size = page_size
+        self.progress_callback = progress_callback
+        self._counts_pages = hasattr(progress_callback, 'add_pages') and can_merge_pdfs()
+        self.executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+        self.parts = []
+        self._stream = None
+        self._files = []
+        self._size = 0
+
+    def add(self, file: str, highlighted_code: Optional[str], error: Optional[str]) -> None:
+        """
+        Acrescenta um arquivo ao documento.
+
+        Args:
+            file: Caminho do arquivo
+            highlighted_code: Bloco HTML destacado, ou None em caso de erro
+            error: Mensagem de erro, ou None
+        """
+        if self._stream is None:
+            self._open_chunk()
+
+        fragment = html_fragment(display_path_for(file, self.path), highlighted_code, error)
+        self._stream.write(fragment)
+        self._files.append(file)
+        self._size += len(fragment)
+        if self.chunk_bytes is not None and self._size >= self.chunk_bytes:
+            self._close_chunk()
+
+    def _open_chunk(self) -> None:
+        """Começa uma nova parte"""
+        self._html_path = os.path.join(self.temp_dir, f"parte_{len(self.parts):05d}.html")
+        self._stream = open(self._html_path, 'w', encoding='utf-8')
+        self._stream.write(html_head())
+        self._files = []
+        self._size = 0
+
+    def _close_chunk(self) -> None:
+        """Finaliza a parte atual e agenda sua conversão"""
+        self._stream.write(HTML_TAIL)
+        self._stream.close()
+        self._stream = None
+        pdf_path = self._html_path[:-len('.html')] + '.pdf'
+        future = self.executor.submit(convert_html, self._html_path, pdf_path, self.retries)
+        self.parts.append((future, pdf_path, self._files))
+
+    def finish(self, output_path: str) -> List[Tuple[List[str], str]]:
+        """
+        Aguarda as conversões e une as partes no PDF final.
+
+        Uma parte que falha em todas as tentativas é substituída pela versão em
+        texto simples dos mesmos arquivos, para não perder o restante do documento.
+        Se todas falham, nada é renderizado e o erro é levantado.
+
+        Args:
+            output_path: Caminho do PDF final
+
+        Returns:
+            list: Tuplas (arquivos da parte, mensagem de erro) das partes que falharam
+
+        Raises:
+            OSError: Se nenhuma parte pôde ser convertida
+        """
+        try:
+            if self._stream is None and not self.parts:
+                self._open_chunk()  # Documento vazio: ainda assim gera um PDF
+            if self._stream is not None:
+                self._close_chunk()
+
+            failures = []
+            failed_parts = []
+            last_error = None
+            for future, pdf_path, files in self.parts:
+                report_checkpoint(self.progress_callback)  # Cancelado: close() descarta as partes na fila
+                try:
+                    future.result()
+                except OSError as e:
+                    last_error = e
+                    failures.append((files, str(e)))
+                    logger.warning("Parte com %d arquivo(s) gerada em texto simples: %s", len(files), e)
+                    failed_parts.append((pdf_path, files))
+                    continue
+                if self._counts_pages:
+                    report_pages(self.progress_callback, count_pages(pdf_path))
+
+            # Sem nenhuma parte convertida não há documento a salvar: falha antes do texto simples
+            if len(failures) == len(self.parts):
+                raise last_error
+
+            renderer = CanvasTextRenderer(self.font_size, self.page_size)
+            for pdf_path, files in failed_parts:
+                report_checkpoint(self.progress_callback)
+                renderer.render(files, self.path, pdf_path)
+                if self._counts_pages:
+                    report_pages(self.progress_callback, count_pages(pdf_path))
+        finally:
+            self.close()
+
+        if len(self.parts) == 1:
+            shutil.move(self.parts[0][1], output_path)
+        else:
+            merge_pdfs([pdf_path for _, pdf_path, _ in self.parts], output_path)
+        return failures
+
+    def close(self) -> None:
+        """Libera o arquivo aberto e os processos, mesmo se a geração foi interrompida"""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -1,31 +1,45 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 
-from src.ui.components.file_entry import FileEntry
-from src.ui.components.folder_entry import FolderEntry
+from src.config.settings import TREE_INSERT_BATCH
+from src.core.selection_model import SelectionModel
+
+_PLACEHOLDER = '\u2063placeholder'  # Filho provisório que faz o Treeview mostrar a seta de expansão
+
+_CHECK_MARKS = {
+    (True, False): '☑',
+    (False, True): '◩',
+    (False, False): '☐',
+}
 
 
 class FileSelectionDialog:
     """
     Diálogo para seleção de arquivos em uma estrutura de árvore.
     Permite navegação e seleção de arquivos e pastas.
+
+    A árvore é um ttk.Treeview virtualizado: os filhos de uma pasta só são
+    inseridos quando ela é expandida (em lotes, para pastas muito grandes).
+    O estado fica no SelectionModel; o identificador de cada linha é o
+    índice do seu registro no modelo, então um clique chega ao registro
+    sem buscas. Só as linhas já inseridas são redesenhadas após cada alteração.
     """
-    def __init__(self, parent, project_path):
+    def __init__(self, parent, project_path, skip_reasons=None):
         """
         Inicializa o diálogo de seleção de arquivos.
         Args:
             parent: Janela pai
             project_path: Caminho base do projeto
+            skip_reasons: Dicionário path -> motivo dos arquivos desmarcados pelo pré-filtro
         """
         self.window = ttk.Toplevel(parent)
         self.window.title("Seleção de Arquivos")
         self.window.geometry("600x600")
         self.project_path = project_path
+        self.skip_reasons = skip_reasons or {}
 
-        # Inicializa o atributo folder_contents antes de atribuir file_vars
-        self.folder_contents = {}
-        self.file_vars = {'folder_contents': self.folder_contents}
-        self.folder_frames = {}
+        self.model = SelectionModel(self.skip_reasons)
+        self._populated = set()  # Pastas cujos filhos já foram inseridos
 
         self._create_ui()
 
@@ -35,51 +49,27 @@ class FileSelectionDialog:
         main_frame = ttk.Frame(self.window)
         main_frame.pack(expand=True, fill=BOTH, padx=10, pady=10)
 
-        # Canvas e Scrollbar
-        self.canvas = ttk.Canvas(main_frame)
+        self.tree = ttk.Treeview(main_frame, show="tree", selectmode="none")
         self.scrollbar = ttk.Scrollbar(
             main_frame,
             orient="vertical",
-            command=self.canvas.yview
+            command=self.tree.yview
         )
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.tree.tag_configure("ignored", foreground="gray")
 
-        # Frame scrollável
-        self.scrollable_frame = ttk.Frame(self.canvas)
-        self._configure_scrolling()
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<Button-1>", self._on_click)
+        self.tree.bind("<Double-Button-1>", self._on_double_click)
+        self.tree.bind("<space>", self._on_space)
 
         # Empacotamento dos componentes
-        self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
+        self.tree.pack(side=LEFT, fill=BOTH, expand=True)
         self.scrollbar.pack(side=RIGHT, fill=Y)
 
         # Botão de confirmação
         self._add_confirm_button()
 
-    def _configure_scrolling(self):
-        """Configura o comportamento de scroll"""
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.canvas.create_window(
-            (0, 0),
-            window=self.scrollable_frame,
-            anchor="nw"
-        )
-
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        # Configuração do mousewheel
-        self.canvas.bind_all(
-            "<MouseWheel>",
-            lambda e: self.canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
-        )
-
-        self.window.bind(
-            "<Destroy>",
-            lambda e: self.canvas.unbind_all("<MouseWheel>")
-        )
-
     def _add_confirm_button(self):
         """Adiciona o botão de confirmação"""
         confirm_btn = ttk.Button(
@@ -90,68 +80,111 @@ class FileSelectionDialog:
         )
         confirm_btn.pack(pady=10)
 
-    def populate_tree(self, folder_contents):
+    def populate_tree(self, file_tree):
         """
         Popula a árvore com os arquivos e pastas.
         Args:
-            folder_contents: Estrutura de dados com o conteúdo das pastas
+            file_tree: FileTree produzida pela varredura
         """
-        self.folder_contents = folder_contents
-        # Arquivos na raiz
-        root_files = self.folder_contents.get('', {'files': []})['files']
-        for file_path, file_name, is_selected in root_files:
-            self._create_file_entry(
-                file_path,
-                file_name,
-                is_selected,
-                self.scrollable_frame
-            )
-
-        # Pastas do primeiro nível
-        root_folders = {
-            folder for folder, data in self.folder_contents.items()
-            if data['parent'] == '' and folder != ''
-        }
-        for folder in sorted(root_folders):
-            self._create_folder_entry(folder)
-
-    def _create_folder_entry(self, folder):
-        """Cria uma entrada de pasta"""
-        return FolderEntry(
-            parent_frame=self.scrollable_frame,
-            folder_path=folder,
-            project_path=self.project_path,
-            file_vars=self.file_vars,
-            folder_frames=self.folder_frames,
-            folder_contents=self.folder_contents,
-            create_file_entry=self._create_file_entry
-        )
-
-    def _create_file_entry(self, file_path, file_name, is_selected, parent_frame):
-        """Cria uma entrada de arquivo"""
-        return FileEntry(
-            parent_frame=parent_frame,
-            file_path=file_path,
-            file_name=file_name,
-            is_selected=is_selected,
-            file_vars=self.file_vars,
-            folder_contents=self.folder_contents
-        )
+        self.model.load(file_tree)
+        self._insert_batch('', self.model.roots, 0)
+
+    def _insert_batch(self, parent_item, children, start):
+        """Insere um lote de linhas e agenda o próximo, mantendo a janela responsiva"""
+        if not self.tree.winfo_exists() or (parent_item and not self.tree.exists(parent_item)):
+            return
+        records = self.model.records
+        for index in children[start:start + TREE_INSERT_BATCH]:
+            record = records[index]
+            item = str(index)
+            self.tree.insert(parent_item, END, iid=item, text=self._label(index),
+                             tags=("ignored",) if record.reason else ())
+            if record.children:
+                self.tree.insert(item, END, iid=item + _PLACEHOLDER, text="")
+        if start + TREE_INSERT_BATCH < len(children):
+            self.window.after_idle(self._insert_batch, parent_item, children, start + TREE_INSERT_BATCH)
+
+    def _label(self, index):
+        """Texto da linha: marca de seleção e nome"""
+        record = self.model.records[index]
+        is_selected, is_partial = self.model.state(index)
+        name = record.name
+        if record.reason:
+            name = f"{name} (ignorado: {record.reason})"
+        return f"{_CHECK_MARKS[is_selected, is_partial]} {name}"
+
+    def _on_open(self, event):
+        """Insere os filhos da pasta expandida na primeira vez"""
+        item = self.tree.focus()
+        if item:
+            self._populate(item)
+
+    def _populate(self, item):
+        """Troca o filho provisório da pasta pelos filhos reais, uma única vez"""
+        if item in self._populated:
+            return
+        self._populated.add(item)
+        placeholder = item + _PLACEHOLDER
+        if self.tree.exists(placeholder):
+            self.tree.delete(placeholder)
+        self._insert_batch(item, self.model.records[int(item)].children, 0)
+
+    def _on_click(self, event):
+        """Alterna a seleção da linha clicada (a seta apenas expande ou recolhe)"""
+        item = self.tree.identify_row(event.y)
+        if not item or 'indicator' in self.tree.identify_element(event.x, event.y):
+            return None
+        self.tree.focus(item)
+        self._toggle(item)
+        return "break"
+
+    def _on_double_click(self, event):
+        """
+        Abre ou fecha a pasta no segundo clique de um clique duplo. Sem esta
+        ligação o segundo clique chegaria a _on_click e alternaria a seleção de novo.
+        """
+        item = self.tree.identify_row(event.y)
+        if not item or 'indicator' in self.tree.identify_element(event.x, event.y):
+            return None
+        if self.model.records[int(item)].children:
+            is_open = not self.tree.tk.getboolean(self.tree.item(item, 'open'))
+            if is_open:
+                self._populate(item)
+            self.tree.item(item, open=is_open)
+        return "break"
+
+    def _on_space(self, event):
+        """Alterna a seleção da linha em foco pelo teclado"""
+        item = self.tree.focus()
+        if item:
+            self._toggle(item)
+        return "break"
+
+    def _toggle(self, item):
+        """Inverte a seleção do item no modelo e redesenha as linhas afetadas"""
+        index = int(item)
+        self.model.toggle(index)
+        self._refresh_subtree(item)
+        for ancestor in self.model.ancestors(index):
+            self.tree.item(str(ancestor), text=self._label(ancestor))
+
+    def _refresh_subtree(self, item):
+        """Redesenha a linha e seus descendentes já inseridos"""
+        pending = [item]
+        while pending:
+            current = pending.pop()
+            if current.endswith(_PLACEHOLDER):
+                continue
+            self.tree.item(current, text=self._label(int(current)))
+            pending.extend(self.tree.get_children(current))
 
     def _confirm_selection(self):
         """Confirma a seleção e fecha o diálogo"""
-        selected_files = []
-        # Percorre todos os arquivos e pastas armazenados
-        for folder, data in self.folder_contents.items():
-            for file_path, _, is_selected in data['files']:
-                if is_selected:  # Garante que apenas arquivos selecionados sejam incluídos
-                    selected_files.append(file_path)
-
         # Armazena os arquivos selecionados
-        self.window.selected_files = selected_files
+        self.window.selected_files = self.model.selected_files()
         self.window.destroy()
 
     def get_selected_files(self):
         """Retorna os arquivos selecionados após o fechamento do diálogo"""
         self.window.wait_window()
-        return getattr(self.window, 'selected_files', [])
\ No newline at end of file
+        return getattr(self.window, 'selected_files', [])
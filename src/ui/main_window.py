@@ -1,14 +1,51 @@
+import logging
 import os
+import threading
 from tkinter import filedialog, messagebox
 
 import ttkbootstrap as ttk
 from ttkbootstrap import Toplevel
 from ttkbootstrap.constants import *
 
+from src.config.settings import PREWARM_PDF_ENGINES, PROGRESS_POLL_MS
+from src.core.background_job import BackgroundJob, CANCELLED, DONE, ERROR, PROGRESS
 from src.core.file_manager import FileManager
-from src.pdf.generator import PDFGenerator
+from src.core.file_tree import SizedFileList
+from src.core.progress import ProgressTracker
 from src.ui.dialogs.file_selection import FileSelectionDialog
 
+logger = logging.getLogger(__name__)
+
+
+def __getattr__(name):
+    # PDFGenerator (reportlab, pygments, pdfkit) só é importado no primeiro uso
+    if name == 'PDFGenerator':
+        from src.pdf.generator import PDFGenerator
+        return PDFGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def prewarm_pdf_engines():
+    """
+    Importa os motores de PDF em uma thread de fundo, para que a primeira
+    geração não pague o custo de importação. Falhas são apenas registradas:
+    o erro reaparece, com contexto, quando a geração é pedida.
+
+    Returns:
+        threading.Thread: Thread do pré-carregamento (já iniciada)
+    """
+    def load():
+        try:
+            import src.pdf.generator  # noqa: F401
+            from src.pdf.parallel import can_merge_pdfs
+            can_merge_pdfs()
+        except Exception as e:  # Qualquer falha aqui é só uma otimização perdida
+            logger.debug("Pré-carregamento dos motores de PDF falhou: %s", e)
+
+    thread = threading.Thread(target=load, name='pdf-prewarm', daemon=True)
+    thread.start()
+    return thread
+
 
 class MainWindow:
     """
@@ -27,7 +64,11 @@ class MainWindow:
         self.root.title("Conversor de Código-Fonte para PDF")
         self.project_path = ""
         self.selected_files = []
+        self.job = None
         self.create_widgets()
+        if PREWARM_PDF_ENGINES:
+            # Depois que a janela é desenhada, para não atrasar sua exibição
+            self.root.after_idle(prewarm_pdf_engines)
 
     def create_widgets(self):
         """Cria os componentes da interface principal"""
@@ -71,17 +112,32 @@ class MainWindow:
             mode='determinate',
             bootstyle=SUCCESS
         )
-        self.progress.pack(pady=10)
+        self.progress.pack(pady=(10, 0))
+
+        self.progress_label = ttk.Label(self.root, text="", font=("Helvetica", 9))
+        self.progress_label.pack(pady=(2, 5))
 
     def _create_generate_button(self):
-        """Cria o botão de geração de PDF"""
-        generate_btn = ttk.Button(
-            self.root,
+        """Cria os botões de geração e de cancelamento do PDF"""
+        buttons = ttk.Frame(self.root)
+        buttons.pack(pady=10)
+
+        self.generate_btn = ttk.Button(
+            buttons,
             text="Gerar PDF",
             command=self.generate_pdf,
             bootstyle=SUCCESS
         )
-        generate_btn.pack(pady=10)
+        self.generate_btn.pack(side=LEFT, padx=5)
+
+        self.cancel_btn = ttk.Button(
+            buttons,
+            text="Cancelar",
+            command=self.cancel_generation,
+            bootstyle=DANGER,
+            state=DISABLED
+        )
+        self.cancel_btn.pack(side=LEFT, padx=5)
 
     def select_folder(self):
         """Gerencia a seleção de pasta e exibição do diálogo de seleção de arquivos"""
@@ -93,13 +149,16 @@ class MainWindow:
         self.project_path = folder
         self.folder_label.config(text=f"Pasta selecionada:\n{folder}")
 
-        files = FileManager.list_files_in_directory_with_ignored(folder)
-        if not files:
+        file_tree = FileManager.scan_tree(folder, use_index=True)
+        if not file_tree.root.files and not file_tree.root.subfolders:
             messagebox.showinfo("Aviso", "Nenhum arquivo encontrado na pasta selecionada.")
             return
 
-        dialog = FileSelectionDialog(self.root, folder)
-        dialog.populate_tree(self._organize_files(files))
+        # Descarta binários, arquivos enormes e minificados antes da geração
+        skip_reasons = FileManager.filter_tree(file_tree)
+
+        dialog = FileSelectionDialog(self.root, folder, skip_reasons)
+        dialog.populate_tree(file_tree)
         self.selected_files = dialog.get_selected_files()
 
     @staticmethod
@@ -120,7 +179,7 @@ class MainWindow:
         dialog.title("Escolher Formato do PDF")
         dialog.resizable(False, False)
         dialog.grab_set()
-        MainWindow.center_window(dialog, 300, 200)
+        MainWindow.center_window(dialog, 300, 240)
 
         ttk.Label(dialog, text="Escolha o formato do PDF:", font=("Helvetica", 12)).pack(pady=10)
 
@@ -131,6 +190,8 @@ class MainWindow:
         ttk.Button(dialog, text="Texto Simples", command=lambda: select_format("texto_simples"), width=15).pack(pady=5)
         ttk.Button(dialog, text="Texto Indentado", command=lambda: select_format("texto_indentado"), width=15).pack(
             pady=5)
+        ttk.Button(dialog, text="Texto Destacado", command=lambda: select_format("texto_destacado"), width=15).pack(
+            pady=5)
 
     def _generate_pdf_with_format(self, format_option):
         """Gera o PDF baseado no formato selecionado."""
@@ -146,67 +207,100 @@ class MainWindow:
             messagebox.showwarning("Aviso", "Destino não selecionado")
             return
 
-        pdf_gen = PDFGenerator()
-
-        if format_option == "texto_simples":
-            pdf_gen.generate_simple_pdf(self.selected_files, self.project_path, output_path, self.update_progress)
-        elif format_option == "texto_indentado":
-            pdf_gen.generate_indented_pdf(self.selected_files, self.project_path, output_path, self.update_progress)
+        from src.pdf.generator import PDFGenerator
 
-        messagebox.showinfo("Sucesso", f"PDF gerado em {output_path}")
+        pdf_gen = PDFGenerator()
+        # Cópia que mantém os tamanhos conhecidos da varredura
+        files = SizedFileList(self.selected_files, getattr(self.selected_files, 'sizes', ()))
+        project_path = self.project_path
+
+        def run(progress_callback):
+            # Progresso ponderado por bytes; o rastreador também verifica o cancelamento a cada arquivo
+            tracker = ProgressTracker(files, progress_callback, checkpoint=job.check_cancelled)
+            failures = []
+            if format_option == "texto_simples":
+                pdf_gen.generate_simple_pdf(files, project_path, output_path, tracker)
+            elif format_option == "texto_destacado":
+                pdf_gen.generate_highlighted_pdf(files, project_path, output_path, tracker)
+            elif format_option == "texto_indentado":
+                failures = pdf_gen.generate_indented_pdf(files, project_path, output_path, tracker)
+            tracker.finish()
+            return failures
+
+        # A geração roda fora da thread do Tk; a janela só consulta a fila de eventos
+        job = BackgroundJob(run, name='pdf-generation')
+        self.job = job.start()
+        self.generate_btn.config(state=DISABLED)
+        self.cancel_btn.config(state=NORMAL)
+        self.root.after(PROGRESS_POLL_MS, self._poll_job, output_path)
+
+    def _poll_job(self, output_path):
+        """Consome os eventos da geração em andamento (executado na thread do Tk)"""
+        for event in self.job.poll():
+            if event.kind == PROGRESS:
+                self.update_progress(*event.data)
+            elif event.kind == DONE:
+                self._finish_job()
+                failures = event.data or []
+                if failures:
+                    count = sum(len(files) for files, _ in failures)
+                    messagebox.showwarning(
+                        "Aviso", f"{count} arquivo(s) não puderam ser convertidos pelo wkhtmltopdf "
+                                 f"e foram incluídos sem destaque de sintaxe."
+                    )
+                messagebox.showinfo("Sucesso", f"PDF gerado em {output_path}")
+                return
+            elif event.kind == CANCELLED:
+                self._finish_job()
+                self._remove_partial_output(output_path)
+                messagebox.showinfo("Aviso", "Geração do PDF cancelada.")
+                return
+            elif event.kind == ERROR:
+                self._finish_job()
+                self._remove_partial_output(output_path)
+                messagebox.showerror("Erro", f"Falha ao gerar o PDF: {event.data}")
+                return
+        self.root.after(PROGRESS_POLL_MS, self._poll_job, output_path)
+
+    def _finish_job(self):
+        """Restaura a janela ao fim da geração"""
+        self.job = None
         self.progress['value'] = 0
-        self.root.update_idletasks()
+        self.progress_label.config(text="")
+        self.generate_btn.config(state=NORMAL)
+        self.cancel_btn.config(state=DISABLED)
+
+    @staticmethod
+    def _remove_partial_output(output_path):
+        """Remove o PDF incompleto deixado por uma geração interrompida"""
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+
+    def cancel_generation(self):
+        """Pede o cancelamento da geração em andamento (interrompida no arquivo seguinte)"""
+        if self.job is not None:
+            self.job.cancel()
+            self.cancel_btn.config(state=DISABLED)
 
     def generate_pdf(self):
         """Gerencia a geração do PDF mostrando o diálogo de seleção de formato."""
+        if self.job is not None:
+            return  # Uma geração por vez
         self.show_pdf_format_dialog()
 
-    def update_progress(self, current, total):
-        """Atualiza a barra de progresso"""
-        self.progress['value'] = (current / total) * 100
-        self.root.update_idletasks()
-
-    def _organize_files(self, files_with_states):
+    def update_progress(self, snapshot):
         """
-        Organiza os arquivos em uma estrutura hierárquica.
+        Atualiza a barra de progresso (sempre na thread do Tk, a partir de _poll_job).
 
         Args:
-            files_with_states: Lista de tuplas (caminho, estado)
-
-        Returns:
-            dict: Estrutura de dados organizada por pasta
+            snapshot: ProgressSnapshot emitido pelo ProgressTracker
         """
-        folder_contents = {}
-
-        for file_path, is_selected in files_with_states:
-            rel_path = os.path.relpath(file_path, self.project_path)
-            parts = rel_path.split(os.sep)
-
-            current_path = ""
-            for i, part in enumerate(parts[:-1]):
-                parent_path = current_path
-                current_path = os.path.join(current_path, part) if current_path else part
-
-                if current_path not in folder_contents:
-                    folder_contents[current_path] = {
-                        'parent': parent_path,
-                        'files': [],
-                        'subfolders': set()
-                    }
-
-                if parent_path in folder_contents:
-                    folder_contents[parent_path]['subfolders'].add(current_path)
-
-            if os.path.isfile(file_path):
-                folder = os.path.dirname(rel_path)
-                if folder not in folder_contents:
-                    folder_contents[folder] = {
-                        'parent': os.path.dirname(folder),
-                        'files': [],
-                        'subfolders': set()
-                    }
-                folder_contents[folder]['files'].append(
-                    (file_path, parts[-1], is_selected)
-                )
-
-        return folder_contents
\ No newline at end of file
+        self.progress['value'] = snapshot.fraction * 100
+        status = f"{snapshot.stage.capitalize()}: {snapshot.files_done}/{snapshot.files_total} arquivos"
+        if snapshot.mb_per_second:
+            status += f" · {snapshot.mb_per_second:.1f} MB/s"
+        if snapshot.eta is not None and snapshot.files_done < snapshot.files_total:
+            status += f" · restam ~{snapshot.eta:.0f}s"
+        self.progress_label.config(text=status)
@@ -30,8 +30,8 @@ class TestConfig(unittest.TestCase):
         """Testa se as extensões suportadas estão corretamente definidas"""
         expected_extensions = (
             '.java', '.py', '.js', '.html', '.css',
-            '.xml', 'fxml', '.json', '.txt', 'yaml',
-            'yml', 'sh', '.bat', '.cmd'
+            '.xml', '.fxml', '.json', '.txt', '.yaml',
+            '.yml', '.sh', '.bat', '.cmd'
         )
 
         # Testa se todas as extensões esperadas estão presentes
@@ -0,0 +1,69 @@
+import pytest
+
+from src.core.background_job import CANCELLED, DONE, ERROR, PROGRESS, BackgroundJob, JobCancelled
+from src.pdf.canvas_renderer import CanvasTextRenderer
+from src.pdf.parallel import render_simple_parallel
+
+
+def _files(tmp_path, count):
+    files = []
+    for i in range(count):
+        file = tmp_path / f"file_{i}.py"
+        file.write_text(f"x = {i}\n" * 50)
+        files.append(str(file))
+    return files
+
+
+def test_progress_and_result_are_posted_to_the_queue():
+    def target(progress_callback):
+        for i in range(1, 4):
+            progress_callback(i, 3)
+        return "ok"
+
+    job = BackgroundJob(target).start()
+    assert job.wait(timeout=5)
+
+    events = job.poll()
+    assert [e.data for e in events if e.kind == PROGRESS] == [(1, 3), (2, 3), (3, 3)]
+    assert events[-1].kind == DONE and events[-1].data == "ok"
+    assert job.poll() == []
+
+
+def test_errors_are_reported_instead_of_raised():
+    def target(progress_callback):
+        raise OSError("disco cheio")
+
+    job = BackgroundJob(target).start()
+    job.wait(timeout=5)
+
+    [event] = job.poll()
+    assert event.kind == ERROR and str(event.data) == "disco cheio"
+
+
+def test_cancel_stops_rendering_at_the_next_file(tmp_path):
+    files = _files(tmp_path, 20)
+    rendered = []
+
+    def target(progress_callback):
+        def callback(current, total):
+            rendered.append(current)
+            if current == 3:
+                job.cancel()
+            progress_callback(current, total)
+        CanvasTextRenderer().render(files, str(tmp_path), str(tmp_path / "output.pdf"), callback)
+
+    job = BackgroundJob(target)
+    job.start().wait(timeout=30)
+
+    assert job.poll()[-1].kind == CANCELLED
+    assert rendered == [1, 2, 3]
+
+
+def test_parallel_render_propagates_cancellation(tmp_path):
+    files = _files(tmp_path, 8)
+
+    def cancel(current, total):
+        raise JobCancelled()
+
+    with pytest.raises(JobCancelled):
+        render_simple_parallel(files, str(tmp_path), str(tmp_path / "output.pdf"), cancel, jobs=2, min_bytes=0)
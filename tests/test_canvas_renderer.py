@@ -0,0 +1,28 @@
+from src.pdf.canvas_renderer import CanvasTextRenderer, wrap_line
+
+
+def test_wrap_line_uses_fixed_width():
+    assert wrap_line("", 4) == [""]
+    assert wrap_line("abcd", 4) == ["abcd"]
+    assert wrap_line("abcdefghij", 4) == ["abcd", "efgh", "ij"]
+
+
+def test_render_reports_start_page_of_each_file(tmp_path):
+    renderer = CanvasTextRenderer()
+    first = tmp_path / "first.py"
+    first.write_text("linha\n" * 100)  # Ocupa mais de uma página
+    second = tmp_path / "second.py"
+    second.write_text("print('fim')\n")
+    missing = tmp_path / "missing.py"
+    output_pdf = tmp_path / "output.pdf"
+    progress = []
+
+    file_pages = renderer.render(
+        [str(first), str(second), str(missing)], str(tmp_path), str(output_pdf),
+        lambda current, total: progress.append((current, total))
+    )
+
+    assert [page for _, page in file_pages] == [0, 1, 1]
+    assert file_pages[0][0].endswith("first.py")
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert output_pdf.read_bytes().startswith(b"%PDF")
@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+from pypdf import PdfReader
+
+from src.cli import main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _project(tmp_path):
+    project = tmp_path / "projeto"
+    (project / "pkg").mkdir(parents=True)
+    (project / "main.py").write_text("print('main')\n")
+    (project / "pkg" / "module.py").write_text("print('module')\n")
+    (project / "pkg" / "gerado.py").write_text("x = 1\n")
+    (project / "Makefile").write_text("all:\n\techo ok\n")
+    return project
+
+
+def test_json_stream_reports_scan_progress_and_result(tmp_path, capsys):
+    project = _project(tmp_path)
+    output_pdf = tmp_path / "saida.pdf"
+
+    code = main([str(project), "-o", str(output_pdf), "--json", "--sem-indice", "--jobs", "1",
+                 "--incluir", "Makefile", "--excluir", "gerado.*"])
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == 0
+    assert events[0]["event"] == "scan" and events[0]["files"] == 3
+    progress = [e for e in events if e["event"] == "progress"]
+    assert progress[-1]["files_done"] == 3 and progress[-1]["percent"] == 100.0
+    assert progress[-1]["bytes_done"] == progress[-1]["bytes_total"] == events[0]["bytes"]
+    assert events[-1]["event"] == "done" and events[-1]["output"] == str(output_pdf)
+    titles = sorted(os.path.basename(entry.title) for entry in PdfReader(str(output_pdf)).outline)
+    assert titles == ["Makefile", "main.py", "module.py"]
+
+
+def test_missing_folder_is_an_error(tmp_path, capsys):
+    assert main([str(tmp_path / "nada"), "-o", str(tmp_path / "saida.pdf"), "--json"]) == 1
+    assert json.loads(capsys.readouterr().out)["event"] == "error"
+
+
+def test_cli_never_imports_tkinter(tmp_path):
+    project = _project(tmp_path)
+    script = ("import sys; from src.cli import main; "
+              f"code = main([{str(project)!r}, '-o', {str(tmp_path / 'saida.pdf')!r}, '--sem-indice']); "
+              "assert not any(m.split('.')[0] in ('tkinter', '_tkinter', 'ttkbootstrap') for m in sys.modules); "
+              "sys.exit(code)")
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
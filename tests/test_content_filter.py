@@ -0,0 +1,38 @@
+from src.core.content_filter import ContentFilter
+
+
+def test_accepts_regular_source(tmp_path):
+    source = tmp_path / "app.py"
+    source.write_text("def main():\n    print('ok')\n" * 50)
+
+    assert ContentFilter().check(str(source)) is None
+
+
+def test_rejects_binary_large_and_minified_files(tmp_path):
+    content_filter = ContentFilter(max_file_bytes=64 * 1024, sniff_bytes=1024, minified_avg_line_length=200)
+
+    binary = tmp_path / "image.txt"
+    binary.write_bytes(b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR" * 10)
+    large = tmp_path / "big.js"
+    large.write_text("var a = 1;\n" * 10000)
+    minified = tmp_path / "bundle.js"
+    minified.write_text("function a(){return 1};" * 60 + "\n" + "var b=2;" * 10)
+
+    assert content_filter.check(str(binary)) == "binário"
+    assert content_filter.check(str(large)).startswith("muito grande")
+    assert content_filter.check(str(minified)) == "minificado"
+
+
+def test_filter_records_unselects_with_reason(tmp_path):
+    good = tmp_path / "good.py"
+    good.write_text("x = 1\n")
+    bad = tmp_path / "bad.py"
+    bad.write_bytes(b"\0\1\2\3")
+    unsupported = tmp_path / "image.png"
+
+    records, reasons = ContentFilter().filter_records(
+        [(str(unsupported), False), (str(good), True), (str(bad), True)]
+    )
+
+    assert records == [(str(unsupported), False), (str(good), True), (str(bad), False)]
+    assert reasons == {str(bad): "binário"}
@@ -1,5 +1,8 @@
+import pytest
+
 from core.file_handler import FileHandler
 from src.core.file_manager import FileManager
+from src.core.file_tree import file_sizes
 
 
 def test_list_files_in_directory_with_ignored(tmp_path):
@@ -23,3 +26,62 @@ def test_list_files_in_directory_with_ignored(tmp_path):
     assert any("script.py" in file[0] and file[1] for file in all_files)
     assert any("__pycache__" in file[0] and not file[1] for file in all_files)
     assert any("readme.md" in file[0] and not file[1] for file in all_files)
+
+
+def test_iter_directory_batches_groups_by_folder(tmp_path):
+    # Criar estrutura de teste
+    subfolder = tmp_path / "pkg"
+    subfolder.mkdir()
+    (tmp_path / "main.py").write_text("print('main')")
+    (subfolder / "module.py").write_text("print('module')")
+    (subfolder / "notes.md").write_text("# Notas")
+
+    # Executar método
+    batches = dict(FileManager.iter_directory_batches(str(tmp_path)))
+
+    # Verificar resultados
+    assert set(batches) == {str(tmp_path), str(subfolder)}
+    assert [name for name, _ in batches[str(tmp_path)]] == [str(tmp_path / "main.py")]
+    assert (str(subfolder / "notes.md"), False) in batches[str(subfolder)]
+    assert (str(subfolder / "module.py"), True) in batches[str(subfolder)]
+
+
+def test_list_files_wraps_stream(tmp_path):
+    # Criar estrutura de teste
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "script.py").write_text("print('a')")
+    (tmp_path / "readme.md").write_text("# Readme")
+
+    # Executar métodos
+    streamed = list(FileManager.iter_files_in_directory_with_ignored(str(tmp_path)))
+    listed = FileManager.list_files_in_directory_with_ignored(str(tmp_path))
+
+    # Verificar resultados: mesmos registros, ignorados antes dos regulares
+    assert sorted(streamed) == sorted(listed)
+    assert [selected for _, selected in listed] == [False, True]
+
+
+def test_scan_tree_builds_the_hierarchy_and_filter_records_sizes(tmp_path, monkeypatch):
+    # Criar estrutura de teste
+    subfolder = tmp_path / "pkg"
+    subfolder.mkdir()
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "main.py").write_text("print('main')")
+    (subfolder / "module.py").write_text("print('module')")
+    (subfolder / "data.py").write_bytes(b"\0\1\2")
+
+    # Executar método
+    tree = FileManager.scan_tree(str(tmp_path))
+    skip_reasons = FileManager.filter_tree(tree)
+
+    # Verificar resultados
+    assert [folder.name for folder in tree.root.subfolders] == ["pkg"]
+    assert [node.name for node in tree.iter_files()] == ["main.py", "data.py", "module.py"]
+    assert skip_reasons == {str(subfolder / "data.py"): "binário"}
+
+    # Os tamanhos seguem com a seleção, sem novas consultas ao disco
+    monkeypatch.setattr("os.path.getsize", lambda path: pytest.fail("stat inesperado"))
+    selected = tree.selected_files()
+    assert selected == [str(tmp_path / "main.py"), str(subfolder / "module.py")]
+    assert file_sizes(selected) == [len("print('main')"), len("print('module')")]
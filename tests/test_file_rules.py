@@ -0,0 +1,41 @@
+import os
+
+from src.core.file_rules import FileRules
+
+
+def test_extensions_require_dot_and_ignore_case():
+    rules = FileRules(extensions=('.py', 'sh', 'YAML'))
+
+    assert rules.is_supported_file("script.py") is True
+    assert rules.is_supported_file("deploy.SH") is True
+    assert rules.is_supported_file("config.yaml") is True
+    assert rules.is_supported_file("crash") is False
+    assert rules.is_supported_file("mesh") is False
+    assert rules.is_supported_file("notes.md") is False
+
+
+def test_include_and_exclude_globs():
+    rules = FileRules(
+        extensions=('.js',),
+        ignored_folders=('node_modules',),
+        include_patterns=('Dockerfile',),
+        exclude_patterns=('*.min.js', 'dist')
+    )
+
+    assert rules.is_supported_file("Dockerfile") is True
+    assert rules.is_supported_file("app.js") is True
+    assert rules.is_supported_file("app.min.js") is False
+    assert rules.is_ignored_folder("node_modules") is True
+    assert rules.is_ignored_folder("dist") is True
+    assert rules.is_ignored_folder("src") is False
+
+
+def test_is_in_ignored_folder():
+    rules = FileRules(ignored_folders=('target',))
+
+    assert rules.is_in_ignored_folder(os.path.join("module", "target", "classes")) is True
+    assert rules.is_in_ignored_folder(os.path.join("module", "src")) is False
+
+
+def test_default_instance_is_shared():
+    assert FileRules.default() is FileRules.default()
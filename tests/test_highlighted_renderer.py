@@ -0,0 +1,101 @@
+import os
+import re
+
+from pypdf import PdfReader
+from reportlab.lib.colors import black
+
+from src.pdf.highlighted_renderer import HighlightedCanvasRenderer
+
+
+def test_rows_keep_text_and_color_keywords(tmp_path):
+    renderer = HighlightedCanvasRenderer()
+    source = tmp_path / "example.py"
+    source.write_text("def f():\n\treturn 'x'\n\n" + "y = '" + "a" * (renderer.columns + 10) + "'\n")
+
+    rows = renderer.read_rows(str(source))
+
+    texts = ["".join(text for _, text in row) for row in rows]
+    assert texts[:3] == ["def f():", "    return 'x'", ""]
+    assert "".join(texts[3:]) == "y = '" + "a" * (renderer.columns + 10) + "'"
+    assert all(len(text) <= renderer.columns for text in texts)
+    (font, color), keyword = rows[0][0]
+    assert keyword.strip() == "def" and font == "Courier-Bold" and color != black
+
+
+def test_render_produces_outline_and_falls_back_for_unknown_names(tmp_path):
+    first = tmp_path / "Main.java"
+    first.write_text("class Main {}\n" * 200)
+    second = tmp_path / "notes.unknownext"
+    second.write_text("texto sem lexer\n")
+    output_pdf = tmp_path / "output.pdf"
+
+    file_pages = HighlightedCanvasRenderer().render([str(first), str(second)], str(tmp_path), str(output_pdf))
+
+    reader = PdfReader(str(output_pdf))
+    assert [os.path.basename(entry.title) for entry in reader.outline] == ["Main.java", "notes.unknownext"]
+    assert file_pages[1][1] == len(reader.pages) - 1
+    assert "texto sem lexer" in reader.pages[-1].extract_text()
+
+
+def _draw_single_row(tmp_path, row, monkeypatch=None):
+    from reportlab.pdfgen import canvas
+    from src.pdf import highlighted_renderer
+
+    if monkeypatch is not None:
+        monkeypatch.setattr(highlighted_renderer, "_raw_text_access", lambda pdf, text_object: None)
+    renderer = HighlightedCanvasRenderer()
+    output_pdf = tmp_path / ("public.pdf" if monkeypatch else "raw.pdf")
+    pdf = canvas.Canvas(str(output_pdf), pagesize=renderer.page_size, pageCompression=0)
+    highlighted_renderer._HighlightedLayout(renderer, pdf).draw_rows([row])
+    pdf.save()
+    return PdfReader(str(output_pdf)).pages[0]
+
+
+def _shown_strings(page):
+    """Pares (fonte base, texto) na ordem dos operadores Tj do conteúdo"""
+    fonts = page["/Resources"]["/Font"]
+    content = page.get_contents().get_data().decode("latin-1")
+    shown = []
+    font = None
+    for match in re.finditer(r"(/F\d+) [\d.]+ Tf|\(((?:[^()\\]|\\.)*)\) Tj", content):
+        if match.group(1):
+            font = fonts[match.group(1)]["/BaseFont"]
+        else:
+            shown.append((font, match.group(2)))
+    return shown
+
+
+def test_substituted_glyph_keeps_fonts_of_earlier_runs(tmp_path):
+    row = [(("Courier", black), "regular "), (("Courier-Bold", black), "bold \u2713 end")]
+
+    shown = _shown_strings(_draw_single_row(tmp_path, row))
+
+    assert shown[0] == ("/Courier", "regular ")
+    assert shown[1] == ("/Courier-Bold", "bold ")
+    assert shown[2][0] == "/ZapfDingbats"
+    assert shown[3] == ("/Courier-Bold", " end")
+
+
+def test_public_text_api_draws_the_same_text(tmp_path, monkeypatch):
+    row = [(("Courier", black), "regular "), (("Courier-Bold", black), "bold \u2713 end")]
+
+    raw = _draw_single_row(tmp_path, row)
+    public = _draw_single_row(tmp_path, row, monkeypatch)
+
+    assert [font for font, _ in _shown_strings(public)] == [font for font, _ in _shown_strings(raw)]
+    assert public.extract_text() == raw.extract_text()
+
+
+def test_indented_first_line_is_drawn(tmp_path):
+    source = tmp_path / "indented.py"
+    source.write_text("    x = 1\ny = 2\n")
+    output_pdf = tmp_path / "output.pdf"
+
+    renderer = HighlightedCanvasRenderer()
+    rows = renderer.read_rows(str(source))
+    renderer.render([str(source)], str(tmp_path), str(output_pdf))
+
+    assert all(token_style is not None for row in rows for token_style, _ in row)
+    text = PdfReader(str(output_pdf)).pages[0].extract_text()
+    assert "Erro ao processar" not in text
+    assert "x = 1" in text and "y = 2" in text
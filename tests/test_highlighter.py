@@ -0,0 +1,78 @@
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import guess_lexer_for_filename
+
+import src.pdf.highlighter as highlighter
+from src.core.content_cache import ContentCache
+from src.pdf.highlighter import iter_highlighted, split_code
+
+
+def _reference(file):
+    code = open(file, encoding="utf-8").read()
+    formatter = HtmlFormatter(style="colorful", cssclass="custom-code-style")
+    return highlight(code, guess_lexer_for_filename(file, code), formatter)
+
+
+def test_split_code_prefers_top_level_boundaries():
+    code = "def a():\n    return 1\n\ndef b():\n    return 2\n\ndef c():\n    return 3\n"
+
+    segments = split_code(code, segment_size=20)
+
+    assert "".join(segments) == code
+    assert all(segment.endswith("\n") for segment in segments)
+    assert [segment.startswith("def") for segment in segments] == [True] * len(segments)
+
+
+def test_highlighted_output_matches_pygments(tmp_path):
+    source = tmp_path / "example.py"
+    source.write_text("\n\nimport os\n\nprint(os.sep)  # comentário\n\n")
+
+    [(file, body, error)] = list(iter_highlighted([str(source)]))
+
+    assert error is None
+    assert body == _reference(str(source))
+
+
+def test_parallel_stage_keeps_order_and_splits_large_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(highlighter, "HIGHLIGHT_SPLIT_BYTES", 200)
+    monkeypatch.setattr(highlighter, "HIGHLIGHT_CHUNK_BYTES", 100)
+    files = []
+    for i in range(4):
+        source = tmp_path / f"module{i}.py"
+        source.write_text("".join(f"def f{n}():\n    return {n}\n\n" for n in range(10 * (i + 1))))
+        files.append(str(source))
+    unknown = tmp_path / "data.unknownext"
+    unknown.write_text("???")
+    files.insert(2, str(unknown))
+    progress = []
+
+    results = list(iter_highlighted(files, lambda done, total: progress.append((done, total)), jobs=2, min_bytes=0))
+
+    assert [file for file, _, _ in results] == files
+    assert results[2][1] is None and results[2][2]
+    for file, body, error in results[:2] + results[3:]:
+        assert error is None
+        assert body == _reference(file)
+    assert progress[-1] == (5, 5)
+    assert len(progress) == 5
+
+
+def test_cache_skips_pygments_for_unchanged_files(tmp_path, monkeypatch):
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    first = tmp_path / "first.py"
+    first.write_text("x = 1\n")
+    second = tmp_path / "second.py"
+    second.write_text("y = 2\n")
+    files = [str(first), str(second)]
+
+    cold = list(iter_highlighted(files, cache=cache))
+    second.write_text("y = 3\n")
+    calls = []
+    original = highlighter.highlight
+    monkeypatch.setattr(highlighter, "highlight", lambda *args: calls.append(args) or original(*args))
+    warm = list(iter_highlighted(files, cache=cache))
+
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(calls) == 1
+    assert warm[0] == cold[0]
+    assert warm[1][1] == _reference(str(second))
@@ -0,0 +1,63 @@
+import os
+
+from src.core.ignore_rules import IgnoreRules, parse_ignore_lines
+from src.core.scanner import DirectoryScanner
+
+
+def _rules(base, *lines, parent=None):
+    return IgnoreRules(str(base), parse_ignore_lines(lines), parent)
+
+
+def test_gitignore_pattern_semantics(tmp_path):
+    rules = _rules(tmp_path, "*.log", "/build", "docs/", "src/**/gen", "!keep.log", "# comentario")
+
+    def ignored(relative, is_dir=False):
+        return rules.is_ignored(os.path.join(str(tmp_path), *relative.split("/")), is_dir)
+
+    assert ignored("app.log")
+    assert ignored("deep/inner/app.log")
+    assert not ignored("keep.log")
+    assert ignored("build", is_dir=True)
+    assert not ignored("sub/build", is_dir=True)  # Padrão ancorado na raiz
+    assert ignored("sub/docs", is_dir=True)
+    assert not ignored("sub/docs")  # 'docs/' só vale para pastas
+    assert ignored("src/gen", is_dir=True)
+    assert ignored("src/a/b/gen", is_dir=True)
+    assert not ignored("main.py")
+
+
+def test_nested_rules_override_parent(tmp_path):
+    parent = _rules(tmp_path, "*.txt")
+    child = _rules(tmp_path / "sub", "!notes.txt", parent=parent)
+
+    assert child.is_ignored(str(tmp_path / "sub" / "other.txt"), False)
+    assert not child.is_ignored(str(tmp_path / "sub" / "notes.txt"), False)
+    assert parent.is_ignored(str(tmp_path / "notes.txt"), False)
+
+
+def test_scanner_prunes_gitignored_directories(tmp_path):
+    (tmp_path / ".gitignore").write_text("dist/\n*.generated.py\n")
+    (tmp_path / "dist" / "deep").mkdir(parents=True)
+    (tmp_path / "dist" / "deep" / "bundle.py").write_text("x = 1")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / ".ignore").write_text("local.py\n")
+    (tmp_path / "pkg" / "local.py").write_text("x = 2")
+    (tmp_path / "pkg" / "module.py").write_text("x = 3")
+    (tmp_path / "pkg" / "models.generated.py").write_text("x = 4")
+
+    visited = []
+    scanner = DirectoryScanner(
+        is_supported_file=lambda name: name.endswith(".py"),
+        is_ignored_folder=lambda name: False,
+        max_workers=1
+    )
+    original = scanner._list_directory
+    scanner._list_directory = lambda path, rules=None: visited.append(path) or original(path, rules)
+
+    regular_files, ignored_items = scanner.scan(str(tmp_path))
+
+    assert [path for path, _ in regular_files] == [str(tmp_path / "pkg" / "module.py")]
+    assert (str(tmp_path / "dist"), False) in ignored_items
+    assert (str(tmp_path / "pkg" / "local.py"), False) in ignored_items
+    assert (str(tmp_path / "pkg" / "models.generated.py"), False) in ignored_items
+    assert str(tmp_path / "dist") not in visited
@@ -0,0 +1,170 @@
+import os
+import re
+
+from pypdf import PdfReader
+from reportlab.pdfgen import canvas
+
+import src.pdf.wkhtml as wkhtml
+from src.core.content_cache import ContentCache
+from src.pdf.canvas_renderer import CanvasTextRenderer
+from src.pdf.generator import PDFGenerator
+from src.pdf.incremental import CanvasFragments, IncrementalBuilder, IndentedFragments
+
+
+def _project(tmp_path, count=4):
+    project = tmp_path / "projeto"
+    project.mkdir()
+    files = []
+    for i in range(count):
+        source = project / f"m{i}.py"
+        source.write_text(f"x = {i}\n" * (10 + 70 * i))
+        files.append(str(source))
+    return project, files
+
+
+def _titles(pdf_path):
+    return [os.path.basename(entry.title) for entry in PdfReader(str(pdf_path)).outline]
+
+
+def test_second_run_renders_only_changed_files(tmp_path, monkeypatch):
+    project, files = _project(tmp_path)
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+    output_pdf = tmp_path / "output.pdf"
+    PDFGenerator().generate_simple_pdf(files, str(project), str(output_pdf), incremental=True,
+                                       fragment_cache=cache, jobs=1)
+    cold_pages = len(PdfReader(str(output_pdf)).pages)
+
+    (project / "m1.py").write_text("y = 1\n")
+    rendered = []
+    original = CanvasTextRenderer.render
+    monkeypatch.setattr(CanvasTextRenderer, "render",
+                        lambda self, batch, *args, **kwargs: rendered.extend(batch) or original(self, batch, *args,
+                                                                                                **kwargs))
+    progress = []
+    PDFGenerator().generate_simple_pdf(files, str(project), str(output_pdf), lambda done, total: progress.append(done),
+                                       incremental=True, fragment_cache=cache, jobs=1)
+
+    assert rendered == [files[1]]
+    assert (cache.hits, cache.misses) == (3, 5)
+    assert progress[-1] == 4
+    assert _titles(output_pdf) == ["m0.py", "m1.py", "m2.py", "m3.py"]
+    reader = PdfReader(str(output_pdf))
+    assert len(reader.pages) == cold_pages - 1  # m1 ocupava duas páginas e agora ocupa uma
+    assert reader.get_destination_page_number(reader.outline[2]) == 2
+
+
+def test_settings_are_part_of_the_key(tmp_path):
+    project, files = _project(tmp_path, count=1)
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+
+    for font_size in (8, 10):
+        builder = IncrementalBuilder(CanvasFragments(font_size=font_size, jobs=1), cache)
+        builder.build(files, str(project), str(tmp_path / "output.pdf"))
+
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def _fake_wkhtmltopdf(html_path, pdf_path, options=None):
+    """Uma página e uma entrada de sumário por <h1>, como o wkhtmltopdf com quebra por arquivo"""
+    with open(html_path, encoding="utf-8") as f:
+        titles = re.findall(r"<h1>(.*?)</h1>", f.read())
+    pdf = canvas.Canvas(pdf_path)
+    for number, title in enumerate(titles):
+        pdf.drawString(72, 720, title)
+        pdf.bookmarkPage(f"h{number}")
+        pdf.addOutlineEntry(title, f"h{number}")
+        pdf.showPage()
+    pdf.save()
+
+
+def test_indented_fragments_are_split_per_file(tmp_path, monkeypatch):
+    project, files = _project(tmp_path, count=3)
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf)
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+    output_pdf = tmp_path / "output.pdf"
+
+    for _ in range(2):
+        failures = PDFGenerator().generate_indented_pdf(files, str(project), str(output_pdf), jobs=1, cache=False,
+                                                        incremental=True, fragment_cache=cache)
+
+    assert failures == []
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert _titles(output_pdf) == ["m0.py", "m1.py", "m2.py"]
+    assert [page.extract_text().strip().rsplit(os.sep, 1)[-1] for page in PdfReader(str(output_pdf)).pages] == \
+           ["m0.py", "m1.py", "m2.py"]
+
+
+def test_failed_indented_part_is_not_cached(tmp_path, monkeypatch):
+    project, files = _project(tmp_path, count=3)
+
+    def flaky_wkhtmltopdf(html_path, pdf_path, options=None):
+        with open(html_path, encoding="utf-8") as f:
+            if "m1.py" in f.read():
+                raise OSError("wkhtmltopdf encerrado")
+        _fake_wkhtmltopdf(html_path, pdf_path, options)
+
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", flaky_wkhtmltopdf)
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+    builder = IncrementalBuilder(IndentedFragments(jobs=1, chunk_bytes=1), cache)
+
+    failures = builder.build(files, str(project), str(tmp_path / "output.pdf"))
+
+    assert failures == [([files[1]], "wkhtmltopdf encerrado")]
+    assert [cache.get_file(builder._key(file, str(project))) is not None for file in files] == [True, False, True]
+    assert _titles(tmp_path / "output.pdf") == ["m0.py", "m1.py", "m2.py"]
+
+
+class _Recorder:
+    """Callback de progresso que guarda os relatos por arquivo e as páginas em bloco"""
+
+    def __init__(self):
+        self.files = []
+        self.pages = 0
+
+    def file_done(self, index, lines=0, pages=0):
+        self.files.append((index, lines, pages))
+
+    def add_pages(self, count):
+        self.pages += count
+
+
+class _ReversedFragments(CanvasFragments):
+    """Entrega os arquivos concluídos fora de ordem, como partes paralelas que terminam antes"""
+
+    def render(self, files, path, temp_dir, progress_callback=None):
+        recorder = _Recorder()
+        result = super().render(files, path, temp_dir, recorder)
+        for report in reversed(recorder.files):
+            progress_callback.file_done(*report)
+        return result
+
+
+def test_rendered_fragments_report_their_own_files(tmp_path):
+    project, files = _project(tmp_path)
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+    builder = IncrementalBuilder(_ReversedFragments(jobs=1), cache)
+    builder.build(files, str(project), str(tmp_path / "output.pdf"))
+    (project / "m1.py").write_text("y = 1\n")
+    (project / "m3.py").write_text("y = 3\n" * 200)
+
+    recorder = _Recorder()
+    builder.build(files, str(project), str(tmp_path / "output.pdf"), recorder)
+
+    reader = PdfReader(str(tmp_path / "output.pdf"))
+    m3_pages = len(reader.pages) - reader.get_destination_page_number(reader.outline[3])
+    assert [index for index, _, _ in recorder.files] == [0, 2, 3, 1]
+    assert recorder.files[2:] == [(3, 200, m3_pages), (1, 1, 1)]
+    assert m3_pages > 1
+
+
+def test_indented_fragments_report_pages(tmp_path, monkeypatch):
+    project, files = _project(tmp_path, count=3)
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf)
+    builder = IncrementalBuilder(IndentedFragments(jobs=1, chunk_bytes=1),
+                                 ContentCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024))
+
+    recorder = _Recorder()
+    builder.build(files, str(project), str(tmp_path / "output.pdf"), recorder)
+
+    assert sorted(index for index, _, _ in recorder.files) == [0, 1, 2]
+    assert recorder.pages == 3
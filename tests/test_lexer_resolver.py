@@ -0,0 +1,34 @@
+import pytest
+from pygments.lexers import BatchLexer, JavaLexer, XmlLexer
+from pygments.util import ClassNotFound
+
+import src.pdf.lexer_resolver as lexer_resolver
+from src.pdf.lexer_resolver import LexerResolver
+
+
+def test_supported_extensions_resolve_without_guessing(monkeypatch):
+    monkeypatch.setattr(lexer_resolver, "guess_lexer_for_filename", pytest.fail)
+    resolver = LexerResolver(stripnl=False)
+
+    java = resolver.resolve("src/Main.java", "class Main {}")
+
+    assert isinstance(java, JavaLexer)
+    assert resolver.resolve("Other.JAVA", "") is java  # Instância memoizada por extensão
+    assert isinstance(resolver.resolve("view.fxml", ""), XmlLexer)
+    assert isinstance(resolver.resolve("run.cmd", ""), BatchLexer)
+    assert java.stripnl is False
+
+
+def test_unknown_names_guess_on_bounded_prefix(monkeypatch):
+    seen = []
+    original = lexer_resolver.guess_lexer_for_filename
+    monkeypatch.setattr(lexer_resolver, "guess_lexer_for_filename",
+                        lambda name, text, **options: seen.append(text) or original(name, text, **options))
+    resolver = LexerResolver(guess_bytes=10)
+
+    lexer = resolver.resolve("Makefile", "all:\n\techo " + "x" * 100)
+
+    assert lexer.name == "Makefile"
+    assert seen == ["all:\n\techo"]
+    with pytest.raises(ClassNotFound):
+        resolver.resolve("data.unknownext", "???")
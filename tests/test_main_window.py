@@ -20,6 +20,7 @@ def test_generate_pdf(mock_generate_simple_pdf, mock_asksaveasfilename):
     main_window.selected_files = ["/fake/path/file.py"]
     main_window.project_path = "/fake/path"
     main_window._generate_pdf_with_format("texto_simples")
+    main_window.job.wait(timeout=5)  # A geração roda em uma thread de trabalho
 
     mock_generate_simple_pdf.assert_called_once()
     root.destroy()
@@ -0,0 +1,48 @@
+from pypdf import PdfReader
+
+from src.pdf.canvas_renderer import CanvasTextRenderer
+from src.pdf.parallel import render_simple_parallel, shard_by_size, should_render_in_parallel
+
+
+def test_shard_by_size_keeps_order_and_balances_bytes():
+    files = ["a", "b", "c", "d", "e", "f"]
+    sizes = [100, 1, 1, 50, 50, 1]
+
+    shards = shard_by_size(files, sizes, 3)
+
+    assert [file for shard in shards for file in shard] == files
+    assert shards[0] == ["a"]
+    assert len(shards) <= 3
+    assert shard_by_size(files, [0] * 6, 2)[0]  # Sem partes vazias
+
+
+def test_small_inputs_are_rendered_in_process():
+    assert not should_render_in_parallel([10, 10], jobs=1, min_bytes=0)
+    assert not should_render_in_parallel([10], jobs=4, min_bytes=0)
+    assert not should_render_in_parallel([10, 10], jobs=4, min_bytes=1024)
+    assert should_render_in_parallel([10, 10], jobs=4, min_bytes=0)
+
+
+def test_parallel_render_merges_parts_in_order(tmp_path):
+    files = []
+    for i in range(6):
+        file = tmp_path / f"file_{i}.py"
+        file.write_text(f"x = {i}\n" * (20 + i * 30))
+        files.append(str(file))
+    parallel_pdf = tmp_path / "parallel.pdf"
+    serial_pdf = tmp_path / "serial.pdf"
+    progress = []
+
+    render_simple_parallel(
+        files, str(tmp_path), str(parallel_pdf),
+        lambda current, total: progress.append((current, total)), jobs=2, min_bytes=0
+    )
+    CanvasTextRenderer().render(files, str(tmp_path), str(serial_pdf))
+
+    merged = PdfReader(str(parallel_pdf))
+    serial = PdfReader(str(serial_pdf))
+    titles = [entry.title for entry in merged.outline]
+    assert titles == [entry.title for entry in serial.outline]
+    assert [title.rsplit("_", 1)[-1] for title in titles] == [f"{i}.py" for i in range(6)]
+    assert len(merged.pages) >= len(serial.pages)
+    assert progress[-1] == (6, 6)
@@ -1,3 +1,10 @@
+import io
+import os
+
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import guess_lexer_for_filename
+
 from src.pdf.generator import PDFGenerator
 
 
@@ -28,3 +35,65 @@ def test_generate_indented_pdf(tmp_path):
     # Verificar resultados
     assert output_pdf.exists()
     assert output_pdf.stat().st_size > 0
+
+def test_generate_simple_pdf_engines_produce_pdf(tmp_path):
+    # Configuração inicial: arquivo com linha longa e tabulação
+    pdf_generator = PDFGenerator()
+    source_file = tmp_path / "example.py"
+    source_file.write_text("def f():\n\treturn '" + "x" * 500 + "'\n")
+
+    for engine in ("canvas", "platypus"):
+        output_pdf = tmp_path / f"output_{engine}.pdf"
+        pdf_generator.generate_simple_pdf([str(source_file)], str(tmp_path), str(output_pdf), engine=engine)
+
+        # Verificar resultados
+        assert output_pdf.read_bytes().startswith(b"%PDF")
+
+def test_platypus_streaming_matches_list_build(tmp_path):
+    # Configuração inicial: arquivos suficientes para várias páginas
+    pdf_generator = PDFGenerator()
+    files = []
+    for i in range(3):
+        source_file = tmp_path / f"module{i}.py"
+        source_file.write_text("valor = {'chave': [1, 2, 3]}  # <comentario>\n" * 120)
+        files.append(str(source_file))
+
+    page_counts = {}
+    for streaming in (False, True):
+        output_pdf = tmp_path / f"output_{streaming}.pdf"
+        progress = []
+        pdf_generator.generate_simple_pdf(
+            files, str(tmp_path), str(output_pdf),
+            lambda current, total: progress.append(current),
+            engine="platypus", streaming=streaming
+        )
+        page_counts[streaming] = output_pdf.read_bytes().count(b"/Type /Page\n")
+        assert progress == [1, 2, 3]
+
+    # Verificar resultados
+    assert page_counts[True] == page_counts[False] > 1
+
+def test_indented_html_is_streamed_with_single_stylesheet(tmp_path):
+    # Configuração inicial: um arquivo válido e um ilegível
+    source_file = tmp_path / "example.py"
+    source_file.write_text("print('Olá')\n")
+    missing_file = tmp_path / "missing.py"
+    stream = io.StringIO()
+
+    # Executar método
+    PDFGenerator.write_indented_html(stream, [str(source_file), str(missing_file)], str(tmp_path), jobs=1)
+
+    # Verificar resultados: mesmo corpo que a montagem em memória produzia
+    code = source_file.read_text()
+    expected_body = (
+        f"<h1>Arquivo: {os.path.join(tmp_path.name, 'example.py')}</h1>\n"
+        + highlight(code, guess_lexer_for_filename(str(source_file), code),
+                    HtmlFormatter(style='colorful', cssclass='custom-code-style'))
+        + f"<h1>Arquivo: {os.path.join(tmp_path.name, 'missing.py')}</h1>\n"
+        + f"<p>Erro ao processar {os.path.join(tmp_path.name, 'missing.py')}: "
+    )
+    document = stream.getvalue()
+    assert document.count("<style>") == 2
+    assert document.count(".custom-code-style .k {") == 1
+    assert expected_body in document
+    assert document.endswith("</body>\n</html>\n")
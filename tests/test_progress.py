@@ -0,0 +1,85 @@
+from src.core.progress import STAGE_DONE, STAGE_MERGING, ProgressTracker
+from src.pdf.canvas_renderer import CanvasTextRenderer
+from src.pdf.parallel import render_simple_parallel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_progress_is_weighted_by_bytes():
+    snapshots = []
+    clock = FakeClock()
+    tracker = ProgressTracker(["grande", "a", "b"], snapshots.append, sizes=[20 * 1024 * 1024, 10, 10],
+                              min_interval=0, clock=clock)
+
+    clock.now = 4.0
+    tracker.file_done(0, lines=1000, pages=10)
+
+    snapshot = snapshots[-1]
+    assert snapshot.files_done == 1 and snapshot.fraction > 0.99
+    assert snapshot.mb_per_second == 5.0 and snapshot.lines_per_second == 250.0
+    assert 0 < snapshot.eta < 0.001
+
+
+def test_updates_are_rate_limited():
+    snapshots = []
+    clock = FakeClock()
+    tracker = ProgressTracker([str(i) for i in range(1000)], snapshots.append, sizes=[1] * 1000,
+                              min_interval=0.1, clock=clock)
+
+    for index in range(999):
+        clock.now += 0.0001  # ~0.1 s no total: no máximo duas emissões
+        tracker.file_done(index)
+    assert len(snapshots) <= 2
+    tracker.file_done(999)  # O último arquivo é sempre emitido
+    tracker.set_stage(STAGE_MERGING)
+    tracker.finish()
+
+    assert snapshots[-3].files_done == 1000
+    assert [s.stage for s in snapshots[-2:]] == [STAGE_MERGING, STAGE_DONE]
+
+
+def test_plain_callback_contract_marks_files_in_order():
+    snapshots = []
+    tracker = ProgressTracker(["a", "b", "c"], snapshots.append, sizes=[100, 200, 700], min_interval=0)
+
+    tracker(2, 3)
+
+    assert snapshots[-1].bytes_done == 300 and snapshots[-1].fraction == 0.3
+
+
+def _files(tmp_path, count, lines):
+    files = []
+    for i in range(count):
+        file = tmp_path / f"file_{i}.py"
+        file.write_text("x = 1\n" * lines)
+        files.append(str(file))
+    return files
+
+
+def test_renderers_report_lines_and_pages(tmp_path):
+    files = _files(tmp_path, 3, 200)
+    snapshots = []
+    tracker = ProgressTracker(files, snapshots.append, min_interval=0)
+
+    CanvasTextRenderer().render(files, str(tmp_path), str(tmp_path / "output.pdf"), tracker)
+
+    assert snapshots[-1].lines == 600
+    assert snapshots[-1].pages >= 5  # ~75 linhas por página
+
+
+def test_parallel_render_reports_each_file_by_index(tmp_path):
+    files = _files(tmp_path, 8, 30)
+    snapshots = []
+    tracker = ProgressTracker(files, snapshots.append, min_interval=0)
+
+    render_simple_parallel(files, str(tmp_path), str(tmp_path / "output.pdf"), tracker, jobs=2, min_bytes=0)
+
+    final = [s for s in snapshots if s.files_done == len(files)][0]
+    assert final.bytes_done == final.bytes_total and final.lines == 8 * 30
+    assert snapshots[-1].stage == STAGE_MERGING
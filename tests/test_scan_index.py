@@ -0,0 +1,93 @@
+import os
+import time
+
+from src.core.scan_index import ScanIndex
+from src.core.scanner import DirectoryScanner
+
+
+def _age_tree(base):
+    # Evita que o índice descarte mtimes recentes demais
+    past = time.time() - 60
+    for root, dirs, _ in os.walk(base):
+        for folder in dirs:
+            os.utime(os.path.join(root, folder), (past, past))
+    os.utime(base, (past, past))
+
+
+def _scan(base, index):
+    scanner = DirectoryScanner(
+        is_supported_file=lambda name: name.endswith(".py"),
+        is_ignored_folder=lambda name: name == "__pycache__",
+        max_workers=2,
+        index=index
+    )
+    result = scanner.scan(str(base))
+    index.save()
+    return result
+
+
+def _project(tmp_path):
+    project = tmp_path / "project"
+    (project / "pkg").mkdir(parents=True)
+    (project / "main.py").write_text("print('main')")
+    (project / "pkg" / "module.py").write_text("print('module')")
+    _age_tree(project)
+    return project
+
+
+def test_warm_index_reuses_unchanged_directories(tmp_path):
+    project = _project(tmp_path)
+    index_dir = str(tmp_path / "indexes")
+
+    cold = _scan(project, ScanIndex(str(project), index_dir))
+    warm_index = ScanIndex(str(project), index_dir)
+    warm = _scan(project, warm_index)
+
+    assert cold == warm
+    assert warm_index.hits == 2
+    assert warm_index.misses == 0
+
+
+def test_changed_directory_is_listed_again(tmp_path):
+    project = _project(tmp_path)
+    index_dir = str(tmp_path / "indexes")
+    _scan(project, ScanIndex(str(project), index_dir))
+
+    (project / "pkg" / "new.py").write_text("print('novo')")
+    past = time.time() - 30  # mtime diferente do registrado no índice
+    os.utime(project / "pkg", (past, past))
+
+    index = ScanIndex(str(project), index_dir)
+    regular_files, _ = _scan(project, index)
+
+    assert str(project / "pkg" / "new.py") in {path for path, _ in regular_files}
+    assert index.hits == 1
+    assert index.misses == 1
+
+
+def test_invalidate_forces_full_rescan(tmp_path):
+    project = _project(tmp_path)
+    index_dir = str(tmp_path / "indexes")
+    _scan(project, ScanIndex(str(project), index_dir))
+
+    index = ScanIndex(str(project), index_dir)
+    index.invalidate()
+    _scan(project, index)
+
+    assert index.hits == 0
+    assert index.misses == 2
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    index_dir = tmp_path / "indexes"
+    index_dir.mkdir()
+    old_index = index_dir / "old.sqlite"
+    new_index = index_dir / "new.sqlite"
+    old_index.write_bytes(b"x" * 100)
+    new_index.write_bytes(b"x" * 100)
+    os.utime(old_index, (1, 1))
+
+    ScanIndex.evict(str(index_dir), max_bytes=150)
+
+    assert not old_index.exists()
+    assert new_index.exists()
@@ -0,0 +1,72 @@
+import os
+
+from src.core.scanner import DirectoryScanner
+
+
+def _create_tree(base):
+    # Estrutura com subpastas aninhadas, uma pasta ignorada e arquivos diversos
+    for folder in ("b", "a/c", "a/d", "node_modules/pkg"):
+        (base / folder).mkdir(parents=True, exist_ok=True)
+    for file in ("z.py", "a/x.py", "a/c/y.java", "a/d/notes.md", "b/w.js",
+                 "node_modules/pkg/index.js"):
+        (base / file).write_text("conteudo")
+
+
+def _scanner(**kwargs):
+    return DirectoryScanner(
+        is_supported_file=lambda name: name.endswith((".py", ".java", ".js")),
+        is_ignored_folder=lambda name: name == "node_modules",
+        **kwargs
+    )
+
+
+def test_scan_matches_os_walk(tmp_path):
+    _create_tree(tmp_path)
+
+    regular_files, ignored_items = _scanner(max_workers=4).scan(str(tmp_path))
+
+    expected_files = {
+        os.path.join(root, file)
+        for root, dirs, files in os.walk(tmp_path)
+        if "node_modules" not in root
+        for file in files if not file.endswith(".md")
+    }
+    assert {path for path, _ in regular_files} == expected_files
+    assert all(selected for _, selected in regular_files)
+    assert {path for path, _ in ignored_items} == {
+        str(tmp_path / "node_modules"),
+        str(tmp_path / "a" / "d" / "notes.md"),
+    }
+    assert not any(selected for _, selected in ignored_items)
+
+
+def test_deterministic_order_is_stable_preorder(tmp_path):
+    _create_tree(tmp_path)
+
+    serial = _scanner(max_workers=1).scan(str(tmp_path))
+    parallel = _scanner(max_workers=8).scan(str(tmp_path))
+
+    assert serial == parallel
+    assert [os.path.relpath(path, tmp_path) for path, _ in serial[0]] == [
+        "z.py",
+        os.path.join("a", "x.py"),
+        os.path.join("a", "c", "y.java"),
+        os.path.join("b", "w.js"),
+    ]
+
+
+def test_unordered_mode_returns_same_entries(tmp_path):
+    _create_tree(tmp_path)
+
+    ordered = _scanner(max_workers=4).scan(str(tmp_path))
+    unordered = _scanner(max_workers=4, deterministic=False).scan(str(tmp_path))
+
+    assert sorted(ordered[0]) == sorted(unordered[0])
+    assert sorted(ordered[1]) == sorted(unordered[1])
+
+
+def test_missing_directory_returns_empty_lists(tmp_path):
+    regular_files, ignored_items = _scanner().scan(str(tmp_path / "inexistente"))
+
+    assert regular_files == []
+    assert ignored_items == []
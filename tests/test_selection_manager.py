@@ -0,0 +1,86 @@
+from src.core.selection_manager import FileSelectionManager
+
+
+def _tree():
+    manager = FileSelectionManager()
+    manager.register_item("src", "proj")
+    manager.register_item("src/a.py", "src", is_selected=True)
+    manager.register_item("src/b.py", "src", is_selected=False)
+    manager.register_item("src/pkg", "src")
+    manager.register_item("src/pkg/c.py", "src/pkg", is_selected=True)
+    manager.register_item("main.py", "proj", is_selected=True)
+    manager.recompute_folder_states()
+    return manager
+
+
+def test_initial_states_are_aggregated_once():
+    manager = _tree()
+
+    assert manager.get_state("src/pkg").is_selected
+    assert manager.get_state("src").is_partial and not manager.get_state("src").is_selected
+    assert manager.get_state("proj").is_partial
+
+
+def test_folder_toggle_propagates_down_and_up():
+    manager = _tree()
+
+    manager.update_selection("src", True)
+    assert manager.get_state("src/b.py").is_selected
+    assert manager.get_state("proj").is_selected
+
+    manager.update_selection("src/pkg/c.py", False)
+    assert not manager.get_state("src/pkg").is_selected
+    assert manager.get_state("src").is_partial
+    assert manager.get_state("proj").is_partial  # Subpasta parcial também deixa o avô parcial
+
+
+def test_selected_items_keeps_the_given_order():
+    manager = _tree()
+
+    assert manager.selected_items(["main.py", "src/b.py", "src/a.py", "desconhecido"]) == ["main.py", "src/a.py"]
+
+
+def test_update_many_matches_sequential_updates():
+    changes = [("src", True), ("src/pkg/c.py", False), ("main.py", False), ("src/b.py", False), ("src", True)]
+    batched, sequential = _tree(), _tree()
+
+    batched.update_many(changes)
+    for path, is_selected in changes:
+        sequential.update_selection(path, is_selected)
+
+    for path in ("proj", "src", "src/pkg", "src/a.py", "src/b.py", "src/pkg/c.py", "main.py"):
+        assert batched.get_state(path).is_selected == sequential.get_state(path).is_selected
+        assert batched.get_state(path).is_partial == sequential.get_state(path).is_partial
+    assert batched.get_state("src").is_selected and batched.get_state("proj").is_partial
+
+
+def test_counters_follow_leaf_toggles_in_a_large_tree():
+    manager = FileSelectionManager()
+    for folder in range(20):
+        manager.register_item(f"root/d{folder}", "root")
+        for index in range(50):
+            manager.register_item(f"root/d{folder}/f{index}", f"root/d{folder}", is_selected=True)
+    manager.recompute_folder_states()
+    assert manager.get_state("root").is_selected
+
+    manager.update_selection("root/d3/f7", False)
+    assert manager.get_state("root/d3").is_partial and manager.get_state("root").is_partial
+
+    manager.update_selection("root/d3/f7", True)
+    assert manager.get_state("root").is_selected and not manager.get_state("root").is_partial
+
+    manager.update_selection("root", False)
+    manager.update_many((f"root/d{folder}/f0", True) for folder in range(20))
+    assert manager.get_state("root").is_partial
+    assert len(manager.selected_items(f"root/d{folder}/f{index}" for folder in range(20) for index in range(50))) == 20
+
+
+def test_registering_after_a_query_keeps_the_current_selection():
+    manager = _tree()
+    manager.update_selection("src", False)
+
+    manager.register_item("src/pkg/d.py", "src/pkg", is_selected=True)
+
+    assert not manager.get_state("src/a.py").is_selected
+    assert manager.get_state("src/pkg").is_partial and manager.get_state("src").is_partial
+    assert sorted(manager.selected_files()) == ["main.py", "src/pkg/d.py"]
@@ -0,0 +1,62 @@
+from src.core.file_tree import FileTree
+from src.core.scanner import DirectoryListing
+from src.core.selection_model import SelectionModel
+
+
+def _tree():
+    return FileTree.from_listings('/p', [
+        DirectoryListing('/p', files=[('/p/main.py', True)], ignored=[('/p/node_modules', False)],
+                         ignored_dirs=['/p/node_modules'], subdirs=['/p/src', '/p/docs']),
+        DirectoryListing('/p/src', files=[('/p/src/a.py', True), ('/p/src/b.py', True)], subdirs=['/p/src/pkg']),
+        DirectoryListing('/p/src/pkg', files=[('/p/src/pkg/c.py', True)], ignored=[('/p/src/pkg/logo.png', False)]),
+        DirectoryListing('/p/docs'),  # Sem arquivos: não aparece na árvore
+    ])
+
+
+def _model():
+    tree = _tree()
+    skip_reasons = {'/p/src/b.py': 'binário'}
+    next(node for node in tree.iter_files() if node.path == '/p/src/b.py').selected = False
+    model = SelectionModel(skip_reasons)
+    model.load(tree)
+    return model
+
+
+def _index(model, path):
+    return next(record.index for record in model.records if record.path == path)
+
+
+def test_records_follow_the_tree_order():
+    model = _model()
+
+    assert [record.path for record in model.records] == [
+        '/p/main.py', '/p/src', '/p/src/a.py', '/p/src/b.py', '/p/src/pkg', '/p/src/pkg/logo.png', '/p/src/pkg/c.py']
+    assert [model.records[index].name for index in model.roots] == ['main.py', 'src']
+    assert model.records[_index(model, '/p/src/b.py')].reason == 'binário'
+
+
+def test_toggles_update_the_record_and_its_ancestors():
+    model = _model()
+    b_file = _index(model, '/p/src/b.py')
+    src = _index(model, '/p/src')
+
+    assert model.state(src) == (False, True)
+    assert model.toggle(b_file)
+    assert model.state(src) == (False, True)  # logo.png continua desmarcado
+    assert model.toggle(_index(model, '/p/src/pkg/logo.png'))
+    assert model.state(src) == (True, False)
+    assert list(model.ancestors(_index(model, '/p/src/pkg/c.py'))) == [_index(model, '/p/src/pkg'), src]
+
+    assert not model.toggle(src)
+    assert model.state(_index(model, '/p/src/pkg/c.py')) == (False, False)
+
+
+def test_selected_files_come_in_tree_order_with_known_sizes():
+    model = _model()
+    model.records[_index(model, '/p/src/a.py')].size = 42
+    assert model.selected_files() == ['/p/main.py', '/p/src/a.py', '/p/src/pkg/c.py']
+    assert model.selected_files().sizes == [None, 42, None]
+
+    model.toggle(_index(model, '/p/src/pkg'))
+    model.toggle(_index(model, '/p/main.py'))
+    assert model.selected_files() == ['/p/src/a.py', '/p/src/pkg/logo.png', '/p/src/pkg/c.py']  # Pasta parcial fica toda marcada
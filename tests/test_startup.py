@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importação da janela principal sem os motores de PDF leva ~130 ms; com eles, ~330 ms
+STARTUP_BUDGET_MS = 250
+HEAVY_MODULES = ("reportlab.pdfgen", "reportlab.platypus", "pygments", "pdfkit", "pypdf")
+
+
+def _import_times(module):
+    """Tempos cumulativos (ms) de cada módulo importado, medidos com python -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+@pytest.mark.parametrize("module", ["src.ui.main_window", "src.cli"])
+def test_entry_points_do_not_import_pdf_engines(module):
+    if module == "src.ui.main_window":
+        pytest.importorskip("ttkbootstrap")
+    loaded = _import_times(module)
+
+    assert not [name for name in loaded if name.startswith(HEAVY_MODULES)]
+
+
+def test_main_window_import_fits_budget():
+    pytest.importorskip("ttkbootstrap")
+    _import_times("src.ui.main_window")  # Aquece os .pyc e o cache de disco
+    best = min(_import_times("src.ui.main_window")["src.ui.main_window"] for _ in range(3))
+
+    assert best < STARTUP_BUDGET_MS, f"importação da janela principal levou {best:.0f} ms"
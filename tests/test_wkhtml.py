@@ -0,0 +1,167 @@
+import os
+import re
+import threading
+
+import pytest
+from pypdf import PdfReader
+from reportlab.pdfgen import canvas
+
+import src.pdf.wkhtml as wkhtml
+from src.core.background_job import JobCancelled
+from src.core.progress import ProgressTracker
+from src.pdf.wkhtml import ChunkedHtmlConverter
+
+
+def _fake_wkhtmltopdf(failing, attempts):
+    """Substitui o wkhtmltopdf: uma página e uma entrada de sumário por <h1>"""
+    def from_file(html_path, pdf_path, options=None):
+        attempts.append(html_path)
+        with open(html_path, encoding="utf-8") as f:
+            document = f.read()
+        titles = re.findall(r"<h1>(.*?)</h1>", document)
+        remaining = failing.get(titles[0], 0)
+        if remaining:
+            failing[titles[0]] = remaining - 1  # Valores negativos falham sempre
+            raise IOError("wkhtmltopdf exited with non-zero code 1")
+        pdf = canvas.Canvas(pdf_path)
+        for number, title in enumerate(titles):
+            pdf.drawString(72, 720, title)
+            pdf.bookmarkPage(f"h{number}")
+            pdf.addOutlineEntry(title, f"h{number}")
+            pdf.showPage()
+        pdf.save()
+    return from_file
+
+
+def test_chunks_are_converted_retried_and_merged_in_order(tmp_path, monkeypatch):
+    files = []
+    for i in range(6):
+        source = tmp_path / f"m{i}.py"
+        source.write_text(f"x = {i}\n")
+        files.append(str(source))
+    # A parte de m2 falha uma vez (recuperada na nova tentativa); a de m4 sempre falha
+    failing = {f"Arquivo: {os.path.join(tmp_path.name, 'm2.py')}": 1,
+               f"Arquivo: {os.path.join(tmp_path.name, 'm4.py')}": -1}
+    attempts = []
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf(failing, attempts))
+    output_pdf = tmp_path / "output.pdf"
+
+    converter = ChunkedHtmlConverter(str(tmp_path), str(tmp_path), chunk_bytes=1, jobs=2, retries=1)
+    for file in files:
+        converter.add(file, '<div class="custom-code-style"><pre>x</pre></div>\n', None)
+    failures = converter.finish(str(output_pdf))
+
+    assert failures == [([files[4]], "wkhtmltopdf exited with non-zero code 1")]
+    assert len(attempts) == 6 + 1 + 1  # Uma parte por arquivo, mais as novas tentativas
+    titles = [entry.title for entry in PdfReader(str(output_pdf)).outline]
+    assert [os.path.basename(title) for title in titles] == [f"m{i}.py" for i in range(6)]
+
+
+def test_single_chunk_is_moved_without_merge(tmp_path, monkeypatch):
+    source = tmp_path / "main.py"
+    source.write_text("print(1)\n")
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf({}, []))
+    monkeypatch.setattr(wkhtml, "merge_pdfs", lambda *args: (_ for _ in ()).throw(AssertionError))
+    output_pdf = tmp_path / "output.pdf"
+
+    converter = ChunkedHtmlConverter(str(tmp_path), str(tmp_path), chunk_bytes=None, jobs=1)
+    converter.add(str(source), None, "erro de leitura")
+
+    assert converter.finish(str(output_pdf)) == []
+    assert output_pdf.read_bytes().startswith(b"%PDF")
+
+
+def test_converted_parts_report_their_pages(tmp_path, monkeypatch):
+    files = []
+    for i in range(3):
+        source = tmp_path / f"m{i}.py"
+        source.write_text(f"x = {i}\n")
+        files.append(str(source))
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf({}, []))
+    pages = []
+
+    class Recorder:
+        def add_pages(self, count):
+            pages.append(count)
+
+    converter = ChunkedHtmlConverter(str(tmp_path), str(tmp_path), chunk_bytes=None, jobs=1,
+                                     progress_callback=Recorder())
+    for file in files:
+        converter.add(file, '<div class="custom-code-style"><pre>x</pre></div>\n', None)
+    converter.finish(str(tmp_path / "output.pdf"))
+
+    assert pages == [3]
+
+
+def test_cancelling_while_converting_drops_queued_parts(tmp_path, monkeypatch):
+    files = []
+    for i in range(6):
+        source = tmp_path / f"m{i}.py"
+        source.write_text(f"x = {i}\n")
+        files.append(str(source))
+    release = threading.Event()
+    attempts = []
+    convert = _fake_wkhtmltopdf({}, attempts)
+
+    def blocking_wkhtmltopdf(html_path, pdf_path, options=None):
+        release.wait(5)
+        convert(html_path, pdf_path, options)
+
+    def cancel():
+        release.set()
+        raise JobCancelled()
+
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", blocking_wkhtmltopdf)
+    tracker = ProgressTracker(files, lambda snapshot: None, checkpoint=cancel)
+    output_pdf = tmp_path / "output.pdf"
+
+    converter = ChunkedHtmlConverter(str(tmp_path), str(tmp_path), chunk_bytes=1, jobs=1,
+                                     progress_callback=tracker)
+    for file in files:
+        converter.add(file, '<div class="custom-code-style"><pre>x</pre></div>\n', None)
+    with pytest.raises(JobCancelled):
+        converter.finish(str(output_pdf))
+
+    assert len(attempts) == 1  # Só a parte que já estava em conversão
+    assert not output_pdf.exists()
+
+
+def test_all_parts_failing_raises_before_plain_text_fallback(tmp_path, monkeypatch):
+    files = []
+    for i in range(3):
+        source = tmp_path / f"m{i}.py"
+        source.write_text(f"x = {i}\n")
+        files.append(str(source))
+    failing = {f"Arquivo: {os.path.join(tmp_path.name, f'm{i}.py')}": -1 for i in range(3)}
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf(failing, []))
+    rendered = []
+    monkeypatch.setattr(wkhtml.CanvasTextRenderer, "render", lambda self, batch, *args: rendered.extend(batch))
+
+    converter = ChunkedHtmlConverter(str(tmp_path), str(tmp_path), chunk_bytes=1, jobs=1, retries=0)
+    for file in files:
+        converter.add(file, '<div class="custom-code-style"><pre>x</pre></div>\n', None)
+    with pytest.raises(OSError):
+        converter.finish(str(tmp_path / "output.pdf"))
+
+    assert rendered == []
+
+
+def test_plain_text_fallback_uses_the_generator_settings(tmp_path, monkeypatch):
+    files = []
+    for i in range(2):
+        source = tmp_path / f"m{i}.py"
+        source.write_text(f"x = {i}\n")
+        files.append(str(source))
+    failing = {f"Arquivo: {os.path.join(tmp_path.name, 'm1.py')}": -1}
+    monkeypatch.setattr(wkhtml.pdfkit, "from_file", _fake_wkhtmltopdf(failing, []))
+    output_pdf = tmp_path / "output.pdf"
+
+    converter = ChunkedHtmlConverter(str(tmp_path), str(tmp_path), chunk_bytes=1, jobs=1, retries=0,
+                                     font_size=12, page_size=(300, 400))
+    for file in files:
+        converter.add(file, '<div class="custom-code-style"><pre>x</pre></div>\n', None)
+    failures = converter.finish(str(output_pdf))
+
+    assert [failed for failed, _ in failures] == [[files[1]]]
+    fallback_page = PdfReader(str(output_pdf)).pages[-1]
+    assert (float(fallback_page.mediabox.width), float(fallback_page.mediabox.height)) == (300, 400)